@@ -1,3 +1,5 @@
+from typing import Union
+
 from ridt.base import ComputationalSpace
 
 from ridt.config import RIDTConfig
@@ -5,6 +7,7 @@ from ridt.config import RIDTConfig
 from ridt.data import BatchDataStore
 from ridt.data import DirectoryAgent
 from ridt.data import DataStore
+from ridt.data import UncertaintyMask
 
 from .datastoreanalyser import DataStoreAnalyser
 from .resultswriter import ResultsWriter
@@ -44,6 +47,10 @@ class BatchDataStoreAnalyser:
         A dictionary of :class:`~.DataStoreAnalyser` instances for each
         :class:`~.RIDTConfig` object in :attr:`space`.
 
+    masks : :obj:`dict` [:class:`~.RIDTConfig`, :class:`~.UncertaintyMask`]
+        The uncertainty mask of each :class:`~.RIDTConfig` object in
+        :attr:`space`, if values are to be excluded.
+
     """
     def __new__(cls, *args, **kwargs):
         instance = super(BatchDataStoreAnalyser, cls).__new__(cls)
@@ -55,7 +62,8 @@ class BatchDataStoreAnalyser:
                  data_store: BatchDataStore,
                  space: ComputationalSpace,
                  outdir: str,
-                 quantity: str):
+                 quantity: str,
+                 masks: dict = None):
         """The :class:`~.BatchDataStoreAnalyser` class initialiser.
 
         Parameters
@@ -76,6 +84,11 @@ class BatchDataStoreAnalyser:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        masks : :obj:`dict` [:class:`~.RIDTConfig`, :class:`~.UncertaintyMask`], optional
+            The uncertainty masks to use and add to. Passing the same
+            dictionary to the analysers of several quantities lets them share
+            their masks. By default the masks are held by this instance.
+
         """
         self.settings = settings
         self.space = space
@@ -84,6 +97,7 @@ class BatchDataStoreAnalyser:
         self.dir_agent = DirectoryAgent(outdir, self.space.shape)
         self.data_store = data_store
         self.results = dict()
+        self.masks = dict() if masks is None else masks
         print(f"Analysing {self.quantity}...")
         self.analyse()
     
@@ -101,7 +115,8 @@ class BatchDataStoreAnalyser:
         """
         if self.space.zero:
             store = self.data_store[self.settings]
-            result = DataStoreAnalyser(self.settings, store, self.quantity)
+            result = DataStoreAnalyser(self.settings, store, self.quantity,
+                                       self.mask(self.settings))
             self.results[self.settings] = result
             ResultsWriter(self.settings, result, self.dir_agent, self.quantity)
         else:
@@ -109,7 +124,29 @@ class BatchDataStoreAnalyser:
                 idx = self.space.linear_index(setting)
                 print(f"Analysing computational space element {idx + 1}/{len(self.space)}")
                 self.dir_agent.create_root_dir(idx)
-                result = DataStoreAnalyser(setting, store, self.quantity)
+                result = DataStoreAnalyser(setting, store, self.quantity,
+                                           self.mask(setting))
                 self.results[setting] = result
                 ResultsWriter(setting, result, self.dir_agent, self.quantity)
             BatchResultsWriter(self.settings, self.space, self.results, self.outdir, self.quantity)
+
+    def mask(self, setting: RIDTConfig) -> Union[UncertaintyMask, None]:
+        """Returns the uncertainty mask of a computational space element.
+
+        Parameters
+        ----------
+        setting : :class:`~.RIDTConfig`
+            The settings of the element.
+
+        Returns
+        -------
+        :obj:`Union`[:class:`~.UncertaintyMask`, None]
+            The mask held in :attr:`masks`, which is created if required, or
+            None if values are not to be excluded.
+
+        """
+        if not setting.models.eddy_diffusion.analysis.exclude_uncertain_values:
+            return None
+        if setting not in self.masks:
+            self.masks[setting] = UncertaintyMask(setting)
+        return self.masks[setting]
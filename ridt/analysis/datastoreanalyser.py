@@ -1,7 +1,9 @@
-from copy import deepcopy
-
+from numpy import argmax
+from numpy import empty
+from numpy import errstate
 from numpy import nanstd
 from numpy import nanmean
+from numpy import prod
 
 from ridt.config import RIDTConfig
 from ridt.config import Units
@@ -17,6 +19,9 @@ from .resultcontainers import PercentExceedance
 from .resultcontainers import MaxPercentExceedance
 
 
+CHUNK_SIZE = 1 << 22
+
+
 class DataStoreAnalyser:
     """The Data Store Analyser class.
 
@@ -60,7 +65,8 @@ class DataStoreAnalyser:
     def __init__(self,
                  setting: RIDTConfig,
                  data_store: DataStore,
-                 quantity: str):
+                 quantity: str,
+                 mask: UncertaintyMask = None):
         """The :class`~.DataStoreAnalyser` class initialiser.
         
         Calls the :meth:`~.DataStoreAnalyser.evaluate` method.
@@ -79,6 +85,11 @@ class DataStoreAnalyser:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        mask : :class:`~.UncertaintyMask`, optional
+            The uncertainty mask for :attr:`setting`. Passing the same mask to
+            the analysers of several quantities lets them share its regions.
+            By default a new mask is created if values are to be excluded.
+
        """
 
         self.setting = setting
@@ -87,9 +98,10 @@ class DataStoreAnalyser:
         self.quantity = quantity
         self.thresholds = self.threshold_converter()
         self.data_store = data_store
+        self._well_mixed_curve = None
 
         if self.setting.models.eddy_diffusion.analysis.exclude_uncertain_values:
-            self.exclude_uncertain_values()
+            self.exclude_uncertain_values(mask)
 
         self.maximum = list()
         self.exceedance = list()
@@ -149,38 +161,75 @@ class DataStoreAnalyser:
                 index, value = self.data_store.maximum(geometry, id)
                 cargs = (geometry, id, self.quantity)
                 self.maximum.append(Maximum(self.setting, *cargs, index, value))
-        for t in self.thresholds:
+        analytics = dict()
+        for geometry in self.geometries:
+            for id in getattr(self.data_store, geometry):
+                analytics[geometry, id] = self.data_store.threshold_analytics(
+                    geometry, id, self.thresholds, p)
+        for i, t in enumerate(self.thresholds):
             for geometry in self.geometries:
                 for id in getattr(self.data_store, geometry):
                     cargs = (geometry, id)
-                    index = self.data_store.exceeds(*cargs, t)
+                    exceeds, percentage, maximum = analytics[cargs]
                     self.exceedance.append(
-                        Exceedance(self.setting, *cargs, self.quantity, index, t))
-                    index = self.data_store.percentage_exceeds(*cargs, t, p)
+                        Exceedance(self.setting, *cargs, self.quantity, exceeds[i], t))
                     self.percent_exceedance.append(
-                        PercentExceedance(self.setting, *cargs, self.quantity, index, t, p))
-                    index, value = self.data_store.percentage_exceeds_max(geometry, id, t)
+                        PercentExceedance(self.setting, *cargs, self.quantity, percentage[i], t, p))
+                    index, value = maximum[i]
                     self.max_percent_exceedance.append(
                         MaxPercentExceedance(self.setting, *cargs, self.quantity, value, index, t))
     
-    def exclude_uncertain_values(self):
-        """Sets values within 2m of source to nan.
+    def exclude_uncertain_values(self, mask: UncertaintyMask = None):
+        """Excludes values within 2m of source from the analysis.
+
+        Replaces :attr:`data_store` with a view of the same grids, in which
+        values within 2m of any source are masked. No grid is copied.
 
-        Iterates through all domains in data store and sets values within 
-        2m of any source to nan.
+        Parameters
+        ----------
+        mask : :class:`~.UncertaintyMask`, optional
+            The uncertainty mask for :attr:`setting`. By default a new mask is
+            created.
 
         Returns
         -------
         None
 
         """
-        new_data_store = deepcopy(self.data_store)
-        um = UncertaintyMask(self.setting)
+        data_store = self.data_store.view()
+        um = UncertaintyMask(self.setting) if mask is None else mask
         for geometry in self.geometries:
-            for id in getattr(new_data_store, geometry):
-                data = um.mask(geometry, id, new_data_store.get(geometry, id))
-                new_data_store.add(geometry, id, data)
-        self.data_store = new_data_store
+            for id in getattr(data_store, geometry):
+                data_store.exclude(geometry, id, um.exclusion(geometry, id))
+        self.data_store = data_store
+
+    @property
+    def well_mixed_curve(self):
+        """Evaluates the normalised standard deviation of the full domain.
+
+        The standard deviation over the domain divided by its mean is reduced
+        for all times at once, a chunk of time steps at a time so that memory
+        mapped stores are never loaded whole. The curve is evaluated once and
+        then cached.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The normalised standard deviation at each time.
+
+        """
+        if self._well_mixed_curve is None:
+            data = self.data_store.get("domain", "domain")
+            step = max(1, CHUNK_SIZE // max(1, prod(data.shape[1:])))
+            rv = empty(data.shape[0])
+            with errstate(divide="ignore", invalid="ignore"):
+                for start in range(0, data.shape[0], step):
+                    time = slice(start, start + step)
+                    chunk = self.data_store.at("domain", "domain", time)
+                    axes = tuple(range(1, chunk.ndim))
+                    rv[time] = nanstd(chunk, axis=axes) / nanmean(chunk, axis=axes)
+            self._well_mixed_curve = rv
+        return self._well_mixed_curve
 
     @property
     def time_to_well_mixed(self):
@@ -196,9 +245,7 @@ class DataStoreAnalyser:
             is returned, else :obj:`None`.
 
         """
-        for i in range(self.setting.time_samples):
-            d = self.data_store.get("domain", "domain")[i, :, :, :]
-            value = nanstd(d) / nanmean(d)
-            if value <= 0.1:
-                return self.domain.time[i]
+        mixed = self.well_mixed_curve <= 0.1
+        if mixed.any():
+            return self.domain.time[argmax(mixed)]
         return None
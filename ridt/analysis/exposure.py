@@ -1,6 +1,7 @@
 from typing import Union
 
-from scipy.integrate import cumtrapz
+from numpy import add
+from numpy import empty
 from numpy import ndarray
 
 from ridt.config import RIDTConfig
@@ -60,21 +61,36 @@ class Exposure:
         locations = self.setting.models.eddy_diffusion.monitor_locations
         return [g for g, e in locations.evaluate.items() if e]
 
-    def compute(self, data: ndarray) -> ndarray:
+    def compute(self, data: ndarray, out: ndarray = None) -> ndarray:
         """Cumulative integral over the time axis.
 
+        The trapezoidal rule is accumulated one time step at a time into
+        :obj:`out`, so no temporary larger than a single time step is
+        allocated. The result is identical to
+        :func:`~scipy.integrate.cumtrapz` with an initial value of zero.
+
         Parameters
         ----------
         data : :class:`~numpy.ndarray`
             The data array to integrate over.
 
+        out : :class:`~numpy.ndarray`, optional
+            The array to write the exposures into, which may be memory mapped.
+            If not given, a new array is allocated.
+
         Returns
         -------
         :class:`~numpy.ndarray`
             The integrated array containing exposures.
 
         """
-        return cumtrapz(data, dx=self.delta_t, axis=0, initial=0)
+        if out is None:
+            out = empty(data.shape)
+        out[:1] = 0.0
+        for time in range(1, data.shape[0]):
+            step = self.delta_t * (data[time:time + 1] + data[time - 1:time]) / 2.0
+            add(out[time - 1:time], step, out=out[time:time + 1])
+        return out
 
     def evaluate(self, data_store: Union[DataStore, BatchDataStore])\
             -> Union[DataStore, BatchDataStore]:
@@ -98,10 +114,10 @@ class Exposure:
 
         """
         if isinstance(data_store, DataStore):
-            rv = DataStore()
+            rv = data_store.like("exposure")
             for geometry in self.geometries:
                 for name, data in getattr(data_store, geometry).items():
-                    rv.add(geometry, name, self.compute(data))
+                    self.compute(data, rv.allocate(geometry, name, data.shape))
             return rv
         elif isinstance(data_store, BatchDataStore):
             rv = BatchDataStore()
@@ -88,6 +88,7 @@ class ResultsWriter:
         self.domain = Domain(setting)
         if quantity == "concentration":
             self.summary()
+            self.well_mixed()
         self.maximum()
         self.exceedance_analysis()
         self.extrema()
@@ -345,6 +346,25 @@ class ResultsWriter:
         f.write(summary(self.setting))
         f.close()
 
+    def well_mixed(self):
+        """Writes the normalised standard deviation of the domain to disk.
+
+        Writes the curve that :attr:`~.DataStoreAnalyser.time_to_well_mixed`
+        is found from, at every time, to a csv file in the domain analysis
+        directory.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self.setting.models.eddy_diffusion.monitor_locations.evaluate["domain"]:
+            return
+        self.dir_agent.create_analysis_dir("domain", self.quantity)
+        path = join(self.dir_agent.adir, "domain_well_mixed.csv")
+        header = [f"time ({self.units.time})", "normalised standard deviation"]
+        self.write(path, header, zip(self.domain.time, self.analysis.well_mixed_curve))
+
     @property
     def characteristic_diffusion_time(self):
         """:obj:`dict` [:obj:`str`, :obj:`float`] : the characteristic 
@@ -1,10 +1,12 @@
 import builtins
 import operator
-import itertools
 
+from copy import copy
 from copy import deepcopy
 
+from collections import deque
 from collections.abc import Iterable
+from collections.abc import Sequence
 
 from typing import Union
 from typing import TypeVar
@@ -21,6 +23,9 @@ from functools import reduce
 from numpy import linspace
 from numpy import prod
 from numpy import unravel_index
+from numpy import ravel_multi_index
+
+from weakref import WeakValueDictionary
 
 from .exceptions import Error
 
@@ -39,6 +44,9 @@ T = TypeVar("T")
 StringDict = Dict[str, str]
 StringList = List[str]
 
+PRIMITIVE = [getattr(builtins, d) for d in dir(builtins) if
+             isinstance(getattr(builtins, d), type)]
+
 
 class Settings:
     """A base class for building python objects out of :obj:`dict` object.
@@ -110,8 +118,7 @@ class Settings:
         """:obj:`list`(:obj:`type`) : a list of built in types.
 
         """
-        return [getattr(builtins, d) for d in dir(builtins) if
-                isinstance(getattr(builtins, d), type)]
+        return PRIMITIVE
 
     def distribute(self, values: dict):
         """The method which loops over the attribute/type pairs in the derived
@@ -211,7 +218,20 @@ class Settings:
         pass
 
     def __hash__(self):
-        return hash(str(self.__source__))
+        # The source dict is not modified after construction, so the hash of
+        # its string form is computed once and kept.
+        try:
+            return object.__getattribute__(self, "__key__")
+        except AttributeError:
+            self.__key__ = hash(str(self.__source__))
+            return self.__key__
+
+    def __getstate__(self):
+        # String hashes differ between processes, so the cached hash is not
+        # pickled.
+        state = self.__dict__.copy()
+        state.pop("__key__", None)
+        return state
     
     def __eq__(self, other):
         if other.__hash__() == self.__hash__():
@@ -961,6 +981,13 @@ class ComputationalSpace:
         If when searching the settings object for ranges, a setting with the
         same name as a key in :attr:`restrict` is found, only subsettings with
         name equal to the corresponding key will be searched.
+
+    space : :class:`~.SpaceElements`
+        The elements of the space, in row major order, which are built on
+        demand.
+
+    positions : :obj:`List`[:obj:`dict`]
+        For each axis, the position of each of its values along the axis.
     
     """
 
@@ -986,7 +1013,8 @@ class ComputationalSpace:
         self.values = list()
         self.matched = dict()
         self.unmatched = list()
-        self.space = list()
+        self.space = SpaceElements(self)
+        self.positions = list()
         self.explore(self.setting, list())
         self.build_space()
 
@@ -1033,24 +1061,99 @@ class ComputationalSpace:
                 self.explore(item, new_path, new_restrict)
    
     def build_space(self):
+        """Collects the axes of the space.
+
+        The elements themselves are not built here. Each is built from the
+        values along every axis when it is first accessed through
+        :attr:`space`.
+
+        Returns
+        -------
+        None
+
+        """
         for match, items in self.matched.items():
             self.addresses += items["addresses"]
             if len({len(i) for i in items["values"]}) != 1:
                 warnings.warn(f"ranges with match id '{match}' have unequal "
                               f"length. Zipped to shortest.")
             self.values.append(list(zip(*items["values"])))
-        for batch in itertools.product(*self.values):
-            flat_batch = list()
-            for item in batch:
-                if isinstance(item, Iterable):
-                    for subitem in item:
-                        flat_batch.append(subitem)
-                else:
-                    flat_batch.append(item)
-            rv = deepcopy(self.setting.__source__)
-            for address, value in zip(self.addresses, flat_batch):
-                self.set_by_address(rv, address, float(value))
-            self.space.append(type(self.setting)(rv))
+        for values in self.values:
+            positions = dict()
+            for position, item in enumerate(values):
+                positions.setdefault(self.flatten([item]), position)
+            self.positions.append(positions)
+
+    def flatten(self, batch) -> tuple:
+        """Flattens the values of the axes of an element into one per address.
+
+        Parameters
+        ----------
+        batch : :obj:`Iterable`
+            The value of each axis, which is a tuple for a matched axis.
+
+        Returns
+        -------
+        :obj:`tuple`[:obj:`float`]
+            The value for each address in :attr:`addresses`.
+
+        """
+        flat_batch = list()
+        for item in batch:
+            if isinstance(item, Iterable):
+                for subitem in item:
+                    flat_batch.append(float(subitem))
+            else:
+                flat_batch.append(float(item))
+        return tuple(flat_batch)
+
+    def source(self, index: int) -> dict:
+        """Returns the source :obj:`dict` of an element of the space.
+
+        Only the :obj:`dict` and :obj:`list` objects on the path to each
+        address are copied. Everything else is shared with the source of
+        :attr:`setting`, which is never modified.
+
+        Parameters
+        ----------
+        index : :obj:`int`
+            The linear index of the element.
+
+        Returns
+        -------
+        :obj:`dict`
+            The source of the element.
+
+        """
+        multi_index = unravel_index(index, self.shape) if self.values else ()
+        batch = [values[i] for values, i in zip(self.values, multi_index)]
+        rv = copy(self.setting.__source__)
+        copied = {id(rv)}
+        for address, value in zip(self.addresses, self.flatten(batch)):
+            node = rv
+            for key in address[:-1]:
+                if id(node[key]) not in copied:
+                    node[key] = copy(node[key])
+                    copied.add(id(node[key]))
+                node = node[key]
+            node[address[-1]] = value
+        return rv
+
+    def build(self, index: int) -> Type[Settings]:
+        """Builds an element of the space.
+
+        Parameters
+        ----------
+        index : :obj:`int`
+            The linear index of the element.
+
+        Returns
+        -------
+        :obj:`Type`[:class:`~.Settings`]
+            The settings object of the element.
+
+        """
+        return type(self.setting)(self.source(index))
 
     def __getitem__(self, indices):
         if isinstance(indices, tuple):
@@ -1084,6 +1187,10 @@ class ComputationalSpace:
         else:
             return (1,)
         
+    @property
+    def size(self) -> int:
+        return int(prod(self.shape))
+
     @property
     def zero(self) -> Union[Type[Settings], None]:
         if len(self.space) == 1:
@@ -1139,7 +1246,31 @@ class ComputationalSpace:
         return unravel_index(linear_index, self.shape)
 
     def linear_index(self, setting: Type[Settings]):
-        return self.space.index(setting)
+        # The position along each axis is found from the value at its
+        # addresses, and then checked against the source of the element at
+        # that index, without building it.
+        try:
+            multi_index = [
+                positions[self.flatten(
+                    self.get_by_address(setting.__source__, address)
+                    for address in addresses)]
+                for positions, addresses in zip(self.positions, self.axis_addresses)
+            ]
+        except (KeyError, IndexError, TypeError, ValueError):
+            raise ValueError(f"{setting} is not in the computational space")
+        if multi_index:
+            index = int(ravel_multi_index(multi_index, self.shape))
+        else:
+            index = 0
+        if self.source(index) != setting.__source__:
+            raise ValueError(f"{setting} is not in the computational space")
+        return index
+
+    @property
+    def axis_addresses(self) -> list:
+        rv = [[address] for address in self.unmatched]
+        rv += [items["addresses"] for items in self.matched.values()]
+        return rv
 
     def __enter__(self):
         return self
@@ -1151,6 +1282,67 @@ class ComputationalSpace:
         return len(self.space)
 
 
+class SpaceElements(Sequence):
+    """The elements of a :class:`ComputationalSpace`, built on demand.
+
+    Each element is built the first time it is accessed, and is kept for as
+    long as it is referenced elsewhere, so that the time and memory taken
+    before the first element is evaluated does not depend on the size of the
+    space. The most recently built :attr:`cache_size` elements are also held
+    in :attr:`recent`, so a space of up to that size is built once however
+    many passes are made over it. In a larger space, each pass rebuilds the
+    elements that are no longer referenced.
+
+    Attributes
+    ----------
+    space : :class:`ComputationalSpace`
+        The space the elements belong to.
+
+    elements : :class:`~weakref.WeakValueDictionary`
+        The elements currently in use, keyed by their linear index.
+
+    recent : :class:`~collections.deque`
+        The most recently built elements.
+
+    """
+
+    cache_size = 256
+
+    def __init__(self, space: ComputationalSpace):
+        """The constructor for the :class:`SpaceElements` class.
+
+        Parameters
+        ----------
+        space : :class:`ComputationalSpace`
+            The space the elements belong to.
+
+        """
+        self.space = space
+        self.elements = WeakValueDictionary()
+        self.recent = deque(maxlen=self.cache_size)
+
+    def __len__(self):
+        return self.space.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("computational space index out of range")
+        try:
+            return self.elements[index]
+        except KeyError:
+            element = self.space.build(index)
+            self.elements[index] = element
+            self.recent.append(element)
+            return element
+
+    def index(self, setting: Type[Settings], *args) -> int:
+        return self.space.linear_index(setting)
+
+
 class SettingRangeKeyError(Error):
     """The exception raised when a :class:`~.Number` instance is missing an 
     entry in a range specification.
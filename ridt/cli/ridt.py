@@ -47,7 +47,48 @@ def init():
 @ridt.command()
 @click.argument('config_file', type=click.Path(exists=True))
 @click.argument('output_dir', type=click.Path(exists=True))
-def run(config_file, output_dir):
+@click.option('-w', '--workers', type=click.IntRange(min=1), default=1,
+              help="Number of processes used to evaluate the eddy diffusion "
+                   "computational space.")
+@click.option('-t', '--threads', type=click.IntRange(min=1), default=1,
+              help="Number of threads used to evaluate the eddy diffusion "
+                   "monitor locations and sources of each element.")
+@click.option('--tile-size', type=click.IntRange(min=1), default=None,
+              help="Maximum number of cells along the longest axis of a "
+                   "monitor location evaluated at once, to bound memory.")
+@click.option('--memmap/--no-memmap', default=False,
+              help="Store eddy diffusion grids as memory mapped files in the "
+                   "output directory rather than in memory.")
+@click.option('--stream/--no-stream', default=False,
+              help="Write, plot and analyse each eddy diffusion computational "
+                   "space element as soon as it is evaluated.")
+@click.option('-p', '--plot-workers', type=click.IntRange(min=1), default=1,
+              help="Number of processes used to render the eddy diffusion "
+                   "plots.")
+@click.option('--reuse-figures/--no-reuse-figures', default=False,
+              help="Reuse one figure for each eddy diffusion monitor location, "
+                   "only redrawing the data for each time with a fixed "
+                   "layout.")
+@click.option('--frame-format', type=click.Choice(["png", "gif", "pdf"]),
+              default="png",
+              help="Format of the eddy diffusion line and plane plots: a PNG "
+                   "for each time, or a single animated GIF or multi-page PDF "
+                   "for each monitor location. GIF and PDF only apply to "
+                   "lines and planes whose 'animate' plot setting is true.")
+@click.option('--archive/--no-archive', default=False,
+              help="Write all eddy diffusion grids to a single data.npz "
+                   "archive in the output directory, rather than a numpy "
+                   "binary file for each grid.")
+@click.option('--superpose/--no-superpose', default=False,
+              help="Evaluate eddy diffusion computational space elements that "
+                   "differ only in source mass or rate together, by scaling a "
+                   "single unit strength evaluation of each source.")
+@click.option('--cache', type=click.Path(file_okay=False), default=None,
+              help="Directory of cached eddy diffusion grids, keyed by the "
+                   "settings they depend on. Cached grids are loaded rather "
+                   "than evaluated, and new grids are added.")
+def run(config_file, output_dir, workers, threads, tile_size, memmap, stream,
+        plot_workers, reuse_figures, frame_format, archive, superpose, cache):
     """Run diffusion model."""
 
     if not isdir(output_dir):
@@ -66,7 +107,10 @@ def run(config_file, output_dir):
         if s.well_mixed:
             WellMixedRun(s, output_dir)
         if s.eddy_diffusion:
-            EddyDiffusionRun(s, output_dir)
+            EddyDiffusionRun(s, output_dir, workers, threads, tile_size,
+                             memmap, stream, plot_workers, reuse_figures,
+                             None if frame_format == "png" else frame_format,
+                             archive, superpose, cache)
     except RIDTOSError as e:
         sys.exit(f"\n{e}\n\nAborted.")
     
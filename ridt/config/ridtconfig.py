@@ -425,7 +425,8 @@ class IntegrationMethod(StringSelection):
         """
         self.options = [
             "cumulativetrapezoidal",
-            "romberg"
+            "romberg",
+            "analytic"
         ]
     
     def check(self):
@@ -19,6 +19,10 @@ class Domain:
     to monitor locations and the total domain. The meshgrids over which the
     equations are evaluated are generated from the settings object by this
     class.
+
+    All meshgrids are returned in sparse form, i.e. each array only extends
+    along the axis it varies over, and broadcasts against the others to the
+    full grid shape.
     
     Attributes
     ----------
@@ -60,7 +64,7 @@ class Domain:
     @property
     def full(self):
         """:obj:`Tuple`[:class:`~numpy.ndarray`] : The full meshgrid domain."""
-        return meshgrid(self.x, self.y, self.z, indexing='ij')
+        return meshgrid(self.x, self.y, self.z, indexing='ij', sparse=True)
     
     @property
     def time(self):
@@ -174,7 +178,7 @@ class Domain:
             The 3D meshgrid for the point.
         
         """
-        return meshgrid(point.x, point.y, point.z, indexing="ij")
+        return meshgrid(point.x, point.y, point.z, indexing="ij", sparse=True)
 
     def lines(self, line: Line):
         """Returns the meshgrid corresponding to a line-like monitor locaiton.
@@ -191,11 +195,11 @@ class Domain:
         
         """
         if line.parallel_axis == "x":
-            return meshgrid(self.x, line.point.y, line.point.z, indexing="ij")
+            return meshgrid(self.x, line.point.y, line.point.z, indexing="ij", sparse=True)
         elif line.parallel_axis == "y":
-            return meshgrid(line.point.x, self.y, line.point.z, indexing="ij")
+            return meshgrid(line.point.x, self.y, line.point.z, indexing="ij", sparse=True)
         else:
-            return meshgrid(line.point.x, line.point.y, self.z, indexing="ij")
+            return meshgrid(line.point.x, line.point.y, self.z, indexing="ij", sparse=True)
 
     def planes(self, plane: Plane):
         """Returns the meshgrid corresponding to a plane-like monitor locaiton.
@@ -212,12 +216,12 @@ class Domain:
         
         """
         if plane.axis == "xy":
-            rv = meshgrid(self.x, self.y, plane.distance, indexing="ij")
+            rv = meshgrid(self.x, self.y, plane.distance, indexing="ij", sparse=True)
             return rv
         elif plane.axis == "yz":
-            return  meshgrid(plane.distance, self.y, self.z, indexing="ij")
+            return  meshgrid(plane.distance, self.y, self.z, indexing="ij", sparse=True)
         else:
-            return meshgrid(self.x, plane.distance, self.z, indexing="ij")
+            return meshgrid(self.x, plane.distance, self.z, indexing="ij", sparse=True)
     
     def domain(self, *args, **kwargs):
         """An interface for the :attr:`full` parameter.
@@ -371,4 +375,60 @@ class Domain:
             The time, x position, y position, and z position.
 
         """
-        return self.time[index[0]], self.x[index[1]], self.y[index[2]], self.z[index[3]] 
\ No newline at end of file
+        return self.time[index[0]], self.x[index[1]], self.y[index[2]], self.z[index[3]]
+
+    def value_grids(self, id: str, ndim: int):
+        """Returns the spatio-temporal values for every index of a grid.
+
+        This is the sparse counterpart of :meth:`values`. Each of the returned
+        time, x, y, and z values is either a scalar, if constant over the grid,
+        or an array that broadcasts against a grid with :obj:`ndim` dimensions.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The monitor location id string.
+
+        ndim : :obj:`int`
+            The number of dimensions of the grid being queried.
+
+        Returns
+        -------
+        :obj:`Tuple`[:class:`~numpy.ndarray`]
+            The time, x position, y position, and z position.
+
+        Raises
+        ------
+        :obj:`ValueError`
+            If an invalid number of dimensions is passed.
+
+        """
+        if ndim not in range(1, 5):
+            raise ValueError("Not a valid number of dimensions.")
+
+        def axis(values, dimension):
+            shape = [1] * ndim
+            shape[dimension] = values.size
+            return values.reshape(shape)
+
+        time = axis(self.time, 0)
+        locations = self.set.models.eddy_diffusion.monitor_locations
+        if id == "well_mixed":
+            return time, "N/A", "N/A", "N/A"
+        elif ndim == 1:
+            point = locations.points[id]
+            return time, point.x, point.y, point.z
+        elif ndim == 2:
+            line = locations.lines[id]
+            values = [line.point.x, line.point.y, line.point.z]
+            index = "xyz".index(line.parallel_axis)
+            values[index] = axis(getattr(self, line.parallel_axis), 1)
+            return (time, *values)
+        elif ndim == 3:
+            plane = locations.planes[id]
+            values = [plane.distance] * 3
+            for dimension, a in enumerate(plane.axis, 1):
+                values["xyz".index(a)] = axis(getattr(self, a), dimension)
+            return (time, *values)
+        else:
+            return (time, axis(self.x, 1), axis(self.y, 2), axis(self.z, 3))
@@ -1,19 +1,57 @@
-from numpy import squeeze 
+import warnings
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+
+from itertools import product
+
+from os.path import join
+
+from shutil import rmtree
+
+from tempfile import TemporaryDirectory
+
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from numpy import ndarray
+from numpy import broadcast
+from numpy import ravel_multi_index
+from numpy import load
 
 from ridt.base import ComputationalSpace
 
 from ridt.config import RIDTConfig
+from ridt.config import ConfigFileWriter
 
 from ridt.equation import EddyDiffusion
 
 from ridt.data import BatchDataStore
+from ridt.data import DataStore
+from ridt.data import MemmapDataStore
+from ridt.data import DirectoryAgent
+from ridt.data import DataStoreWriter
+from ridt.data import DataStoreArchive
+from ridt.data import ResultCache
+from ridt.data import DataStorePlotter
+from ridt.data import UncertaintyMask
 from ridt.data import BatchDataStoreWriter
 from ridt.data import BatchDataStorePlotter
+from ridt.data.datastorecsvwriter import DataStoreCSVWriter
 
 from ridt.container import Domain
 
 from ridt.analysis import BatchDataStoreAnalyser
+from ridt.analysis import DataStoreAnalyser
 from ridt.analysis import Exposure
+from ridt.analysis.resultswriter import ResultsWriter
+from ridt.analysis.batchresultswriter import BatchResultsWriter
+
+
+Output = Tuple[str, str, List[ndarray], ndarray]
+SavedGrids = List[List[Tuple[str, str, str]]]
 
 
 class EddyDiffusionRun:
@@ -36,9 +74,61 @@ class EddyDiffusionRun:
     
     exposure_store : :obj:`Union`[:class:`~.BatchDataStore`, None]
         The batch run data store for exposure values.
+
+    workers : :obj:`int`
+        The number of processes used to evaluate the computational space.
+
+    threads : :obj:`int`
+        The number of threads used to evaluate the monitor locations and
+        sources of each computational space element.
+
+    tile_size : :obj:`Union`[:obj:`int`, None]
+        The maximum number of cells along the longest axis of a monitor
+        location grid that are evaluated at once.
+
+    memmap : :obj:`bool`
+        Whether grids are stored as memory mapped files in the output
+        directory rather than in memory.
+
+    stream : :obj:`bool`
+        Whether each computational space element is written, plotted and
+        analysed as soon as it has been evaluated, and then released.
+
+    plot_workers : :obj:`int`
+        The number of processes used to render the plots.
+
+    reuse_figures : :obj:`bool`
+        Whether one figure is reused for each monitor location when plotting.
+
+    frame_format : :obj:`Union`[:obj:`str`, None]
+        The format of a single file into which the frames of each animated
+        monitor location are written, if any.
+
+    archive : :obj:`Union`[:class:`~.DataStoreArchive`, None]
+        The archive that all grids are written to, if any.
+
+    scratch : :obj:`Union`[:class:`~tempfile.TemporaryDirectory`, None]
+        The directory holding the memory mapped grids of an archived run, if
+        any, which is removed once they have been archived.
+
+    superpose : :obj:`bool`
+        Whether computational space elements that differ only in source
+        strengths are evaluated together by linear superposition.
+
+    cache : :obj:`Union`[:class:`~.ResultCache`, None]
+        The cache of monitor location grids, if any.
+
+    results : :obj:`dict` [:obj:`str`, :obj:`dict`]
+        For each quantity, the :class:`~.DataStoreAnalyser` instances of the
+        streamed computational space elements, with their grids released.
     
     """
-    def __init__(self, settings: RIDTConfig, outdir: str):
+    def __init__(self, settings: RIDTConfig, outdir: str, workers: int = 1,
+                 threads: int = 1, tile_size: int = None, memmap: bool = False,
+                 stream: bool = False, plot_workers: int = 1,
+                 reuse_figures: bool = False, frame_format: str = None,
+                 archive: bool = False, superpose: bool = False,
+                 cache: str = None):
         """The constructor for the :class:`EddyDiffusionRun` class.
 
         Parameters
@@ -49,17 +139,101 @@ class EddyDiffusionRun:
         outdir : :obj:`str`
             The path to the output directory for the run.
 
+        workers : :obj:`int`, optional
+            The number of processes used to evaluate the computational space.
+            By default the elements are evaluated serially.
+
+        threads : :obj:`int`, optional
+            The number of threads used to evaluate the monitor locations and
+            sources of each computational space element. By default they are
+            evaluated serially.
+
+        tile_size : :obj:`int`, optional
+            The maximum number of cells along the longest axis of a monitor
+            location grid that are evaluated at once. By default grids are
+            evaluated whole.
+
+        memmap : :obj:`bool`, optional
+            Whether grids are stored as memory mapped files in the output
+            directory rather than in memory. If an archive is also requested,
+            the files are kept in a temporary directory and removed once
+            they have been archived. By default they are held in memory.
+
+        stream : :obj:`bool`, optional
+            Whether each computational space element is written, plotted and
+            analysed as soon as it has been evaluated, and then released. By
+            default every element is evaluated before any output is produced.
+
+        plot_workers : :obj:`int`, optional
+            The number of processes used to render the plots. By default they
+            are rendered serially.
+
+        reuse_figures : :obj:`bool`, optional
+            Whether one figure is reused for each monitor location, updating
+            only the data for each time. By default a new figure is created
+            for each plot.
+
+        frame_format : :obj:`str`, optional
+            The format, either ``"gif"`` or ``"pdf"``, of a single file into
+            which all the frames of each line or plane are written, where
+            their ``animate`` setting is enabled. By default each frame is
+            saved as a separate PNG.
+
+        archive : :obj:`bool`, optional
+            Whether all grids, of every computational space element and
+            quantity, are written to a single :class:`~.DataStoreArchive` in
+            the output directory. By default each grid is written to its own
+            numpy binary file.
+
+        superpose : :obj:`bool`, optional
+            Whether computational space elements that differ only in the mass
+            or rate of their sources are evaluated together, from a single
+            unit strength evaluation of each source. By default every element
+            is evaluated separately.
+
+        cache : :obj:`str`, optional
+            The path to a :class:`~.ResultCache` directory. Monitor location
+            grids found in it are loaded rather than evaluated, and new grids
+            are added to it. By default nothing is cached.
+
         """
         self.settings = settings
         self.outdir = outdir
+        self.workers = workers
+        self.threads = threads
+        self.tile_size = tile_size
+        self.memmap = memmap
+        self.stream = stream
+        self.plot_workers = plot_workers
+        self.reuse_figures = reuse_figures
+        self.frame_format = frame_format
+        self.superpose = superpose
+        self.cache = ResultCache(cache) if cache else None
         self.data_store = BatchDataStore()
         self.exposure_store = None
+        self.results = {"concentration": dict(), "exposure": dict()}
         self.space = self.prepare()
-        self.evaluate()
-        self.compute_exposure()
-        self.write()
-        self.plot()
-        self.analyse()
+        self.archive = DataStoreArchive(outdir, "w") if archive else None
+        self.scratch = None
+        if memmap and archive:
+            self.scratch = TemporaryDirectory(dir=outdir)
+        try:
+            self.evaluate()
+            if self.stream:
+                self.write_batch()
+            else:
+                self.compute_exposure()
+                self.write()
+                self.plot()
+                self.analyse()
+        finally:
+            if self.archive is not None:
+                self.archive.close()
+            if self.scratch is not None:
+                # The maps must be released before their files are removed.
+                self.data_store = None
+                self.exposure_store = None
+                self.scratch.cleanup()
 
     @property
     def geometries(self):
@@ -88,47 +262,498 @@ class EddyDiffusionRun:
     def evaluate(self) -> None:
         """Loops over all elements in :attr:`space` and evaluates the model.
 
+        If more than one worker has been requested, the elements are
+        distributed over a process pool instead.
+
+        Returns
+        -------
+        None
+
+        """
+        groups = self.groups()
+        if self.workers > 1 and len(self.space) > 1:
+            self.evaluate_parallel(groups)
+            return
+
+        for group in groups:
+            for setting in group:
+                index = self.space.linear_index(setting)
+                count = f"{index + 1}/{len(self.space)}"
+                print(f"Evaluating computational space element {count}")
+            self.run(group)
+            if self.stream:
+                for setting in group:
+                    self.stream_element(setting)
+
+    def groups(self) -> Iterator[List[RIDTConfig]]:
+        """Groups the elements in :attr:`space` that are evaluated together.
+
+        If superposition has been requested, elements that differ only along
+        axes of the space that sweep the mass or rate of a source are grouped
+        together. Otherwise each element is in a group of its own.
+
+        The groups are found from the axes of the space alone, and the
+        elements of each group are only built when it is drawn.
+
+        Yields
+        ------
+        :obj:`List`[:class:`~.RIDTConfig`]
+            The groups of elements, in the order of their first element.
+
+        """
+        if not self.superpose or not self.space.values:
+            for setting in self.space.space:
+                yield [setting]
+            return
+
+        shape = self.space.shape
+        strength = [
+            all(self.is_strength(address) for address in addresses)
+            for addresses in self.space.axis_addresses
+        ]
+        fixed = [range(1) if s else range(n) for s, n in zip(strength, shape)]
+        free = [range(n) if s else range(1) for s, n in zip(strength, shape)]
+        for outer in product(*fixed):
+            yield [
+                self.space.space[int(ravel_multi_index(
+                    [i + j for i, j in zip(outer, inner)], shape))]
+                for inner in product(*free)
+            ]
+
+    @staticmethod
+    def is_strength(address: List[str]) -> bool:
+        """Whether a computational space address is the strength of a source.
+
+        Parameters
+        ----------
+        address : :obj:`List`[:obj:`str`]
+            The path to a swept setting, as stored by the
+            :class:`~.ComputationalSpace`.
+
+        Returns
+        -------
+        :obj:`bool`
+            Whether the address is the mass or rate of a source, as given by
+            :attr:`~.EddyDiffusion.strengths`.
+
+        """
+        return len(address) == 5 and address[0] == "modes" and\
+            address[2] == "sources" and\
+            EddyDiffusion.strengths.get(address[1]) == address[4]
+
+    def evaluate_parallel(self, groups: Iterator[List[RIDTConfig]]) -> None:
+        """Evaluates all elements in :attr:`space` over a process pool.
+
+        Each group of elements is evaluated by a single worker. The worker
+        writes its grids to numpy binary files, which are loaded here into
+        :attr:`data_store`. This avoids pickling the computed arrays between
+        processes. If memory mapping has been requested the files are
+        written to their final location and mapped, otherwise they are written
+        to a temporary directory in the output directory.
+
+        Parameters
+        ----------
+        groups : :obj:`Iterator`[:obj:`List`[:class:`~.RIDTConfig`]]
+            The groups of elements that are evaluated together, as yielded
+            by :meth:`groups`. The data store of each element is created as
+            its group is drawn.
+
         Returns
         -------
         None
 
         """
-        for setting in self.space.space:
-            count = f"{self.space.linear_index(setting) + 1}/{len(self.space)}"
-            print(f"Evaluating computational space element {count}")
-            self.run(setting)
+        with TemporaryDirectory(dir=self.outdir) as directory:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = dict()
+                for group in groups:
+                    outdirs = []
+                    for setting in group:
+                        self.data_store[setting] = self.create_store(setting)
+                        index = self.space.linear_index(setting)
+                        if self.memmap:
+                            outdirs.append(self.element_dir(index))
+                        else:
+                            outdirs.append(join(directory, str(index)))
+                    future = executor.submit(
+                        evaluate_group,
+                        [setting.__source__ for setting in group],
+                        self.geometries,
+                        outdirs,
+                        self.threads,
+                        self.tile_size,
+                        self.cache
+                    )
+                    futures[future] = group
+                done = 0
+                for future in as_completed(futures):
+                    group = futures[future]
+                    for setting, paths in zip(group, future.result()):
+                        store = self.data_store[setting]
+                        for geometry, name, path in paths:
+                            if self.memmap:
+                                store.open(geometry, name)
+                            else:
+                                store.add(geometry, name, load(path))
+                        done += 1
+                        count = f"{done}/{len(self.space)}"
+                        print(f"Evaluated computational space element {count}")
+                        if self.stream:
+                            self.stream_element(setting)
+
+    def element_dir(self, index: int) -> str:
+        """Returns the output directory of a computational space element.
+
+        Parameters
+        ----------
+        index : :obj:`int`
+            The linear index of the element in :attr:`space`.
 
-    def run(self, setting: RIDTConfig) -> None:
-        """Evaluates the model for a set of parameters, for all geometries.
+        Returns
+        -------
+        :obj:`str`
+            The path to the output directory, which is created if required.
+            For an archived run this is a directory in :attr:`scratch`
+            instead, which is left to be created by the store.
+
+        """
+        if self.scratch is not None:
+            return join(self.scratch.name, str(index))
+        dir_agent = DirectoryAgent(self.outdir, self.space.shape)
+        if not self.space.zero:
+            dir_agent.create_root_dir(index)
+        return dir_agent.outdir
+
+    def create_store(self, setting: RIDTConfig) -> DataStore:
+        """Creates an empty concentration data store for a space element.
+
+        Parameters
+        ----------
+        settings : :class:`~.RIDTConfig`
+            The settings for the run in question.
+
+        Returns
+        -------
+        :class:`~.DataStore`
+            A :class:`~.MemmapDataStore` in the output directory of the element
+            if memory mapping has been requested, otherwise a
+            :class:`~.DataStore`.
+
+        """
+        if self.memmap:
+            outdir = self.element_dir(self.space.linear_index(setting))
+            return MemmapDataStore(outdir, "concentration")
+        return DataStore()
+
+    def run(self, group: List[RIDTConfig]) -> None:
+        """Evaluates the model for a group of parameters, for all geometries.
     
         Loops over all monitor locations that have been selected for evaluation
         and evaluates them over their respective domains. Writes output to
         :attr:`data_store`.
 
+        Parameters
+        ----------
+        group : :obj:`List`[:class:`~.RIDTConfig`]
+            The settings for the runs in question, as grouped by
+            :meth:`groups`.
+
+        Returns
+        -------
+        None
+
+        """
+        for setting in group:
+            self.data_store[setting] = self.create_store(setting)
+        stores = [self.data_store[setting] for setting in group]
+        self.solve_group(group, stores, self.geometries, self.threads,
+                         self.tile_size, self.cache)
+
+    @staticmethod
+    def solve_group(settings: List[RIDTConfig], data_stores: List[DataStore],
+                    geometries: List[str], threads: int = 1,
+                    tile_size: int = None, cache: ResultCache = None) -> None:
+        """Evaluates the model for a group of parameters, for the given
+        geometries.
+
+        The settings of the group must differ only in the mass or rate of
+        their sources. The concentration is directly proportional to these,
+        so each source is evaluated once, at unit strength, and scaled into
+        the grids of every element. A group of one is evaluated by
+        :meth:`solve`.
+
+        Parameters
+        ----------
+        settings : :obj:`List`[:class:`~.RIDTConfig`]
+            The settings for the runs in question.
+
+        data_stores : :obj:`List`[:class:`~.DataStore`]
+            The data store to write the computed values of each run into.
+
+        geometries : :obj:`List`[:obj:`str`]
+            The geometries to evaluate.
+
+        threads : :obj:`int`, optional
+            The number of threads used to evaluate sources concurrently. By
+            default everything is evaluated serially.
+
+        tile_size : :obj:`int`, optional
+            The maximum number of cells along the longest axis of a grid that
+            are evaluated at once. By default grids are evaluated whole.
+
+        cache : :class:`~.ResultCache`, optional
+            The cache that grids are loaded from, when present, and saved to
+            once evaluated. By default every grid is evaluated.
+
+        Returns
+        -------
+        None
+
+        """
+        if len(settings) == 1:
+            EddyDiffusionRun.solve(settings[0], data_stores[0], geometries,
+                                   threads, tile_size, cache)
+            return
+
+        domain = Domain(settings[0])
+        locations = settings[0].models.eddy_diffusion.monitor_locations
+        solver = EddyDiffusion(settings[0], threads, tile_size)
+        strengths = [solver.get_strengths(setting) for setting in settings]
+
+        print(f"Superposing {len(settings)} computational space elements...")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for geometry in geometries:
+                print(f"Evaluating {geometry} monitor locations...")
+                for name, item in getattr(locations, geometry).items():
+                    print(f"Evaluating {name}...")
+                    grids = getattr(domain, geometry)(item)
+                    shape = (len(domain.time),) + broadcast(*grids).shape
+                    squeezed = tuple(d for d in shape if d != 1)
+                    outs = [
+                        store.allocate(geometry, name, squeezed).reshape(shape)
+                        for store in data_stores
+                    ]
+                    pending = EddyDiffusionRun.load_cached(
+                        settings, geometry, name, outs, cache)
+                    if pending:
+                        solver.superpose(*grids, domain.time,
+                                         [strengths[i] for i, _ in pending],
+                                         out=[outs[i] for i, _ in pending])
+                    if cache is not None:
+                        for index, key in pending:
+                            cache.save(key, outs[index])
+
+    @staticmethod
+    def solve(setting: RIDTConfig,
+              data_store: DataStore,
+              geometries: List[str],
+              threads: int = 1,
+              tile_size: int = None,
+              cache: ResultCache = None) -> None:
+        """Evaluates the model for a set of parameters, for the given
+        geometries.
+
+        The grid for every monitor location is allocated in the data store
+        first, and the solver writes its output straight into it. Grids found
+        in the cache, if any, are copied in instead of being evaluated.
+
+        If more than one thread has been requested, the monitor locations are
+        evaluated concurrently, each with its own solver. Any threads left
+        over are shared between the solvers to evaluate sources concurrently,
+        and the solvers do not log each source, as their messages would
+        interleave. Warnings raised by the solvers are ignored for the whole
+        evaluation, from the calling thread, as the warning filters are not
+        thread safe.
+
         Parameters
         ----------
         settings : :class:`~.RIDTConfig`
             The settings for the run in question.
 
+        data_store : :class:`~.DataStore`
+            The data store to write the computed values into.
+
+        geometries : :obj:`List`[:obj:`str`]
+            The geometries to evaluate.
+
+        threads : :obj:`int`, optional
+            The number of threads to use. By default everything is evaluated
+            serially.
+
+        tile_size : :obj:`int`, optional
+            The maximum number of cells along the longest axis of a grid that
+            are evaluated at once. By default grids are evaluated whole.
+
+        cache : :class:`~.ResultCache`, optional
+            The cache that grids are loaded from, when present, and saved to
+            once evaluated. By default every grid is evaluated.
+
         Returns
         -------
         None
 
         """
-        self.data_store.add_run(setting)
-
         domain = Domain(setting)
-        solver = EddyDiffusion(setting)
         locations = setting.models.eddy_diffusion.monitor_locations
 
-        for geometry in self.geometries:
-            print(f"Evaluating {geometry} monitor locations...")
+        outputs = []
+        keys = []
+        for geometry in geometries:
             for name, item in getattr(locations, geometry).items():
-                print(f"Evaluating {name}...")
-                space = getattr(domain, geometry)(item)
-                output = solver(*getattr(domain, geometry)(item), domain.time)
-                self.data_store[setting].add(geometry, name, squeeze(output))
+                grids = getattr(domain, geometry)(item)
+                shape = (len(domain.time),) + broadcast(*grids).shape
+                squeezed = tuple(d for d in shape if d != 1)
+                out = data_store.allocate(geometry, name, squeezed)
+                out = out.reshape(shape)
+                for _, key in EddyDiffusionRun.load_cached(
+                        [setting], geometry, name, [out], cache):
+                    outputs.append((geometry, name, grids, out))
+                    keys.append(key)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if threads > 1 and len(outputs) > 1:
+                print(f"Evaluating {len(outputs)} monitor locations "
+                      f"over {threads} threads...")
+                solver_threads = max(1, threads // len(outputs))
+
+                def evaluate(output: Output) -> None:
+                    geometry, name, grids, out = output
+                    solver = EddyDiffusion(setting, solver_threads, tile_size,
+                                           verbose=False)
+                    solver(*grids, domain.time, out=out)
+
+                pool_size = min(threads, len(outputs))
+                with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                    list(executor.map(evaluate, outputs))
+            else:
+                solver = EddyDiffusion(setting, threads, tile_size)
+                for geometry in geometries:
+                    print(f"Evaluating {geometry} monitor locations...")
+                    for output in [o for o in outputs if o[0] == geometry]:
+                        _, name, grids, out = output
+                        print(f"Evaluating {name}...")
+                        solver(*grids, domain.time, out=out)
+
+        if cache is not None:
+            for output, key in zip(outputs, keys):
+                cache.save(key, output[3])
+
+    @staticmethod
+    def load_cached(settings: List[RIDTConfig],
+                    geometry: str,
+                    id: str,
+                    outs: List[ndarray],
+                    cache: ResultCache = None) -> List[Tuple[int, str]]:
+        """Copies the cached grids of a monitor location into their outputs.
+
+        Parameters
+        ----------
+        settings : :obj:`List`[:class:`~.RIDTConfig`]
+            The settings for the runs in question.
+
+        geometry : :obj:`str`
+            The type of the monitor location.
+
+        id : :obj:`str`
+            The id of the monitor location.
+
+        outs : :obj:`List`[:class:`~numpy.ndarray`]
+            The output grid of the monitor location for each run.
+
+        cache : :class:`~.ResultCache`, optional
+            The cache to load from. By default nothing is loaded.
+
+        Returns
+        -------
+        :obj:`List`[:obj:`Tuple`[:obj:`int`, :obj:`str`]]
+            The index and cache key of each run whose grid is still to be
+            evaluated. The key is None if there is no cache.
+
+        """
+        if cache is None:
+            return [(index, None) for index in range(len(settings))]
+
+        rv = []
+        for index, (setting, out) in enumerate(zip(settings, outs)):
+            key = cache.key(setting, geometry, id)
+            if cache.load(key, out):
+                print(f"Loaded {id} from the cache...")
+            else:
+                rv.append((index, key))
+        return rv
     
+    def stream_element(self, setting: RIDTConfig) -> None:
+        """Writes, plots and analyses a single computational space element.
+
+        The exposure is computed, and both quantities are passed through the
+        same writers, plotters and analysers as the batch run. The grids are
+        then released, keeping only the analysis results in :attr:`results`.
+
+        Parameters
+        ----------
+        settings : :class:`~.RIDTConfig`
+            The settings for the element in question.
+
+        Returns
+        -------
+        None
+
+        """
+        dir_agent = DirectoryAgent(self.outdir, self.space.shape)
+        if not self.space.zero:
+            dir_agent.create_root_dir(self.space.linear_index(setting))
+
+        stores = {"concentration": self.data_store[setting]}
+        if self.settings.compute_exposure:
+            stores["exposure"] = Exposure(self.settings,
+                                          stores["concentration"])
+
+        analysis = self.settings.models.eddy_diffusion.analysis
+        mask = None
+        if analysis.exclude_uncertain_values:
+            mask = UncertaintyMask(setting)
+        for quantity, store in stores.items():
+            DataStoreWriter(setting, store, dir_agent, quantity, self.archive)
+            if setting.write_data_to_csv:
+                DataStoreCSVWriter(setting, store, dir_agent, quantity)
+            DataStorePlotter(dir_agent, store, setting, quantity,
+                             self.plot_workers, self.reuse_figures,
+                             self.frame_format)
+            if analysis.perform_analysis:
+                result = DataStoreAnalyser(setting, store, quantity, mask)
+                ResultsWriter(setting, result, dir_agent, quantity)
+                result.data_store = None
+                self.results[quantity][setting] = result
+
+        del self.data_store[setting]
+        if self.scratch is not None:
+            stores.clear()
+            rmtree(self.element_dir(self.space.linear_index(setting)),
+                   ignore_errors=True)
+
+    def write_batch(self) -> None:
+        """Writes the batch outputs of a streamed run to disk.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.space.zero:
+            return
+        print("\nWriting batch results...")
+        ConfigFileWriter(self.outdir, "batch_config.json",
+                         self.settings.__source__)
+        if self.archive is not None:
+            self.archive.save_config("", self.settings.__source__)
+        for quantity, results in self.results.items():
+            if results:
+                ordered = {s: results[s] for s in self.space.space}
+                BatchResultsWriter(
+                    self.settings, self.space, ordered, self.outdir, quantity)
+
     def compute_exposure(self) -> None:
         """Computes the exposure from the concentration data.
 
@@ -172,9 +797,11 @@ class EddyDiffusionRun:
 
         """
         print("\nWriting data to disk... ")
-        BatchDataStoreWriter(*self.args(self.data_store, "concentration"))
+        BatchDataStoreWriter(*self.args(self.data_store, "concentration"),
+                             self.archive)
         if self.settings.compute_exposure:
-            BatchDataStoreWriter(*self.args(self.exposure_store, "exposure"))
+            BatchDataStoreWriter(*self.args(self.exposure_store, "exposure"),
+                                 self.archive)
 
     def plot(self) -> None:
         """Plots all requested data and writes it to disk.
@@ -185,9 +812,13 @@ class EddyDiffusionRun:
 
         """
         print("\nProducing plots... ")
-        BatchDataStorePlotter(*self.args(self.data_store, "concentration"))
+        BatchDataStorePlotter(*self.args(self.data_store, "concentration"),
+                              self.plot_workers, self.reuse_figures,
+                              self.frame_format)
         if self.settings.compute_exposure:
-            BatchDataStorePlotter(*self.args(self.exposure_store, "exposure"))
+            BatchDataStorePlotter(*self.args(self.exposure_store, "exposure"),
+                                  self.plot_workers, self.reuse_figures,
+                                  self.frame_format)
 
     def analyse(self) -> None:
         """Performs all relevant analysis and writes it to disk.
@@ -200,7 +831,64 @@ class EddyDiffusionRun:
         if not self.settings.models.eddy_diffusion.analysis.perform_analysis:
             return
         print("\nPerforming data analysis...")
-        BatchDataStoreAnalyser(*self.args(self.data_store, "concentration"))
+        masks = dict()
+        BatchDataStoreAnalyser(*self.args(self.data_store, "concentration"),
+                               masks)
         if self.settings.compute_exposure:
-            BatchDataStoreAnalyser(*self.args(self.exposure_store, "exposure"))
+            BatchDataStoreAnalyser(*self.args(self.exposure_store, "exposure"),
+                                   masks)
+
+
+def evaluate_group(sources: List[dict],
+                   geometries: List[str],
+                   outdirs: List[str],
+                   threads: int = 1,
+                   tile_size: int = None,
+                   cache: ResultCache = None) -> SavedGrids:
+    """Evaluates a group of computational space elements in a worker process.
+
+    The grids are written to memory mapped numpy binary files in the given
+    output directories, in the layout used by :class:`~.MemmapDataStore`.
 
+    Parameters
+    ----------
+    sources : :obj:`List`[:obj:`dict`]
+        The source dictionary of the :class:`~.RIDTConfig` for each element,
+        as grouped by :meth:`~.EddyDiffusionRun.groups`.
+
+    geometries : :obj:`List`[:obj:`str`]
+        The geometries to evaluate.
+
+    outdirs : :obj:`List`[:obj:`str`]
+        The output directory for the numpy binary files of each element.
+
+    threads : :obj:`int`, optional
+        The number of threads used within the worker process.
+
+    tile_size : :obj:`int`, optional
+        The maximum number of cells along the longest axis of a grid that are
+        evaluated at once.
+
+    cache : :class:`~.ResultCache`, optional
+        The cache that grids are loaded from and saved to.
+
+    Returns
+    -------
+    :obj:`List`[:obj:`List`[:obj:`Tuple`[:obj:`str`, :obj:`str`, :obj:`str`]]]
+        For each element, the geometry, the monitor location id, and the path
+        to the saved values for each monitor location.
+
+    """
+    settings = [RIDTConfig(source) for source in sources]
+    stores = [MemmapDataStore(outdir, "concentration") for outdir in outdirs]
+    EddyDiffusionRun.solve_group(settings, stores, geometries, threads,
+                                 tile_size, cache)
+    rv = []
+    for store in stores:
+        store.flush()
+        rv.append([
+            (geometry, name, store.path(geometry, name))
+            for geometry in geometries
+            for name in getattr(store, geometry)
+        ])
+    return rv
@@ -4,8 +4,14 @@ from .batchdatastorewriter import BatchDataStoreWriter
 
 from .datastore import DataStore
 
+from .memmapdatastore import MemmapDataStore
+
 from .datastorewriter import DataStoreWriter
 
+from .datastorearchive import DataStoreArchive
+
+from .resultcache import ResultCache
+
 from .directoryagent import DirectoryAgent
 
 from .datastoreplotter import DataStorePlotter
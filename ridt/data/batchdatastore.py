@@ -96,6 +96,20 @@ class BatchDataStore:
         except KeyError as e:
             raise BatchDataStoreIDError(setting)
 
+    def __delitem__(self, setting: RIDTConfig):
+        """Interface for standard :obj:`dict` functionality, with type restrict.
+
+        Raises
+        ------
+        :class:`BatchDataStoreIDError`
+            If the requested settings instance is not in the store.
+
+        """
+        try:
+            del self.store[setting]
+        except KeyError as e:
+            raise BatchDataStoreIDError(setting)
+
 
 class BatchDataStoreIDError(Error):
     """The exception raised when the data store is queries with settings object 
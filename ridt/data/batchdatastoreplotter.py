@@ -31,13 +31,26 @@ class BatchDataStorePlotter:
     data_store : :class:`~.BatchDataStore`
         The batch data store to be analysed.
 
+    workers : :obj:`int`
+        The number of processes used to render the plots.
+
+    reuse : :obj:`bool`
+        Whether one figure is reused for each monitor location.
+
+    frames : :obj:`Union`[:obj:`str`, None]
+        The format of a single file into which the frames of each animated
+        monitor location are written, if any.
+
     """
     def __init__(self,
                  settings: RIDTConfig,
                  data_store: BatchDataStore,
                  space: ComputationalSpace,
                  outdir: str,
-                 quantity: str):
+                 quantity: str,
+                 workers: int = 1,
+                 reuse: bool = False,
+                 frames: str = None):
         """The :class:`~.BatchDataStorePlotter` class initialiser.
 
         Parameters
@@ -58,12 +71,29 @@ class BatchDataStorePlotter:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        workers : :obj:`int`, optional
+            The number of processes used to render the plots. By default they
+            are rendered serially.
+
+        reuse : :obj:`bool`, optional
+            Whether one figure is reused for each monitor location, updating
+            only the data for each time. By default a new figure is created
+            for each plot.
+
+        frames : :obj:`str`, optional
+            The format, either ``"gif"`` or ``"pdf"``, of a single file into
+            which all the frames of each animated line or plane are written.
+            By default each frame is saved as a separate PNG.
+
         """
         self.settings = settings
         self.data_store = data_store
         self.outdir = outdir
         self.space = space
         self.quantity = quantity
+        self.workers = workers
+        self.reuse = reuse
+        self.frames = frames
         print(f"Plotting {self.quantity} data...")
         self.plot()
 
@@ -80,7 +110,8 @@ class BatchDataStorePlotter:
 
         """
         dir_agent = DirectoryAgent(self.outdir, self.space.shape)
-        arg = lambda x: (dir_agent, self.data_store[x], x, self.quantity)
+        arg = lambda x: (dir_agent, self.data_store[x], x, self.quantity,
+                         self.workers, self.reuse, self.frames)
 
         if self.space.zero:
             DataStorePlotter(*arg(self.settings))
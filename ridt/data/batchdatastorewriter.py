@@ -5,6 +5,7 @@ from ridt.config import ConfigFileWriter
 
 from .batchdatastore import BatchDataStore
 from .directoryagent import DirectoryAgent
+from .datastorearchive import DataStoreArchive
 from .datastorewriter import DataStoreWriter
 from .datastorecsvwriter import DataStoreCSVWriter
 
@@ -35,13 +36,17 @@ class BatchDataStoreWriter:
     data_store : :class:`~.BatchDataStore`
         The batch data store to be analysed.
 
+    archive : :obj:`Union`[:class:`~.DataStoreArchive`, None]
+        The archive the data stores are written to, if any.
+
     """
     def __init__(self,
                  settings: RIDTConfig,
                  data_store: BatchDataStore,
                  space: ComputationalSpace,
                  outdir: str,
-                 quantity: str):
+                 quantity: str,
+                 archive: DataStoreArchive = None):
         """The :class:`~.BatchDataStoreWriter` class initialiser.
 
         Parameters
@@ -62,12 +67,17 @@ class BatchDataStoreWriter:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        archive : :class:`~.DataStoreArchive`, optional
+            The archive to write the data stores to, instead of a numpy
+            binary file for each grid. By default no archive is used.
+
         """
         self.settings = settings
         self.data_store = data_store
         self.space = space
         self.outdir = outdir
         self.quantity = quantity
+        self.archive = archive
         self.write()
 
     def write(self):
@@ -77,7 +87,8 @@ class BatchDataStoreWriter:
         the :class:`~.DataStoreWriter` and :class:`~.DataStoreCSVWriter` on
         their corresponding :class:`~.DataStore` instances. This method will
         create the relevant subdirectories for output if they do not already
-        exist.
+        exist. No subdirectories are created for grids written to
+        :attr:`archive`.
 
         Returns
         -------
@@ -87,18 +98,24 @@ class BatchDataStoreWriter:
         dir_agent = DirectoryAgent(self.outdir, self.space.shape)
 
         arg = lambda x: (x, self.data_store[x], dir_agent, self.quantity)
+        warg = lambda x: (*arg(x), self.archive)
         carg = lambda x, s: (self.outdir, s, x.__source__)
 
         if self.space.zero:
-            DataStoreWriter(*arg(self.settings))
+            DataStoreWriter(*warg(self.settings))
             if self.settings.write_data_to_csv:
                 DataStoreCSVWriter(*arg(self.settings))
         else:
             ConfigFileWriter(*carg(self.settings, "batch_config.json"))
+            if self.archive is not None:
+                self.archive.save_config("", self.settings.__source__)
             for idx, setting in enumerate(self.space.space):
                 count = f"{idx + 1}/{len(self.space)}"
                 print(f"Writing computational space element {count}")
-                dir_agent.create_root_dir(idx)
-                DataStoreWriter(*arg(setting))
+                if self.archive is None or setting.write_data_to_csv:
+                    dir_agent.create_root_dir(idx)
+                else:
+                    dir_agent.select_root_dir(idx)
+                DataStoreWriter(*warg(setting))
                 if setting.write_data_to_csv:
                     DataStoreCSVWriter(*arg(setting))
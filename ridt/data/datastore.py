@@ -1,12 +1,17 @@
+from typing import List
 from typing import Tuple
 
+from numpy import argmax
+from numpy import asarray
 from numpy import ndarray
 from numpy import nanargmax
 from numpy import unravel_index
-from numpy import where
 from numpy import prod
 from numpy import isnan
+from numpy import nan
+from numpy import where
 from numpy import count_nonzero
+from numpy import zeros
 
 from ridt.base import Error
 
@@ -34,6 +39,10 @@ class DataStore:
     domain : :obj:`Dict`[:obj:`str`, :class:`~numpy.ndarray`]
         The dictionary containing all full domain value grids.
 
+    masks : :obj:`Dict`[:obj:`Tuple`[:obj:`str`], :class:`~numpy.ndarray`]
+        The boolean masks of the elements excluded from the analytics, keyed
+        by geometry and id.
+
     """
     class Dimensions:
         """A 'static' member class that contains information about the
@@ -54,6 +63,7 @@ class DataStore:
         self.lines = dict()
         self.planes = dict()
         self.domain = dict()
+        self.masks = dict()
     
     def add(self, geometry: str, id: str, data: ndarray)-> None:
         """Adds a new item to the data store.
@@ -85,6 +95,51 @@ class DataStore:
         except AttributeError:
             raise DataStoreGeometryError(geometry)
     
+    def allocate(self, geometry: str, id: str, shape: Tuple[int]) -> ndarray:
+        """Allocates a new zero filled grid in the data store.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be stored.
+
+        id : :obj:`str`
+            The id of the grid to be stored.
+
+        shape : :obj:`Tuple`[:obj:`int`]
+            The shape of the grid.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The allocated grid, which may be written into in place.
+
+        Raises
+        ------
+        :class:`~.DataStoreGeometryError`
+            If the passed geometry type is invalid.
+
+        """
+        data = zeros(shape)
+        self.add(geometry, id, data)
+        return data
+
+    def like(self, quantity: str) -> "DataStore":
+        """Returns a new empty data store of the same kind.
+
+        Parameters
+        ----------
+        quantity : :obj:`str`
+            The string id for the quantity to be stored.
+
+        Returns
+        -------
+        :class:`~.DataStore`
+            The new data store.
+
+        """
+        return DataStore()
+
     def get(self, geometry: str, id: str) -> ndarray:
         """Returns the grid given a geometry type and id string.
 
@@ -116,6 +171,80 @@ class DataStore:
         except KeyError:
             raise DataStoreIDError(id, geometry)
 
+    def view(self) -> "DataStore":
+        """Returns a new data store that shares the grids of this one.
+
+        Masks added to the view with :meth:`exclude` do not affect this
+        store, and no grid is copied.
+
+        Returns
+        -------
+        :class:`~.DataStore`
+            The new data store.
+
+        """
+        rv = DataStore()
+        for geometry in ["points", "lines", "planes", "domain"]:
+            setattr(rv, geometry, getattr(self, geometry).copy())
+        rv.masks.update(self.masks)
+        return rv
+
+    def exclude(self, geometry: str, id: str, mask: ndarray) -> None:
+        """Excludes elements of a grid from the analytics, at every time.
+
+        The grid itself is left untouched. Excluded elements are treated as
+        NaN by :meth:`at`, :meth:`maximum` and :meth:`threshold_analytics`.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be masked.
+
+        id : :obj:`str`
+            The id of the grid to be masked.
+
+        mask : :class:`~numpy.ndarray`
+            A boolean array that is true for the excluded elements, with as
+            many elements as the grid has at each time.
+
+        Raises
+        ------
+        :class:`~.DataStoreGeometryError`
+            If the passed geometry type is invalid.
+        :class:`~.DataStoreIDError`
+            If the passed ID does not exist in the store..
+
+        """
+        data = self.get(geometry, id)
+        self.masks[geometry, id] = asarray(mask, dtype=bool).reshape(data.shape[1:])
+
+    def at(self, geometry: str, id: str, time: int) -> ndarray:
+        """Returns a grid at a time index, with excluded elements set to NaN.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be found.
+
+        id : :obj:`str`
+            The id of the grid to be found.
+
+        time : :obj:`Union`[:obj:`int`, :obj:`slice`]
+            The time index, or a slice of time indices.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The grid at the time index. This is only a copy if elements have
+            been excluded.
+
+        """
+        data = asarray(self.get(geometry, id)[time])
+        mask = self.masks.get((geometry, id))
+        if mask is None:
+            return data
+        return where(mask, nan, data)
+
     def verify(self, data: ndarray, dimensions: int) -> None:
         """Verifies if a grid is valid.
 
@@ -158,11 +287,23 @@ class DataStore:
 
         """
         data = self.get(geometry, id)
-        try:
-            index = unravel_index(nanargmax(data), data.shape)
-        except ValueError:
-            index = None
-        return index, data[index]
+        if (geometry, id) not in self.masks:
+            try:
+                index = unravel_index(nanargmax(data), data.shape)
+            except ValueError:
+                index = None
+            return index, data[index]
+
+        index, value = None, data[None]
+        for time in range(data.shape[0]):
+            grid = self.at(geometry, id, time)
+            try:
+                i = unravel_index(nanargmax(grid), grid.shape)
+            except ValueError:
+                continue
+            if index is None or grid[i] > value:
+                index, value = (time, *i), grid[i]
+        return index, value
     
     def exceeds(self, geometry: str, id: str, value: float) -> Tuple[int]:
         """Returns the index of the first time a grid exceeds 'value'
@@ -185,9 +326,7 @@ class DataStore:
             no exceedence.
 
         """
-        data = self.get(geometry, id)
-        exceeds = self.zip(where(data >= value))
-        return exceeds[0] if exceeds else None
+        return self.threshold_analytics(geometry, id, [value], 100.0)[0][0]
 
     def percentage_exceeds(self, geometry: str, id: str, value: float, percent: float) -> int:
         """Returns the time index where 'percent'% of the grid exceeds 'value'
@@ -213,15 +352,7 @@ class DataStore:
             if not reached during simulation.
 
         """
-        data = self.get(geometry, id)
-        for time in range(data.shape[0]):
-            size = data[time].size - count_nonzero(isnan(data[time]))
-            if not size:
-                continue
-            frac = 100 * len(self.zip(where(data[time] >= value))) / size
-            if frac >= percent:
-                return time
-        return None
+        return self.threshold_analytics(geometry, id, [value], percent)[1][0]
     
     def percentage_exceeds_max(self, geometry: str, id: str, value: float) -> Tuple[int, float]:
         """Returns the maximum percentage of grid that exceeds `value`.
@@ -245,24 +376,79 @@ class DataStore:
             The time index and the percentage exceedence, or None and zero if no
             exceedence.
 
+        """
+        return self.threshold_analytics(geometry, id, [value], 100.0)[2][0]
+
+    def threshold_analytics(self,
+                            geometry: str,
+                            id: str,
+                            values: List[float],
+                            percent: float) -> Tuple[list, list, list]:
+        """Evaluates the exceedance quantities of a grid for many thresholds.
+
+        Computes the results of :meth:`exceeds`, :meth:`percentage_exceeds`
+        and :meth:`percentage_exceeds_max` for every threshold in a single
+        pass over the grid. Each time step is compared against all of the
+        thresholds at once, and the per threshold results are then found with
+        :func:`~numpy.argmax` over the time axis.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be evaluated.
+
+        id : :obj:`str`
+            The id of the grid to be evaluated.
+
+        values : :obj:`List`[:obj:`float`]
+            The thresholds to be exceeded.
+
+        percent : :obj:`float`
+            The percentage of the grid required to exceed each threshold.
+
+        Returns
+        -------
+        :obj:`Tuple`[:obj:`list`, :obj:`list`, :obj:`list`]
+            For each threshold, the index of the first exceedence, the time
+            index where the percentage exceedence was reached, and the time
+            index and value of the maximum percentage exceedence. Each result
+            takes the same form as the single threshold methods.
+
         """
         data = self.get(geometry, id)
-        max_val = 0.0
-        max_time = None
-        shape = data.shape
+        values = asarray(values, dtype=float).reshape(-1, 1)
+        counts = zeros((values.shape[0], data.shape[0]), dtype=int)
+        sizes = zeros(data.shape[0], dtype=int)
 
-        for time in range(shape[0]):
-            size = data[time].size - count_nonzero(isnan(data[time]))
-            if not size:
-                continue
-            frac = 100 * len(self.zip(where(data[time] >= value))) / size
-            if frac > max_val:
-                max_val = frac
-                max_time = time
-        return max_time, max_val
-    
-    def zip(self, where_output):
-        return list(zip(*where_output))
+        for time in range(data.shape[0]):
+            grid = self.at(geometry, id, time).reshape(1, -1)
+            sizes[time] = grid.size - count_nonzero(isnan(grid))
+            counts[:, time] = count_nonzero(grid >= values, axis=1)
+
+        valid = sizes > 0
+        frac = zeros(counts.shape)
+        frac[:, valid] = 100 * counts[:, valid] / sizes[valid]
+
+        exceeds = list()
+        percentage = list()
+        maximum = list()
+        for value, count, f in zip(values[:, 0], counts, frac):
+            time = int(argmax(count > 0))
+            if count[time]:
+                grid = self.at(geometry, id, time).reshape(-1)
+                index = unravel_index(argmax(grid >= value), data.shape[1:])
+                exceeds.append((time, *index))
+            else:
+                exceeds.append(None)
+
+            reached = valid & (f >= percent)
+            time = int(argmax(reached))
+            percentage.append(time if reached[time] else None)
+
+            time = int(argmax(f))
+            maximum.append((time, float(f[time])) if f[time] > 0 else (None, 0.0))
+
+        return exceeds, percentage, maximum
  
 
 class DataStoreIDError(Error):
@@ -0,0 +1,196 @@
+import json
+
+from os.path import join
+
+from typing import List
+
+from zipfile import ZipFile
+from zipfile import ZIP_STORED
+
+from numpy import ndarray
+from numpy import asanyarray
+from numpy.lib.format import read_array
+from numpy.lib.format import write_array
+
+from ridt.base import RIDTOSError
+
+
+class DataStoreArchive:
+    """A single file archive that holds the data stores of a whole run.
+
+    The archive is an uncompressed zip of numpy binary files, in the same
+    format as :func:`numpy.savez`, so it may also be opened with
+    :func:`numpy.load`. Each grid is stored under the path it would have in
+    the output directory tree, without the ``data`` directories, and the
+    settings of each computational space element are stored alongside as
+    JSON. The zip index gives random access to any single grid.
+
+    Attributes
+    ----------
+    path : :obj:`str`
+        The path to the archive file.
+
+    zip : :class:`~zipfile.ZipFile`
+        The open archive.
+
+    """
+
+    name = "data.npz"
+    """The file name of the archive in an output directory."""
+
+    def __init__(self, outdir: str, mode: str = "r"):
+        """The :class:`~.DataStoreArchive` constructor.
+
+        Parameters
+        ----------
+        outdir : :obj:`str`
+            The output directory of the run.
+
+        mode : :obj:`str`, optional
+            The mode to open the archive in, either ``"r"`` to read, ``"w"``
+            to create a new archive or ``"a"`` to add to an existing one. By
+            default the archive is opened for reading.
+
+        Raises
+        ------
+        :class:`~.RIDTOSError`
+            If the archive cannot be opened.
+
+        """
+        self.path = join(outdir, DataStoreArchive.name)
+        try:
+            self.zip = ZipFile(self.path, mode, ZIP_STORED, allowZip64=True)
+        except OSError as e:
+            raise RIDTOSError(e)
+
+    @staticmethod
+    def member(run: str, *parts: str) -> str:
+        """Returns the name of an archive member.
+
+        Parameters
+        ----------
+        run : :obj:`str`
+            The name of the computational space element directory, or an
+            empty string for a single run.
+
+        *parts : :obj:`str`
+            The remaining parts of the member path.
+
+        Returns
+        -------
+        :obj:`str`
+            The member name.
+
+        """
+        return "/".join(p for p in (run, *parts) if p)
+
+    def save(self, name: str, data: ndarray) -> None:
+        """Writes a grid to the archive.
+
+        Parameters
+        ----------
+        name : :obj:`str`
+            The member name, as returned by :meth:`member`.
+
+        data : :class:`~numpy.ndarray`
+            The grid to be written.
+
+        Returns
+        -------
+        None
+
+        """
+        with self.zip.open(name, "w", force_zip64=True) as f:
+            write_array(f, asanyarray(data), allow_pickle=False)
+
+    def load(self, name: str) -> ndarray:
+        """Reads a single grid from the archive.
+
+        Parameters
+        ----------
+        name : :obj:`str`
+            The member name, as returned by :meth:`member`.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The grid.
+
+        Raises
+        ------
+        :obj:`KeyError`
+            If there is no such member.
+
+        """
+        with self.zip.open(name) as f:
+            return read_array(f, allow_pickle=False)
+
+    def save_config(self, run: str, data: dict) -> None:
+        """Writes the settings of a computational space element to the archive.
+
+        The settings are only written once for each element.
+
+        Parameters
+        ----------
+        run : :obj:`str`
+            The name of the computational space element directory, or an
+            empty string for a single run.
+
+        data : :obj:`dict`
+            The settings as a :obj:`dict`.
+
+        Returns
+        -------
+        None
+
+        """
+        name = DataStoreArchive.member(run, "config.json")
+        try:
+            self.zip.getinfo(name)
+        except KeyError:
+            self.zip.writestr(name, json.dumps(data, indent=4))
+
+    def load_config(self, run: str) -> dict:
+        """Reads the settings of a computational space element.
+
+        Parameters
+        ----------
+        run : :obj:`str`
+            The name of the computational space element directory, or an
+            empty string for a single run.
+
+        Returns
+        -------
+        :obj:`dict`
+            The settings as a :obj:`dict`.
+
+        """
+        name = DataStoreArchive.member(run, "config.json")
+        return json.loads(self.zip.read(name))
+
+    def names(self) -> List[str]:
+        """Returns the names of all members of the archive.
+
+        Returns
+        -------
+        :obj:`List`[:obj:`str`]
+            The member names.
+
+        """
+        return self.zip.namelist()
+
+    def close(self) -> None:
+        """Closes the archive, writing its index if it was modified.
+
+        Returns
+        -------
+        None
+
+        """
+        self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,11 +1,15 @@
 import csv
 
-from itertools import product
+from typing import Union
 
 from os.path import join
 
 from tqdm import tqdm
 
+from numpy import arange
+from numpy import asarray
+from numpy import broadcast_to
+from numpy import empty
 from numpy import ndarray
 
 from ridt.base import RIDTOSError
@@ -22,6 +26,9 @@ from .datastore import DataStore
 from ridt import bar_args
 
 
+CHUNK_SIZE = 1 << 16
+
+
 class DataStoreCSVWriter:
     """Class that writes a :class:`~.DataStore` instance to CSV files.
 
@@ -144,10 +151,77 @@ class DataStoreCSVWriter:
             f"value ({getattr(self.units, f'{self.quantity}')})"
         ])
 
-        indices = list(product(*[range(i) for i in data.shape]))
+        rows = self.rows(id, data, factor, writer.dialect.lineterminator)
 
         print(f"Writing {id} {self.quantity} data to a csv file...")
-        for index in tqdm(indices, total=len(indices), **bar_args):
-            values = self.domain.values(id, index)
-            writer.writerow(list(values) + [data[index] / factor])
-        f.close()
\ No newline at end of file
+        for chunk in tqdm(rows, total=-(-data.size // CHUNK_SIZE), **bar_args):
+            f.write(chunk)
+        f.close()
+
+    def rows(self, id: str, data: ndarray, factor: float, terminator: str):
+        """Yields the csv rows of a grid in chunks of :data:`CHUNK_SIZE`.
+
+        The time and position columns are formatted once per distinct value
+        and broadcast over the grid. The rows of a chunk are then formatted
+        together by a single ``%`` format, which writes each value with
+        :func:`repr`, exactly as :mod:`csv` does.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The id of the grid to be written.
+
+        data : :class:`~numpy.ndarray`
+            The grid to be written.
+
+        factor : :obj:`float`
+            The unit conversion factor the values are divided by.
+
+        terminator : :obj:`str`
+            The string that ends each row.
+
+        Yields
+        ------
+        :obj:`str`
+            The next chunk of rows, in C order of the grid indices.
+
+        """
+        time, *position = [
+            self.format(v) for v in self.domain.value_grids(id, data.ndim)]
+        time = time.reshape(-1) + ","
+        prefix = position[0] + "," + position[1] + "," + position[2] + ","
+        prefix = asarray(prefix, dtype=object)
+        prefix = broadcast_to(prefix, (1, *data.shape[1:])).reshape(-1)
+
+        values = data.reshape(-1)
+        row = "%s%s%r" + terminator
+        for start in range(0, values.size, CHUNK_SIZE):
+            index = arange(start, min(start + CHUNK_SIZE, values.size))
+            chunk = empty((index.size, 3), dtype=object)
+            chunk[:, 0] = time[index // prefix.size]
+            chunk[:, 1] = prefix[index % prefix.size]
+            chunk[:, 2] = (values[index] / factor).tolist()
+            yield row * index.size % tuple(chunk.reshape(-1).tolist())
+
+    @staticmethod
+    def format(values: Union[ndarray, float, str]) -> ndarray:
+        """Formats values the way :mod:`csv` writes them, one at a time.
+
+        This is only used for the time and position axes, which hold one
+        entry per distinct value rather than one per grid element.
+
+        Parameters
+        ----------
+        values : :class:`~numpy.ndarray` or :obj:`float` or :obj:`str`
+            The value or array of values to be formatted.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            An object array of strings with the shape of :obj:`values`.
+
+        """
+        values = asarray(values)
+        rv = empty(values.shape, dtype=object)
+        rv.reshape(-1)[:] = [str(v) for v in values.reshape(-1).tolist()]
+        return rv
@@ -1,5 +1,19 @@
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+
+from time import perf_counter
+
 from tqdm import tqdm
 
+from matplotlib import use
+
 from numpy import max
 from numpy import linspace
 
@@ -32,7 +46,10 @@ class DataStorePlotter:
                  dir_agent: DirectoryAgent,
                  data_store: DataStore,
                  settings: RIDTConfig,
-                 quantity: str) -> None:
+                 quantity: str,
+                 workers: int = 1,
+                 reuse: bool = False,
+                 frames: str = None) -> None:
         """The :class:`DataStorePlotter` constructor.
 
         Parameters
@@ -49,6 +66,69 @@ class DataStorePlotter:
         quantity: :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        workers : :obj:`int`, optional
+            The number of processes used to render the plots. By default they
+            are rendered serially.
+
+        reuse : :obj:`bool`, optional
+            Whether each plotter reuses one figure per monitor location,
+            updating only the data for each time. By default a new figure is
+            created for each plot.
+
+        frames : :obj:`str`, optional
+            The format, either ``"gif"`` or ``"pdf"``, of a single file into
+            which all the frames of each line or plane are written, where
+            their ``animate`` setting is enabled. By default each frame is
+            saved as a separate PNG.
+
+        """
+        start = perf_counter()
+        jobs = self.jobs(dir_agent, data_store, settings, quantity, reuse,
+                         frames)
+        count = self.render(jobs, self.count(data_store, settings), workers)
+        if count:
+            print(f"Rendered {count} plots in {perf_counter() - start:.2f}s")
+
+    def jobs(self,
+             dir_agent: DirectoryAgent,
+             data_store: DataStore,
+             settings: RIDTConfig,
+             quantity: str,
+             reuse: bool,
+             frames: str) -> Iterator[Tuple[Callable, List[tuple]]]:
+        """Yields the plotter and the call arguments of each monitor location.
+
+        The rescaled data for a location is only sliced out when its job is
+        requested, so no more than the locations being rendered are held in
+        memory at once.
+
+        Parameters
+        ----------
+        dir_agent : :class:`~.DirectoryAgent`
+            The path to the output directory for the run.
+
+        data_store : :class:`~.DataStore`
+            The data store to be analysed.
+
+        settings : :class:`~.RIDTConfig`
+            The settings for the run in question.
+
+        quantity: :obj:`str`
+            The string id for the quantity stored in the data  store.
+
+        reuse : :obj:`bool`
+            Whether each plotter reuses one figure per monitor location.
+
+        frames : :obj:`str`
+            The format of the single file that the frames of each animated
+            line or plane are written into, if any.
+
+        Returns
+        -------
+        :obj:`Iterator`[:obj:`Tuple`[:obj:`Callable`, :obj:`List`[:obj:`tuple`]]]
+            The plotter instance and the call arguments of each of its plots,
+            for each job.
+
         """
         units = Units(settings)
         factor = getattr(units, f"{quantity}_factor")
@@ -59,26 +139,107 @@ class DataStorePlotter:
             # Verify that plots are requested.
             if not config.output: continue
             print(f"Plotting {geometry} monitor locations...")
-            # Generates the time indices to plot from the config object.
-            try:
-                indices = self.spread(settings.time_samples, config.number)
-            except AttributeError:
-                # This happens if it is a point.
-                indices = None
             dir_agent.create_plot_dir(geometry, quantity)
-            plotter = plotter(settings, dir_agent.pdir, quantity)
-            # Loop over all items in this geometry class.
-            for id, data in getattr(data_store, geometry).items():
-                # Rescale data from SI units back into output units.
-                rescaled_data = data / factor
-                # Find the maximum value.
-                max_val = max(rescaled_data)
-                if geometry == "points":
-                    plotter(id, rescaled_data)
+            # Animated frames are collected into one file per location.
+            animate = bool(frames) and getattr(config, "animate", False)
+            kwargs = {"frames": frames} if animate else {}
+            plotter = plotter(settings, dir_agent.pdir, quantity, reuse,
+                              **kwargs)
+            items = getattr(data_store, geometry).items()
+            if geometry == "points":
+                # Reused figures and animations are kept for all points.
+                calls = [(id, data / factor) for id, data in items]
+                if reuse or animate:
+                    calls = [calls]
                 else:
-                    # Loop over all requested time indices.
-                    for idx in tqdm(indices, **bar_args):
-                        plotter(id, rescaled_data[idx], max_val, idx)
+                    calls = [[c] for c in calls]
+                yield from ((plotter, c) for c in calls if c)
+                continue
+            indices = self.spread(settings.time_samples, config.number)
+            # Loop over all items in this geometry class.
+            for id, data in items:
+                # Find the maximum value, in output units.
+                max_val = max(data) / factor
+                # One call for each requested time index, holding only the
+                # rescaled data for that time.
+                yield plotter, [(id, data[idx] / factor, max_val, idx)
+                                for idx in indices]
+
+    def count(self, data_store: DataStore, settings: RIDTConfig) -> int:
+        """Returns the number of plots that will be rendered.
+
+        Parameters
+        ----------
+        data_store : :class:`~.DataStore`
+            The data store to be analysed.
+
+        settings : :class:`~.RIDTConfig`
+            The settings for the run in question.
+
+        Returns
+        -------
+        :obj:`int`
+            The number of plots.
+
+        """
+        rv = 0
+        for geometry in DataStorePlotter.geometries:
+            models = settings.models
+            config = getattr(models.eddy_diffusion, f"{geometry}_plots")
+            if not config.output: continue
+            number = len(getattr(data_store, geometry))
+            if geometry != "points":
+                number *= len(
+                    self.spread(settings.time_samples, config.number))
+            rv += number
+        return rv
+
+    def render(self, jobs: Iterator[Tuple[Callable, List[tuple]]], total: int,
+               workers: int) -> int:
+        """Renders each job, optionally over a process pool.
+
+        Each worker process uses the non-interactive Agg backend, and the jobs
+        are distributed over the workers one job at a time. No more jobs are
+        taken from the iterator than there are workers to render them.
+
+        Parameters
+        ----------
+        jobs : :obj:`Iterator`[:obj:`Tuple`[:obj:`Callable`, :obj:`List`[:obj:`tuple`]]]
+            The plotter instance and the call arguments of each of its plots,
+            for each job.
+
+        total : :obj:`int`
+            The total number of plots, for the progress bar.
+
+        workers : :obj:`int`
+            The number of processes used to render the plots.
+
+        Returns
+        -------
+        :obj:`int`
+            The number of plots rendered.
+
+        """
+        bar = tqdm(total=total, **bar_args)
+        if workers == 1:
+            for plotter, calls in jobs:
+                bar.update(render(plotter, calls))
+        else:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=use,
+                                     initargs=("Agg",)) as executor:
+                pending = set()
+                for job in jobs:
+                    if len(pending) == workers:
+                        done, pending = wait(pending,
+                                             return_when=FIRST_COMPLETED)
+                        for future in done:
+                            bar.update(future.result())
+                    pending.add(executor.submit(render, *job))
+                for future in as_completed(pending):
+                    bar.update(future.result())
+        bar.close()
+        return bar.n
 
     def spread(self, time_samples: int, number_of_plots: int):
         """Returns a spread of time indices over time domain.
@@ -100,3 +261,26 @@ class DataStorePlotter:
         if number_of_plots > time_samples:
             number_of_plots = time_samples
         return [int(i) for i in linspace(0, time_samples - 1, number_of_plots)]
+
+
+def render(plotter: Callable, calls: List[tuple]) -> int:
+    """Renders a sequence of plots with one plotter and then closes it.
+
+    Parameters
+    ----------
+    plotter : :obj:`Callable`
+        The plotter instance.
+
+    calls : :obj:`List`[:obj:`tuple`]
+        The call arguments for each plot.
+
+    Returns
+    -------
+    :obj:`int`
+        The number of plots rendered.
+
+    """
+    for args in calls:
+        plotter(*args)
+    plotter.close()
+    return len(calls)
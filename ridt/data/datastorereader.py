@@ -1,15 +1,25 @@
+from collections.abc import MutableMapping
+
 from os.path import join
+from os.path import split
+from os.path import isfile
+
+from typing import Dict
+from typing import Iterator
 
 from numpy import load
+from numpy import ndarray
 
 from ridt.base import ComputationalSpace
 from ridt.base import Error
+from ridt.base import RIDTOSError
 
 from ridt.config import RIDTConfig
 
 from .batchdatastore import BatchDataStore
 from .directoryagent import DirectoryAgent
 from .datastore import DataStore
+from .datastorearchive import DataStoreArchive
 
 
 class DataStoreReader:
@@ -22,6 +32,15 @@ class DataStoreReader:
     :class:`~.DataStore` or :class:`~.BatchDataStore` will be returned instead
     of :class:`~.DataStoreReader`.
 
+    If the reader is lazy, no arrays are read up front. Each grid is instead
+    loaded as a read only memory map the first time it is accessed, so only
+    the grids that are used are ever read from disk.
+
+    If the directory holds a :class:`~.DataStoreArchive`, the grids are read
+    from the archive instead. Lazily read grids are then each read in full
+    from the archive when first accessed, opening it for that read only, so
+    the archive is never held open by the store.
+
     Attributes
     ----------
     directory: :obj:`str`
@@ -37,6 +56,12 @@ class DataStoreReader:
         The :class:`~.ComputationalSpace` instance corresponding to the
         :attr:`settings` attribute.
 
+    lazy : :obj:`bool`
+        Whether each grid is loaded on first access.
+
+    archive : :obj:`Union`[:class:`~.DataStoreArchive`, None]
+        The archive in the directory, if any, while it is being read.
+
     data_store : :obj:`Union`[:class:`~.DataStore`, :class:`~.BatchDataStore`]
         The parsed data store.
 
@@ -47,7 +72,8 @@ class DataStoreReader:
         instance.__init__(*args, **kwargs)
         return instance.data_store
 
-    def __init__(self, settings: RIDTConfig, directory: str, quantity: str):
+    def __init__(self, settings: RIDTConfig, directory: str, quantity: str,
+                 lazy: bool = False):
         """The :class:`DataStoreReader` constructor.
 
         Parameters
@@ -61,11 +87,18 @@ class DataStoreReader:
         quantity: :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        lazy : :obj:`bool`, optional
+            Whether each grid is loaded as a read only memory map on first
+            access, rather than read into memory up front. By default all
+            grids are read immediately.
+
         """
         self.directory = directory
         self.settings = settings
         self.quantity = quantity
-        restrict = {"models": self.settings.dispersion_model}
+        self.lazy = lazy
+        self.archive = None
+        restrict = {"models": "eddy_diffusion"}
         self.space = ComputationalSpace(self.settings, restrict)
         self.read()
 
@@ -90,17 +123,24 @@ class DataStoreReader:
 
 
         """
-        if self.space.zero:
-            self.data_store = self.load(self.settings, self.directory)
-        else:
-            self.data_store = BatchDataStore()
-            with DirectoryAgent(self.directory, self.space.shape) as da:
+        if isfile(join(self.directory, DataStoreArchive.name)):
+            self.archive = DataStoreArchive(self.directory)
+        da = DirectoryAgent(self.directory, self.space.shape)
+        try:
+            if self.space.zero:
+                self.data_store = self.load(self.settings, da)
+            else:
+                self.data_store = BatchDataStore()
                 for idx, setting in enumerate(self.space.space):
-                    da.create_data_dir(idx)
+                    da.select_root_dir(idx)
                     self.data_store.add_run(setting)
-                    self.data_store[setting] = self.load(setting, da.ddir)
-    
-    def load(self, setting: RIDTConfig, directory: str):
+                    self.data_store[setting] = self.load(setting, da)
+        finally:
+            if self.archive is not None:
+                self.archive.close()
+                self.archive = None
+
+    def load(self, setting: RIDTConfig, dir_agent: DirectoryAgent):
         """Reads in each numpy array and stores it in the new data store.
 
         Parameters
@@ -108,8 +148,9 @@ class DataStoreReader:
         setting : :class:`~.RIDTConfig`
             The settings for the run output stored in the data store.
 
-        directory: :obj:`str`
-            The directory where the data store is located.
+        dir_agent : :class:`~.DirectoryAgent`
+            The directory agent, with the directory of the data store
+            selected.
 
         Returns
         -------
@@ -119,24 +160,154 @@ class DataStoreReader:
         Raises
         ------
         :class:`~.DataStoreParsingError`
-            If unable to read a numpy binary file from disk.
+            If unable to read a numpy binary file from disk. If the reader is
+            lazy, this is instead raised when the grid is first accessed.
 
         """
         rv = DataStore()
         locations = setting.models.eddy_diffusion.monitor_locations
 
         for geometry in self.geometries:
-            for name in getattr(locations, geometry).keys():
-                fname = name + ".npy"
-                folder = join(directory, geometry, self.quantity)
-                try:
-                    with open(join(folder, fname), 'rb') as f:
-                        rv.add(geometry, name, load(f))
-                except OSError as e:
-                    raise DataStoreParsingError(fname, folder, e)
+            if self.archive is not None:
+                folder = self.archive.path
+                path = lambda fname: DataStoreArchive.member(
+                    dir_agent.run, geometry, self.quantity, fname)
+            else:
+                folder = join(dir_agent.outdir, geometry, self.quantity, "data")
+                path = lambda fname: join(folder, fname)
+            paths = {
+                name: path(name + ".npy")
+                for name in getattr(locations, geometry).keys()
+            }
+            archived = self.directory if self.archive is not None else None
+            grids = LazyArrays(paths, archived)
+            if self.lazy:
+                setattr(rv, geometry, grids)
+                continue
+            for name in paths:
+                rv.add(geometry, name, grids.load(name, None, self.archive))
+
+        return rv
+
+
+class LazyArrays(MutableMapping):
+    """A dictionary of grids that are loaded from numpy binary files on first
+    access.
+
+    Each grid is loaded as a read only memory map and then kept, so only the
+    pages of a grid that are used are read from disk. Grids in an archive are
+    read in full when first accessed, with the archive opened for that read
+    only. Grids that are set directly are held as given.
+
+    Attributes
+    ----------
+    paths : :obj:`Dict`[:obj:`str`, :obj:`str`]
+        The path to the numpy binary file of each grid, or its member name in
+        :attr:`archive`, keyed by id.
+
+    archive : :obj:`Union`[:obj:`str`, None]
+        The output directory holding the :class:`~.DataStoreArchive` the
+        grids are read from, if any.
+
+    arrays : :obj:`Dict`[:obj:`str`, :obj:`Union`[:class:`~numpy.ndarray`, None]]
+        The grids that have been loaded or set, keyed by id, with
+        :obj:`None` for each grid that has not been loaded yet.
+
+    """
+
+    def __init__(self, paths: Dict[str, str], archive: str = None):
+        """The :class:`LazyArrays` constructor.
+
+        Parameters
+        ----------
+        paths : :obj:`Dict`[:obj:`str`, :obj:`str`]
+            The path to the numpy binary file of each grid, or its member name
+            in the archive, keyed by id.
+
+        archive : :obj:`str`, optional
+            The output directory holding the archive the grids are read from.
+            By default they are read from individual files.
 
+        """
+        self.paths = dict(paths)
+        self.archive = archive
+        self.arrays = dict.fromkeys(self.paths)
+
+    def __getitem__(self, id: str) -> ndarray:
+        data = self.arrays[id]
+        if data is None:
+            data = self.arrays[id] = self.load(id)
+        return data
+
+    def __setitem__(self, id: str, data: ndarray) -> None:
+        self.arrays[id] = data
+
+    def __delitem__(self, id: str) -> None:
+        del self.arrays[id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.arrays)
+
+    def __len__(self) -> int:
+        return len(self.arrays)
+
+    def copy(self) -> "LazyArrays":
+        """Returns a shallow copy, which shares the grids loaded so far.
+
+        Returns
+        -------
+        :class:`~.LazyArrays`
+            The copy.
+
+        """
+        rv = LazyArrays(self.paths, self.archive)
+        rv.arrays = self.arrays.copy()
         return rv
- 
+
+    def load(self, id: str, mmap_mode: str = "r",
+             archive: DataStoreArchive = None) -> ndarray:
+        """Loads a grid, as a read only memory map unless it is archived.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The id of the grid.
+
+        mmap_mode : :obj:`str`, optional
+            The memory map mode passed to :func:`numpy.load`, or :obj:`None`
+            to read the grid into memory. By default the grid is mapped read
+            only. Archived grids are always read into memory.
+
+        archive : :class:`~.DataStoreArchive`, optional
+            The open archive to read an archived grid from. By default the
+            archive is opened for this read and closed again.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The loaded grid.
+
+        Raises
+        ------
+        :class:`~.DataStoreParsingError`
+            If unable to read the numpy binary file from disk.
+
+        """
+        if self.archive is not None:
+            try:
+                if archive is not None:
+                    return archive.load(self.paths[id])
+                with DataStoreArchive(self.archive) as archive:
+                    return archive.load(self.paths[id])
+            except (OSError, KeyError, RIDTOSError) as e:
+                path = join(self.archive, DataStoreArchive.name)
+                raise DataStoreParsingError(self.paths[id], path, e)
+        folder, fname = split(self.paths[id])
+        try:
+            return load(self.paths[id], mmap_mode=mmap_mode)
+        except OSError as e:
+            raise DataStoreParsingError(fname, folder, e)
+
 
 class DataStoreParsingError(Error):
     """The exception raised when an OSError is raised when parsing data arrays
@@ -8,6 +8,8 @@ from ridt.config import ConfigFileWriter
 from .directoryagent import DirectoryAgent
 
 from .datastore import DataStore
+from .datastorearchive import DataStoreArchive
+from .memmapdatastore import MemmapDataStore
 
 
 class DataStoreWriter:
@@ -31,18 +33,17 @@ class DataStoreWriter:
     dir_agent : :class:`~.DirectoryAgent`
         The path to the output directory for the run.
 
-    """
+    archive : :obj:`Union`[:class:`~.DataStoreArchive`, None]
+        The archive the data store is written to, if any.
 
-    def __new__(cls, *args, **kwargs):
-        instance = super(DataStoreWriter, cls).__new__(cls)
-        instance.__init__(*args, **kwargs)
-        return instance
+    """
 
     def __init__(self,
                  setting: RIDTConfig,
                  data_store: DataStore,
                  dir_agent: DirectoryAgent,
-                 quantity: str):
+                 quantity: str,
+                 archive: DataStoreArchive = None):
         """The :class:`~.DataStoreWriter` constructor.
 
         Parameters
@@ -59,11 +60,19 @@ class DataStoreWriter:
         data_store : :class:`~.DataStore`
             The data store to be written.
 
+        archive : :class:`~.DataStoreArchive`, optional
+            The archive to write the data store and settings to, instead of a
+            numpy binary file for each grid. By default no archive is used.
+
         """
         self.dir_agent = dir_agent
         self.setting = setting
         self.quantity = quantity
-        self.write(data_store)
+        self.archive = archive
+        if self.archive is not None:
+            self.write_archive(data_store)
+        else:
+            self.write(data_store)
     
     @property
     def geometries(self):
@@ -80,7 +89,8 @@ class DataStoreWriter:
         The settings object is converted to JSON and written to disk.
 
         The :attr:`dir_agent` creates and provides paths to the relevant
-        directories.
+        directories. Memory mapped grids that are already backed by their
+        destination file are flushed rather than written again.
 
         Parameters
         ----------
@@ -96,4 +106,33 @@ class DataStoreWriter:
         for geometry in self.geometries:
             self.dir_agent.create_data_dir(geometry, self.quantity)
             for id in getattr(data_store, geometry):
-                save(join(self.dir_agent.ddir, id), data_store.get(geometry, id))
+                path = join(self.dir_agent.ddir, id)
+                data = data_store.get(geometry, id)
+                if MemmapDataStore.backed_by(data, f"{path}.npy"):
+                    data.flush()
+                else:
+                    save(path, data)
+
+    def write_archive(self, data_store: DataStore) -> None:
+        """Method that loop over the entries in the data store and adds them
+        to :attr:`archive`.
+
+        The settings object is added to the archive, once for each
+        computational space element, and no directories are created.
+
+        Parameters
+        ----------
+        data_store : :class:`~.DataStore`
+            The data store to be written.
+
+        Returns
+        -------
+        None
+
+        """
+        run = self.dir_agent.run
+        self.archive.save_config(run, self.setting.__source__)
+        for geometry in self.geometries:
+            for id in getattr(data_store, geometry):
+                name = DataStoreArchive.member(run, geometry, self.quantity, f"{id}.npy")
+                self.archive.save(name, data_store.get(geometry, id))
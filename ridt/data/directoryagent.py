@@ -1,6 +1,8 @@
 from os import mkdir
 
 from os.path import join
+from os.path import curdir
+from os.path import relpath
 
 from numpy import unravel_index
 
@@ -70,12 +72,38 @@ class DirectoryAgent:
         -------
         None
 
+        """
+        self.select_root_dir(run_idx)
+        self.mkdir(self.outdir)
+
+    def select_root_dir(self, run_idx: tuple) -> None:
+        """Select the subdirectory for a batch run element, without creating
+        it.
+
+        Parameters
+        ----------
+        run_idx : :obj:`Tuple`[:obj:`int`]
+            The index in computational space of the run.
+
+        Returns
+        -------
+        None
+
         """
         idx = unravel_index(run_idx, self.shape)
         idx = str(idx).replace("(","[").replace(")", "]")
         self.outdir = join(self.rootdir, idx)
-        self.mkdir(self.outdir)
    
+    @property
+    def run(self) -> str:
+        """:obj:`str` : the name of the current computational space element
+        directory relative to :attr:`rootdir`, or an empty string for a single
+        run.
+
+        """
+        rv = relpath(self.outdir, self.rootdir)
+        return "" if rv == curdir else rv
+
     def create_geometry_dir(self, geometry: str):
         """Create the geometry subdirectory.
 
@@ -0,0 +1,230 @@
+from os.path import join
+from os.path import abspath
+
+from typing import Tuple
+
+from numpy import array
+from numpy import memmap
+from numpy import ndarray
+from numpy import float64
+from numpy.lib.format import open_memmap
+
+from .datastore import DataStore
+from .datastore import DataStoreGeometryError
+from .directoryagent import DirectoryAgent
+
+
+class MemmapDataStore(DataStore):
+    """A data store whose grids are memory mapped numpy binary files.
+
+    The grids are allocated directly in the data directories of an output
+    directory, in the same layout that :class:`~.DataStoreWriter` uses.
+    Writing the store to disk therefore only flushes the maps, and the
+    resident memory of a run does not grow with the number of grids.
+
+    Attributes
+    ----------
+    dir_agent : :class:`~.DirectoryAgent`
+        The directory agent for the output directory of the store.
+
+    quantity : :obj:`str`
+        The string id for the quantity stored in the data store.
+
+    """
+
+    def __init__(self, outdir: str, quantity: str):
+        """The :class:`MemmapDataStore` constructor.
+
+        Parameters
+        ----------
+        outdir : :obj:`str`
+            The output directory for the computational space element, which is
+            created if it does not already exist.
+
+        quantity : :obj:`str`
+            The string id for the quantity stored in the data store.
+
+        """
+        super().__init__()
+        self.dir_agent = DirectoryAgent(outdir, ())
+        self.dir_agent.mkdir(outdir)
+        self.quantity = quantity
+
+    def path(self, geometry: str, id: str) -> str:
+        """Returns the path of the file backing a grid.
+
+        The data directory is created if it does not already exist.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid.
+
+        id : :obj:`str`
+            The id of the grid.
+
+        Returns
+        -------
+        :obj:`str`
+            The path to the numpy binary file.
+
+        """
+        ddir = self.dir_agent.create_data_dir(geometry, self.quantity)
+        return abspath(join(ddir, f"{id}.npy"))
+
+    def allocate(self, geometry: str, id: str, shape: Tuple[int]) -> ndarray:
+        """Allocates a new zero filled memory mapped grid in the data store.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be stored.
+
+        id : :obj:`str`
+            The id of the grid to be stored.
+
+        shape : :obj:`Tuple`[:obj:`int`]
+            The shape of the grid.
+
+        Returns
+        -------
+        :class:`~numpy.memmap`
+            The allocated grid.
+
+        """
+        path = self.path(geometry, id)
+        data = open_memmap(path, mode="w+", dtype=float64, shape=shape)
+        super().add(geometry, id, data)
+        return data
+
+    def add(self, geometry: str, id: str, data: ndarray) -> None:
+        """Adds a new item to the data store.
+
+        Grids that are not already backed by the file for their id are copied
+        into a newly allocated map.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be stored.
+
+        id : :obj:`str`
+            The id of the grid to be stored.
+
+        data : :class:`~ndarray.ndarray`
+            The grid to be stored.
+
+        Raises
+        ------
+        :class:`~.DataStoreGeometryError`
+            If the passed geometry type is invalid.
+
+        Returns
+        -------
+        None
+
+        """
+        if not hasattr(DataStore.Dimensions, geometry):
+            raise DataStoreGeometryError(geometry)
+        if self.backed_by(data, self.path(geometry, id)):
+            super().add(geometry, id, data)
+        else:
+            self.verify(data, getattr(DataStore.Dimensions, geometry))
+            self.allocate(geometry, id, data.shape)[...] = data
+
+    @staticmethod
+    def backed_by(data: ndarray, path: str) -> bool:
+        """Checks whether a grid is a live memory map of the given file.
+
+        Copies of a memory map keep its filename but are held in memory, so
+        they are not considered to be backed by the file.
+
+        Parameters
+        ----------
+        data : :class:`~ndarray.ndarray`
+            The grid to be checked.
+
+        path : :obj:`str`
+            The path to the numpy binary file.
+
+        Returns
+        -------
+        :obj:`bool`
+            True if writing to the grid writes to the file.
+
+        """
+        return isinstance(data, memmap) and\
+            getattr(data, "_mmap", None) is not None and\
+            data.filename == abspath(path)
+
+    def open(self, geometry: str, id: str) -> None:
+        """Adds a grid that has already been written to its backing file.
+
+        Parameters
+        ----------
+        geometry : :obj:`str`
+            The type of grid to be stored.
+
+        id : :obj:`str`
+            The id of the grid to be stored.
+
+        Returns
+        -------
+        None
+
+        """
+        data = open_memmap(self.path(geometry, id), mode="r+")
+        super().add(geometry, id, data)
+
+    def flush(self) -> None:
+        """Flushes all grids to disk.
+
+        Returns
+        -------
+        None
+
+        """
+        for geometry in ["points", "lines", "planes", "domain"]:
+            for data in getattr(self, geometry).values():
+                data.flush()
+
+    def __deepcopy__(self, memo: dict) -> DataStore:
+        """Copies the data store into memory.
+
+        Copies are held in a plain :class:`~.DataStore`, so that modifying a
+        copy can never write back to the output files.
+
+        Parameters
+        ----------
+        memo : :obj:`dict`
+            The :func:`~copy.deepcopy` memo dictionary.
+
+        Returns
+        -------
+        :class:`~.DataStore`
+            The in memory copy.
+
+        """
+        rv = DataStore()
+        for geometry in ["points", "lines", "planes", "domain"]:
+            for id, data in getattr(self, geometry).items():
+                rv.add(geometry, id, array(data))
+        return rv
+
+    def like(self, quantity: str) -> DataStore:
+        """Returns a new empty memory mapped store for another quantity.
+
+        The new store shares the output directory of this store.
+
+        Parameters
+        ----------
+        quantity : :obj:`str`
+            The string id for the quantity to be stored.
+
+        Returns
+        -------
+        :class:`~.MemmapDataStore`
+            The new data store.
+
+        """
+        return MemmapDataStore(self.dir_agent.outdir, quantity)
@@ -0,0 +1,186 @@
+import json
+
+from hashlib import sha256
+
+from os import getpid
+from os import makedirs
+from os import remove
+from os import replace
+from os.path import isfile
+from os.path import join
+
+from threading import get_ident
+
+from numpy import ndarray
+from numpy import load
+from numpy import save
+
+from ridt.base import RIDTOSError
+
+from ridt.config import RIDTConfig
+
+
+class ResultCache:
+    """An on-disk cache of eddy diffusion monitor location grids.
+
+    Each grid is stored as a numpy binary file, named by a hash of only the
+    settings that the solver output depends on. Runs that differ only in
+    their thresholds, analysis, plot or output settings therefore share
+    their cached grids, as do computational space elements with the same
+    physics.
+
+    Attributes
+    ----------
+    directory : :obj:`str`
+        The path to the cache directory.
+
+    """
+
+    version = 1
+    """The version of the solver output, which is part of every key."""
+
+    physics = [
+        "integration_method",
+        "time_samples",
+        "total_time",
+        "dimensions",
+        "spatial_samples",
+        "fresh_air_flow_rate",
+        "modes"
+    ]
+    """The top level settings that the solver output depends on."""
+
+    model = ["coefficient", "images"]
+    """The eddy diffusion model settings that the solver output depends on."""
+
+    def __init__(self, directory: str):
+        """The :class:`~.ResultCache` constructor.
+
+        Parameters
+        ----------
+        directory : :obj:`str`
+            The path to the cache directory, which is created if required.
+
+        Raises
+        ------
+        :class:`~.RIDTOSError`
+            If the cache directory cannot be created.
+
+        """
+        self.directory = directory
+        try:
+            makedirs(directory, exist_ok=True)
+        except OSError as e:
+            raise RIDTOSError(e)
+
+    def key(self, setting: RIDTConfig, geometry: str, id: str) -> str:
+        """Returns the key of a monitor location grid.
+
+        Parameters
+        ----------
+        setting : :class:`~.RIDTConfig`
+            The settings of the computational space element.
+
+        geometry : :obj:`str`
+            The type of the monitor location.
+
+        id : :obj:`str`
+            The id of the monitor location.
+
+        Returns
+        -------
+        :obj:`str`
+            The hexadecimal digest of the canonical settings.
+
+        """
+        source = setting.__source__
+        model = source["models"]["eddy_diffusion"]
+        content = {
+            "version": ResultCache.version,
+            **{name: source[name] for name in ResultCache.physics},
+            **{name: model[name] for name in ResultCache.model},
+            "geometry": geometry,
+            "location": model["monitor_locations"][geometry][id]
+        }
+        text = json.dumps(content, sort_keys=True)
+        return sha256(text.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        """Returns the path to the file of a key.
+
+        Parameters
+        ----------
+        key : :obj:`str`
+            The key, as returned by :meth:`key`.
+
+        Returns
+        -------
+        :obj:`str`
+            The path to the numpy binary file.
+
+        """
+        return join(self.directory, f"{key}.npy")
+
+    def load(self, key: str, out: ndarray) -> bool:
+        """Copies a cached grid into an array, if there is one.
+
+        Parameters
+        ----------
+        key : :obj:`str`
+            The key, as returned by :meth:`key`.
+
+        out : :class:`~numpy.ndarray`
+            The array to copy the grid into.
+
+        Returns
+        -------
+        :obj:`bool`
+            Whether a grid of the right shape was found.
+
+        """
+        path = self.path(key)
+        if not isfile(path):
+            return False
+        try:
+            data = load(path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            return False
+        if data.shape != out.shape:
+            return False
+        out[...] = data
+        return True
+
+    def save(self, key: str, data: ndarray) -> None:
+        """Writes a grid to the cache.
+
+        The file is written under a temporary name and then renamed, so that
+        concurrent runs never read a partly written grid.
+
+        Parameters
+        ----------
+        key : :obj:`str`
+            The key, as returned by :meth:`key`.
+
+        data : :class:`~numpy.ndarray`
+            The grid to be cached.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        :class:`~.RIDTOSError`
+            If the grid cannot be written.
+
+        """
+        path = self.path(key)
+        temp = f"{path}.{getpid()}.{get_ident()}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                save(f, data, allow_pickle=False)
+            replace(temp, path)
+        except OSError as e:
+            if isfile(temp):
+                remove(temp)
+            raise RIDTOSError(e)
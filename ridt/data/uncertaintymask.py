@@ -1,11 +1,11 @@
 from typing import Union
 
-from copy import deepcopy
-
 from numpy import array
+from numpy import asarray
 from numpy import ndarray
-from numpy.linalg import norm
 from numpy import nan
+from numpy import sqrt
+from numpy import zeros
 
 from ridt.config import RIDTConfig
 from ridt.config import InstantaneousSource
@@ -35,6 +35,10 @@ class UncertaintyMask:
         The radius of the sphere around each source, inside which values will be
         masked.
 
+    regions : :obj:`dict` [:obj:`Tuple` [:obj:`str`, :obj:`str`], :class:`~numpy.ndarray`]
+        The exclusion regions found so far, keyed by geometry and id, so that
+        every grid of a monitor location masked by this instance shares one.
+
     """
     def __init__(self, setting: RIDTConfig):
         """The :class:`~.UncertaintyMask` constructor.
@@ -49,6 +53,7 @@ class UncertaintyMask:
         self.radius = setting.models.eddy_diffusion.analysis.exclude_radius_meters
         self.sources = self.get_source_locations()
         self.domain = Domain(setting)
+        self.regions = dict()
 
     def get_source_locations(self):
         """Get the source settings objects from the run settings instance.
@@ -69,6 +74,9 @@ class UncertaintyMask:
     def mask(self, geometry: str, id: str, data: ndarray):
         """Masks all elements in the grid that are within 2m of a source.
 
+        The grid is masked in place, at every time, over the region returned
+        by :meth:`exclusion`.
+
         Parameters
         ----------
         geometry : :obj:`str`
@@ -86,115 +94,73 @@ class UncertaintyMask:
             The masked array.
 
         """
-        print(f"Excluding uncertain values in {id}...")
-        return getattr(self, f"mask_{geometry}")(id, data)
-    
-    def mask_points(self, id: str, data: ndarray):
-        """Mask values in point array close to a source.
-
-        Parameters
-        ----------
-        id : :obj:`str`
-            The id of the point.
-
-        data : :class:`~.numpy.ndarray`
-            The array to be masked.
+        data[:, self.exclusion(geometry, id).reshape(data.shape[1:])] = nan
+        return data
 
-        Returns
-        -------
-        :class:`~.numpy.ndarray`
-            The masked copy.
-
-        """
-        point = self.setting.models.eddy_diffusion.monitor_locations.points[id]
-        location = self.domain.point_cartesian(point)
-        rv = deepcopy(data)
-        for s in self.sources:
-            if norm(s - location) <= self.radius:
-                rv.fill(nan)
-        return rv
-        
-    def mask_lines(self, id: str, data: ndarray):
-        """Mask values in line array close to a source.
+    def exclusion(self, geometry: str, id: str) -> ndarray:
+        """Returns the elements of a monitor location that are close to a source.
 
         Parameters
         ----------
-        id : :obj:`str`
-            The id of the line.
-
-        data : :class:`~.numpy.ndarray`
-            The array to be masked.
-
-        Returns
-        -------
-        :class:`~.numpy.ndarray`
-            The masked copy.
-
-        """
-        line = self.setting.models.eddy_diffusion.monitor_locations.lines[id]
-        locations = self.domain.line_cartesian(line)
-        rv = deepcopy(data)
-        for idx, location in locations:
-            for s in self.sources:
-                if norm(s - array(location)) <= self.radius:
-                    for idt, time in enumerate(self.domain.time):
-                        rv[idt][idx] = nan
-        return rv
-        
-    def mask_planes(self, id: str, data: ndarray):
-        """Mask values in plane array close to a source.
+        geometry : :obj:`str`
+            The type of monitor location.
 
-        Parameters
-        ----------
         id : :obj:`str`
-            The id of the plane.
-
-        data : :class:`~.numpy.ndarray`
-            The array to be masked.
+            The id of the monitor location.
 
         Returns
         -------
-        :class:`~.numpy.ndarray`
-            The masked copy.
-
-        """
-        plane = self.setting.models.eddy_diffusion.monitor_locations.planes[id]
-        locations = self.domain.plane_cartesian(plane)
-        rv = deepcopy(data)
-        for idx, location in locations:
-            for s in self.sources:
-                if norm(s - array(location)) <= self.radius:
-                    for idt, time in enumerate(self.domain.time):
-                        rv[idt][idx] = nan
-        return rv
-        
-    def mask_domain(self, id: str, data: ndarray):
-        """Mask values in domain array close to a source.
+        :class:`~numpy.ndarray`
+            A read only boolean array with the shape of the monitor location's
+            meshgrid that is true within :attr:`radius` of any source.
 
         Note
         ----
-        The `id` parameter is a placeholder for future functionality, where
-        multiple domains can be defined.
+        The region is found once per monitor location and held in
+        :attr:`regions`, so passing the same instance to the analysis of
+        several quantities reuses it.
+
+        """
+        key = (geometry, id)
+        if key not in self.regions:
+            if geometry == "domain":
+                grid = self.domain.domain()
+            else:
+                locations = self.setting.models.eddy_diffusion.monitor_locations
+                grid = getattr(self.domain, geometry)(getattr(locations, geometry)[id])
+            self.regions[key] = self.region(*grid)
+        return self.regions[key]
+
+    def region(self, x: ndarray, y: ndarray, z: ndarray) -> ndarray:
+        """Finds the elements of a meshgrid that are close to a source.
+
+        The distances from every element of the meshgrid to each source are
+        computed by broadcasting the axes against each other, so no element is
+        visited in Python.
 
         Parameters
         ----------
-        id : :obj:`str`
-            The id of the domain.
+        x : :class:`~numpy.ndarray`
+            The x values of the meshgrid.
 
-        data : :class:`~.numpy.ndarray`
-            The array to be masked.
+        y : :class:`~numpy.ndarray`
+            The y values of the meshgrid.
+
+        z : :class:`~numpy.ndarray`
+            The z values of the meshgrid.
 
         Returns
         -------
-        :class:`~.numpy.ndarray`
-            The masked copy.
+        :class:`~numpy.ndarray`
+            A read only boolean array with the shape of the meshgrid that is
+            true within :attr:`radius` of any source.
 
         """
-        locations = self.domain.domain_cartesian()
-        rv = deepcopy(data)
-        for idx, location in locations:
-            for s in self.sources:
-                if norm(s - array(location)) <= self.radius:
-                    for idt, time in enumerate(self.domain.time):
-                        rv[idt][idx] = nan
+        x = asarray(x, dtype=float).reshape(-1, 1, 1)
+        y = asarray(y, dtype=float).reshape(1, -1, 1)
+        z = asarray(z, dtype=float).reshape(1, 1, -1)
+        rv = zeros((x.size, y.size, z.size), dtype=bool)
+        for sx, sy, sz in self.sources:
+            rv |= sqrt((x - sx) ** 2 + (y - sy) ** 2 + (z - sz) ** 2) <= self.radius
+        rv.flags.writeable = False
         return rv
@@ -2,26 +2,45 @@ import warnings
 
 import numpy
 
+from collections import Counter
+from collections import deque
+
+from typing import Callable
 from typing import List
 from typing import Tuple 
 from typing import Union
 
+from concurrent.futures import ThreadPoolExecutor
+
+from threading import Lock
+
 from itertools import product
 
 from tqdm import tqdm
 
 from numpy import ndarray
-from numpy import array
+from numpy import arange
+from numpy import asarray
+from numpy import broadcast
+from numpy import broadcast_to
+from numpy import empty
+from numpy import errstate
 from numpy import zeros
+from numpy import where
+from numpy import isfinite
+from numpy import minimum
+from numpy import searchsorted
 from numpy import exp
 from numpy import log
 from numpy import power
 from numpy import pi
 from numpy import square
-from numpy import nanmean
+from numpy import sqrt
 
 from scipy.integrate import cumtrapz
 from scipy.integrate import romberg
+from scipy.special import erfc
+from scipy.special import erfcx
 
 from ridt.config import RIDTConfig
 from ridt.config import InstantaneousSource
@@ -39,6 +58,10 @@ Value = Union[ndarray, float]
 FloatList = List[float]
 
 MAX_IMAGE = 20
+IMAGE_TOLERANCE = 1e-10
+CUTOFF = 6.0
+SHIFT_TOLERANCE = 1e-9
+CHUNK_SIZE = 1 << 22
 
 
 class EddyDiffusion:
@@ -75,35 +98,89 @@ class EddyDiffusion:
     
     modes : :obj:`List`[:obj:`str`]
         The different string ids for the source modes.
+
+    strengths : :obj:`dict`
+        For each source mode, the name of the source setting that the
+        concentration is directly proportional to.
+
+    threads : :obj:`int`
+        The number of threads used to evaluate sources concurrently.
+
+    tile_size : :obj:`Union`[:obj:`int`, None]
+        The maximum number of cells along the longest axis of a grid that are
+        evaluated at once.
+
+    image_tables : :obj:`dict`
+        For each axis bound, the times up to which each number of image pairs
+        is sufficient in automatic image mode.
+
+    kernels : :obj:`dict`
+        For each source position shared by more than one release on the time
+        grid, a lock, the cached unit strength time series once computed, and
+        the number of releases still to use it.
+
+    step : :obj:`Union`[:obj:`float`, None]
+        The spacing of the current time domain array, if it is uniform.
     
     x : :class:`~numpy.ndarray`
-        The current x-axis meshgrid.
+        The current x-axis meshgrid, reduced to the axes it varies along.
 
     y : :class:`~numpy.ndarray`
-        The current y-axis meshgrid.
+        The current y-axis meshgrid, reduced to the axes it varies along.
 
     
     z : :class:`~numpy.ndarray`
-        The current z-axis meshgrid.
+        The current z-axis meshgrid, reduced to the axes it varies along.
     
     t : :obj:`List`[:obj:`float`]
         The current time domain array.
 
-    rv : :class:`~numpy.ndarray`
-        The calculated concentration values.
+    Note
+    ----
+    The kernel is a separable product in x, y and z, so the grids are stored
+    in their reduced (sparse meshgrid) form. The sums of images are then
+    evaluated on the axis vectors only, and the full grid is formed by
+    broadcasting when the three factors are multiplied together.
 
     """
 
-    def __init__(self, settings: RIDTConfig):
+    strengths = {
+        "instantaneous": "mass",
+        "infinite_duration": "rate",
+        "fixed_duration": "rate"
+    }
+
+    names = {
+        "instantaneous": "instanteneous",
+        "infinite_duration": "infinite duration",
+        "fixed_duration": "fixed duration"
+    }
+
+    def __init__(self, settings: RIDTConfig, threads: int = 1, tile_size: int = None,
+                 verbose: bool = True):
         """The :class:`EddyDiffusion` constructor.
 
         Parameters
         ----------
         settings : :class:`~.RIDTConfig`
             The settings for the run in question.
+
+        threads : :obj:`int`, optional
+            The number of threads used to evaluate sources concurrently. By
+            default the sources are evaluated serially.
+
+        tile_size : :obj:`int`, optional
+            The maximum number of cells along the longest axis of a grid that
+            are evaluated at once. By default grids are evaluated whole.
+
+        verbose : :obj:`bool`, optional
+            Whether the start of each source is logged. By default it is.
             
         """
         self.settings = settings
+        self.threads = threads
+        self.tile_size = tile_size
+        self.verbose = verbose
         self.dim = self.settings.dimensions
         self.disc = self.settings.spatial_samples
         self.volume = self.dim.x * self.dim.y * self.dim.z
@@ -114,8 +191,14 @@ class EddyDiffusion:
         }
         self.diff_coeff = self.diffusion_coefficient()
         self.modes = ["instantaneous", "infinite_duration", "fixed_duration"]
+        self.image_tables = {
+            bound: self.image_table(bound)
+            for bound in [self.dim.x, self.dim.y, self.dim.z]
+        }
+        self.kernels = dict()
+        self.step = None
 
-    def __call__(self, x: ndarray, y: ndarray,  z: ndarray, t: FloatList):
+    def __call__(self, x: ndarray, y: ndarray,  z: ndarray, t: FloatList, out: ndarray = None):
         """This call method is used to evaluate the model.
 
         Parameters
@@ -133,24 +216,480 @@ class EddyDiffusion:
         t : :obj:`List`[:obj:`float`]
             The current time domain array.
 
+        out : :class:`~numpy.ndarray`, optional
+            A preallocated array, with time as the leading axis, to write the
+            concentration values into. By default a new array is allocated.
+
         Returns
         -------
         :class:`~numpy.ndarray`
             The calculated concentration values.
 
+        Note
+        ----
+        If a tile size has been set, the grid is evaluated in slabs of at most
+        that many cells along its longest spatial axis, each written straight
+        into the output. Only the temporaries for one slab are held in memory
+        at once.
+
         """
-        self.get_grid_shape(x)
-        self.assign_grids(x, y, z, t)
+        shape = (len(t),) + broadcast(x, y, z).shape
+        rv = zeros(shape) if out is None else out
+
+        self.compute_tiles(x, y, z, t, [rv])
+
+        return rv
+
+    def superpose(self, x: ndarray, y: ndarray,  z: ndarray, t: FloatList,
+                  strengths: List[List[float]], out: List[ndarray] = None) -> List[ndarray]:
+        """Evaluates the model for several sets of source strengths at once.
+
+        The concentration is directly proportional to the mass or rate of each
+        source, so each source is evaluated once, at unit strength, and added
+        to every output scaled by its strength in that set. All other source
+        settings are taken from :attr:`settings`.
+
+        Parameters
+        ----------
+        x : :class:`~numpy.ndarray`
+            The current x-axis meshgrid.
+
+        y : :class:`~numpy.ndarray`
+            The current y-axis meshgrid.
+
+        z : :class:`~numpy.ndarray`
+            The current z-axis meshgrid.
+
+        t : :obj:`List`[:obj:`float`]
+            The current time domain array.
+
+        strengths : :obj:`List`[:obj:`List`[:obj:`float`]]
+            For each output, the strength of every source, in the order
+            returned by :meth:`get_strengths`.
+
+        out : :obj:`List`[:class:`~numpy.ndarray`], optional
+            Preallocated arrays, with time as the leading axis, to write the
+            concentration values of each set into. By default new arrays are
+            allocated.
+
+        Returns
+        -------
+        :obj:`List`[:class:`~numpy.ndarray`]
+            The calculated concentration values for each set of strengths.
+
+        """
+        shape = (len(t),) + broadcast(x, y, z).shape
+        rv = [zeros(shape) for _ in strengths] if out is None else out
+        self.compute_tiles(x, y, z, t, rv, strengths)
+        return rv
+
+    def get_strengths(self, settings: RIDTConfig) -> List[float]:
+        """Returns the mass or rate of every source, in evaluation order.
+
+        Parameters
+        ----------
+        settings : :class:`~.RIDTConfig`
+            The settings to take the sources from. They must have the same
+            sources as :attr:`settings`.
+
+        Returns
+        -------
+        :obj:`List`[:obj:`float`]
+            The strength of each source.
+
+        """
+        return [
+            getattr(source, EddyDiffusion.strengths[mode])
+            for mode in self.modes
+            for source in getattr(settings.modes, mode).sources.values()
+        ]
+
+    def compute_tiles(self, x: ndarray, y: ndarray,  z: ndarray, t: FloatList,
+                      out: List[ndarray], strengths: List[List[float]] = None) -> None:
+        """Evaluates the model into the output arrays, a slab at a time if a
+        tile size has been set.
+
+        Parameters
+        ----------
+        x : :class:`~numpy.ndarray`
+            The current x-axis meshgrid.
+
+        y : :class:`~numpy.ndarray`
+            The current y-axis meshgrid.
+
+        z : :class:`~numpy.ndarray`
+            The current z-axis meshgrid.
+
+        t : :obj:`List`[:obj:`float`]
+            The current time domain array.
+
+        out : :obj:`List`[:class:`~numpy.ndarray`]
+            The arrays to write the concentration values into.
 
-        self.rv = array(self.zero_arrays())
+        strengths : :obj:`List`[:obj:`List`[:obj:`float`]], optional
+            For each output, the strength of every source. By default there is
+            a single output and the sources are evaluated as configured.
 
-        for mode in self.modes:
-            self.sources = getattr(self.settings.modes, mode).sources
+        Returns
+        -------
+        None
+
+        Note
+        ----
+        When the sources are evaluated serially, the warnings raised by the
+        integrators are ignored here. Otherwise the caller should ignore them
+        around the whole evaluation, as the warning filters are shared by all
+        threads. Serial solvers called concurrently from inside such a caller,
+        as in :meth:`~.EddyDiffusionRun.solve`, only ever restore filters that
+        already ignore every warning.
+
+        """
+        def tiles() -> None:
+            # The grid is tiled along its longest spatial axis.
+            shape = out[0].shape[1:]
+            axis = max(range(len(shape)), key=shape.__getitem__, default=0)
+            if self.tile_size and shape and shape[axis] > self.tile_size:
+                for start in range(0, shape[axis], self.tile_size):
+                    index = slice(start, start + self.tile_size)
+                    grids = [self.tile(g, index, axis, len(shape))
+                             for g in [x, y, z]]
+                    slab = (slice(None),) * (axis + 1) + (index,)
+                    self.compute(*grids, t, [o[slab] for o in out], strengths)
+            else:
+                self.compute(x, y, z, t, out, strengths)
+
+        if self.threads == 1:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
-                getattr(self, f"{mode}")()
+                tiles()
+        else:
+            tiles()
+
+    def compute(self, x: ndarray, y: ndarray,  z: ndarray, t: FloatList,
+                out: List[ndarray], strengths: List[List[float]] = None) -> None:
+        """Evaluates the model for all sources into the output arrays.
+
+        Parameters
+        ----------
+        x : :class:`~numpy.ndarray`
+            The current x-axis meshgrid.
+
+        y : :class:`~numpy.ndarray`
+            The current y-axis meshgrid.
+
+        
+        z : :class:`~numpy.ndarray`
+            The current z-axis meshgrid.
+        
+        t : :obj:`List`[:obj:`float`]
+            The current time domain array.
+
+        out : :obj:`List`[:class:`~numpy.ndarray`]
+            The arrays to write the concentration values into.
+
+        strengths : :obj:`List`[:obj:`List`[:obj:`float`]], optional
+            For each output, the strength of every source. If given, each
+            source is evaluated at unit strength and scaled into every output.
+            By default there is a single output and the sources are evaluated
+            as configured.
+
+        Returns
+        -------
+        None
+
+        Note
+        ----
+        If more than one thread has been requested, the sources are evaluated
+        concurrently. Their contributions are still summed in the configured
+        order, so the result does not depend on the number of threads. No more
+        sources are in flight than there are threads, so at most that many
+        contributions are held in memory at once.
+
+        If :attr:`verbose` is set, the start of each source is logged from the
+        calling thread, in the configured order, before it is evaluated or
+        submitted to a thread.
+
+        """
+        self.get_grid_shape(x, y, z)
+        self.assign_grids(x, y, z, t)
+        self.step = self.get_step()
+
+        for rv in out:
+            rv.fill(0.0)
+
+        tasks = [
+            (getattr(self, mode), id, source)
+            for mode in self.modes
+            for id, source in getattr(self.settings.modes, mode).sources.items()
+        ]
+        if strengths is not None:
+            tasks = [(method, id, self.unit(source)) for method, id, source in tasks]
+        self.prepare_kernels(tasks)
+
+        def add(index: int, conc: ndarray) -> None:
+            if strengths is None:
+                out[0] += conc
+            else:
+                for rv, strength in zip(out, strengths):
+                    rv += strength[index] * conc
+
+        def call(method: Callable, id: str, source: Source) -> ndarray:
+            # The floating point error state is per thread, so it is set here.
+            with errstate(divide="ignore", invalid="ignore"):
+                return method(id, source)
+
+        def log(method: Callable, id: str, source: Source) -> None:
+            if self.verbose:
+                self.log_start(EddyDiffusion.names[method.__name__], id)
+
+        if self.threads > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                pending = deque()
+                for index, task in enumerate(tasks):
+                    log(*task)
+                    pending.append((index, executor.submit(call, *task)))
+                    if len(pending) == self.threads:
+                        done, future = pending.popleft()
+                        add(done, future.result())
+                for done, future in pending:
+                    add(done, future.result())
+        else:
+            for index, task in enumerate(tasks):
+                log(*task)
+                add(index, call(*task))
+        self.kernels = dict()
+
+    def get_step(self) -> Union[float, None]:
+        """Returns the spacing of :attr:`t` if it is uniform.
+
+        Returns
+        -------
+        :obj:`Union`[:obj:`float`, None]
+            The spacing, or None if there are fewer than two times or they are
+            not evenly spaced.
+
+        """
+        if len(self.t) < 2:
+            return None
+        step = self.t[1] - self.t[0]
+        expected = self.t[0] + step * arange(len(self.t))
+        if step <= 0 or abs(self.t - expected).max() > SHIFT_TOLERANCE * step:
+            return None
+        return step
+
+    def shift(self, release: float) -> Union[int, None]:
+        """The number of time steps from the start of :attr:`t` to a release.
+
+        Parameters
+        ----------
+        release : :obj:`float`
+            The source release/start time.
+
+        Returns
+        -------
+        :obj:`Union`[:obj:`int`, None]
+            The number of steps, or None if the time domain is not uniform or
+            the release is not on the time grid.
+
+        """
+        if self.step is None:
+            return None
+        steps = (release - self.t[0]) / self.step
+        index = int(round(steps))
+        if index < 0 or abs(steps - index) > SHIFT_TOLERANCE:
+            return None
+        return index
+
+    def releases(self, method: str, source: Source) -> List[float]:
+        """The release times for which a source uses :meth:`shifted`.
+
+        Parameters
+        ----------
+        method : :obj:`str`
+            The name of the source mode.
+
+        source : :class:`~.Source`
+            The source in question.
+
+        Returns
+        -------
+        :obj:`List`[:obj:`float`]
+            The release times.
+
+        """
+        if method == "instantaneous":
+            return [source.time]
+        if self.settings.integration_method in ["romberg", "analytic"]:
+            return []
+        if method == "infinite_duration":
+            return [source.time]
+        if self.duration(source) is not None:
+            return [source.start_time]
+        return [source.start_time, source.start_time + source.end_time]
+
+    def duration(self, source: FixedDurationSource) -> Union[int, None]:
+        """The number of time steps that a fixed duration source lasts for.
+
+        Parameters
+        ----------
+        source : :class:`~.FixedDurationSource`
+            The source in question.
+
+        Returns
+        -------
+        :obj:`Union`[:obj:`int`, None]
+            The number of steps, or None if the start or end of the source is
+            not on the time grid, or the integration method is not
+            ``"cumtrapz"``.
+
+        """
+        if self.settings.integration_method in ["romberg", "analytic"]:
+            return None
+        start = self.shift(source.start_time)
+        end = self.shift(source.start_time + source.end_time)
+        if start is None or end is None:
+            return None
+        return end - start
+
+    def prepare_kernels(self, tasks: List[Tuple]) -> None:
+        """Sets up :attr:`kernels` for the sources about to be evaluated.
+
+        Only positions with more than one release on the time grid get an
+        entry, so a kernel is never held for a single use.
+
+        Parameters
+        ----------
+        tasks : :obj:`List`[:obj:`Tuple`]
+            The method, id and source of every source to be evaluated.
+
+        Returns
+        -------
+        None
+
+        """
+        uses = Counter(
+            (source.x, source.y, source.z)
+            for method, _, source in tasks
+            for release in self.releases(method.__name__, source)
+            if self.shift(release) is not None
+        )
+        self.kernels = {
+            position: [Lock(), None, count]
+            for position, count in uses.items() if count > 1
+        }
+
+    def shifted(self, source: Source, release: float) -> ndarray:
+        """Evaluates the equation at every location, for all times since a
+        release.
+
+        The response of a source depends on its release time only through a
+        shift in time. If the release is on a uniform time grid and other
+        releases share the position of the source, the response to a release
+        at the start of :attr:`t` is computed once, cached in :attr:`kernels`
+        and shifted by the number of time steps to the release. The kernel is
+        released after its last use.
+
+        Parameters
+        ----------
+        source : :class:`~.Source`    
+            The source term in question.
+
+        release : :obj:`float`
+            The source release/start time.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The computed concentrations, with time as the leading axis, as
+            returned by :meth:`series`.
+
+        """
+        position = (source.x, source.y, source.z)
+        index = self.shift(release)
+        entry = self.kernels.get(position)
+        if index is None or entry is None:
+            return self.series(source, self.t - release)
+
+        with entry[0]:
+            if entry[1] is None:
+                entry[1] = self.series(source, self.t - self.t[0])
+            kernel = entry[1]
+            entry[2] -= 1
+            if not entry[2]:
+                self.kernels.pop(position)
+
+        return self.delay(kernel, index)
+
+    def delay(self, values: ndarray, steps: int) -> ndarray:
+        """Delays a time series of grids by a number of time steps.
+
+        Parameters
+        ----------
+        values : :class:`~numpy.ndarray`
+            The time series, with time as the leading axis.
+
+        steps : :obj:`int`
+            The number of time steps to delay by.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            A new time series, zero for the first number of steps.
+
+        """
+        rv = zeros(values.shape)
+        if steps < len(values):
+            rv[steps:] = values[:len(values) - steps]
+        return rv
+
+    @staticmethod
+    def unit(source: Source) -> Source:
+        """Returns a copy of a source with unit mass or rate.
+
+        Parameters
+        ----------
+        source : :class:`~.Source`
+            The source to be copied.
+
+        Returns
+        -------
+        :class:`~.Source`
+            The copy of the source.
 
-        return self.rv
+        """
+        name = "mass" if isinstance(source, InstantaneousSource) else "rate"
+        return type(source)({**source.__source__, name: 1.0})
+
+    def tile(self, grid: ndarray, index: slice, axis: int, ndim: int) -> ndarray:
+        """Selects a slab of a meshgrid along one axis.
+
+        Parameters
+        ----------
+        grid : :class:`~numpy.ndarray`
+            The meshgrid, which may be full or sparse.
+
+        index : :obj:`slice`
+            The slice of the axis to select.
+
+        axis : :obj:`int`
+            The axis to select along, in the broadcast grid.
+
+        ndim : :obj:`int`
+            The number of dimensions of the broadcast grid.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            A view of the slab. Grids that are constant along the axis are
+            returned unchanged.
+
+        """
+        grid = asarray(grid)
+        # Broadcasting aligns the trailing axes of the grids.
+        axis -= ndim - grid.ndim
+        if axis < 0 or grid.shape[axis] == 1:
+            return grid
+        return grid[(slice(None),) * axis + (index,)]
     
     def assign_grids(self, x: ndarray, y: ndarray,  z: ndarray, t: FloatList) -> None:
         """Assign the meshgrids to the relevant attributes.
@@ -175,18 +714,18 @@ class EddyDiffusion:
         None
 
         """
-        self.x = x
-        self.y = y
-        self.z = z
-        self.t = t
+        self.x = self.separate(x)
+        self.y = self.separate(y)
+        self.z = self.separate(z)
+        self.t = asarray(t, dtype=float)
     
-    def get_grid_shape(self, grid: ndarray) -> Tuple[int]:
-        """Returns the shape of the passed grid.
+    def get_grid_shape(self, *grids: ndarray) -> Tuple[int]:
+        """Returns the shape of the passed grids once broadcast together.
 
         Parameters
         ----------
-        grid : :class:`~numpy.ndarray`
-            The grid to be assessed.
+        grids : :class:`~numpy.ndarray`
+            The grids to be assessed. These may be full or sparse meshgrids.
         
         Returns
         -------
@@ -194,7 +733,36 @@ class EddyDiffusion:
             The shape of the grid.
 
         """
-        self.shape = grid.shape
+        self.shape = broadcast(*grids).shape
+
+    def separate(self, grid: ndarray) -> ndarray:
+        """Reduces a meshgrid to the axes along which it varies.
+
+        Every axis along which the grid is constant is collapsed to length one,
+        so a full meshgrid becomes the equivalent sparse meshgrid. Sparse grids
+        are returned unchanged.
+
+        Parameters
+        ----------
+        grid : :class:`~numpy.ndarray`
+            The grid to be reduced.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            A view of the grid that broadcasts back to its original shape.
+
+        """
+        grid = asarray(grid, dtype=float)
+        for axis in range(grid.ndim):
+            if grid.shape[axis] == 1:
+                continue
+            index = [slice(None)] * grid.ndim
+            index[axis] = slice(0, 1)
+            first = grid[tuple(index)]
+            if (grid == first).all():
+                grid = first
+        return grid
     
     def get_cartesian_index_space(self):
         """Generate a cartesian product set of all grid indices.
@@ -229,7 +797,10 @@ class EddyDiffusion:
             
         """
         index = (idx, idy, idz)
-        return self.x[index], self.y[index], self.z[index]
+        x = broadcast_to(self.x, self.shape)
+        y = broadcast_to(self.y, self.shape)
+        z = broadcast_to(self.z, self.shape)
+        return x[index], y[index], z[index]
 
     @property
     def time(self):
@@ -275,13 +846,13 @@ class EddyDiffusion:
         integrand = lambda tin: self.conc(source, x, y, z, tin)
         return romberg(integrand, 1e-100, time, tol=1e-100)
     
-    def pointwise(self, source: Source, time: float) -> ndarray:
+    def pointwise(self, source: Source, time: Value) -> ndarray:
         """Evaluates the equation pointwise at every location in the meshgrids.
 
         Parameters
         ----------
-        time : :obj:`float`
-            The time to integrate to.
+        time : :class:`~.Value`
+            The time, or array of times, since the source was released.
 
         source : :class:`~.Source`    
             The source term in question.
@@ -289,11 +860,37 @@ class EddyDiffusion:
         Returns
         -------
         :class:`~numpy.ndarray`
-            The array containing the computed concentrations.
+            The array containing the computed concentrations. If an array of
+            times is passed, time is the leading axis.
         """
         return self.conc(source, self.x, self.y, self.z, time)
 
-    def evaluate(self, rtime: float, idt: int, conc: List[ndarray], source: Source):
+    def series(self, source: Source, rtime: ndarray) -> ndarray:
+        """Evaluates the equation at every location for all times at once.
+
+        Times at which the source has not yet been released are left as zero.
+
+        Parameters
+        ----------
+        source : :class:`~.Source`    
+            The source term in question.
+
+        rtime : :class:`~numpy.ndarray`
+            The times relative to the source release/start time.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The computed concentrations, with time as the leading axis.
+
+        """
+        rv = self.zero_arrays()
+        released = rtime > 0
+        if released.any():
+            rv[released] = self.pointwise(source, rtime[released])
+        return rv
+
+    def evaluate(self, rtime: ndarray, source: Source, release: float = None) -> ndarray:
         """Calls the relevant method for evaluating the equations.
     
         Different methods are called depending on the integration method
@@ -301,37 +898,45 @@ class EddyDiffusion:
 
         Parameters
         ----------
-        rtime : :obj:`float`
-            The time relative to the source release/start time.
-
-        idt : :obj:`int`
-            The absolute time index.
-
-        conc : :class:`List`[:class:`~numpy.ndarray`]
-            The list of grids to store the computed values in.
+        rtime : :class:`~numpy.ndarray`
+            The times relative to the source release/start time.
 
         source : :class:`~.Source`
             The source being evaluated.
+
+        release : :obj:`float`, optional
+            The time that :obj:`rtime` is relative to. If given, the
+            pointwise time series is taken from :meth:`shifted`, and may be
+            shared with other releases from the same position.
             
         Returns
         -------
-        None
+        :class:`~numpy.ndarray`
+            The computed values, with time as the leading axis.
 
         """
-
-        if self.settings.integration_method == "romberg":
-            for item in self.get_cartesian_index_space():
-                conc[idt][item] += source.rate * self.romberg(rtime, source, *item)
+        if self.settings.integration_method == "analytic":
+            return source.rate * self.analytic(rtime, source)
+        elif self.settings.integration_method == "romberg":
+            conc = self.zero_arrays()
+            for idt, time in self.time:
+                if rtime[idt] > 0:
+                    for item in self.get_cartesian_index_space():
+                        conc[idt][item] += source.rate *\
+                            self.romberg(rtime[idt], source, *item)
+            return conc
         else:
-            conc[idt] += source.rate * self.pointwise(source, rtime)
+            if release is not None:
+                return source.rate * self.shifted(source, release)
+            return source.rate * self.series(source, rtime)
     
-    def process(self, conc: List[ndarray]) -> ndarray:
+    def process(self, conc: ndarray) -> ndarray:
         """Perform the integration method dependent post processing. 
 
         Parameters
         ----------
-        conc : :class:`List`[:class:`~numpy.ndarray`]
-            The list of grids to store the computed values in.
+        conc : :class:`~numpy.ndarray`
+            The computed values, with time as the leading axis.
 
         Returns
         -------
@@ -339,11 +944,160 @@ class EddyDiffusion:
             The final grids to be added to the total.
 
         """
-        if self.settings.integration_method == "romberg":
-            return array(conc)
+        if self.settings.integration_method in ["romberg", "analytic"]:
+            return conc
         else:
-            return cumtrapz(array(conc), **self.cumtrapz_kwargs)
+            return cumtrapz(conc, **self.cumtrapz_kwargs)
     
+    def analytic(self, rtime: ndarray, source: Source) -> ndarray:
+        """Evaluates the time integral of the equation in closed form.
+
+        The product of the three sums of images is expanded into a sum over
+        every combination of x, y, and z images, and each term is integrated
+        exactly from zero to the given time. Combinations that are further
+        from every grid location than :data:`CUTOFF` diffusion lengths
+        (evaluated at the latest time) contribute nothing at double precision
+        and are skipped.
+
+        The closed form is singular at a grid location that coincides with
+        the source or one of its images. The integrals at such locations are
+        instead taken from :meth:`trapezoid`, as they would be for the
+        ``cumtrapz`` integration method.
+
+        Parameters
+        ----------
+        rtime : :class:`~numpy.ndarray`
+            The times relative to the source release/start time.
+
+        source : :class:`~.Source`    
+            The source term in question.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The integrated concentrations per unit release rate, with time as
+            the leading axis. Times at which the source has not yet been
+            released are left as zero.
+
+        """
+        rv = self.zero_arrays()
+        released = rtime > 0
+        if not released.any():
+            return rv
+
+        t = self.temporal(rtime[released])
+        cutoff = square(CUTOFF) * 4 * self.diff_coeff * t.max()
+
+        total = zeros((len(t),) + self.shape)
+        for dx in self.images(self.x, self.dim.x, source.x, cutoff):
+            x_cutoff = cutoff - dx.min()
+            for dy in self.images(self.y, self.dim.y, source.y, x_cutoff):
+                y_cutoff = x_cutoff - dy.min()
+                for dz in self.images(self.z, self.dim.z, source.z, y_cutoff):
+                    total += self.integral(sqrt(dx + dy + dz), t)
+
+        rv[released] = total
+        singular = ~isfinite(total).all(axis=0)
+        if singular.any():
+            rv[:, singular] = self.trapezoid(rtime, source, singular)
+        return rv
+
+    def trapezoid(self, rtime: ndarray, source: Source, cells: ndarray) -> ndarray:
+        """Integrates the equation over time at some grid locations using the
+        trapezoid rule.
+
+        Parameters
+        ----------
+        rtime : :class:`~numpy.ndarray`
+            The times relative to the source release/start time.
+
+        source : :class:`~.Source`
+            The source term in question.
+
+        cells : :class:`~numpy.ndarray`
+            A boolean mask, with the shape of the grid, of the locations to
+            be integrated.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The integrated concentrations per unit release rate, with time as
+            the leading axis and the selected locations along the second.
+
+        """
+        x, y, z = [broadcast_to(g, self.shape)[cells] for g in [self.x, self.y, self.z]]
+        conc = zeros((len(rtime), len(x)))
+        released = rtime > 0
+        if released.any():
+            values = self.conc(source, x, y, z, rtime[released])
+            conc[released] = values.reshape(len(values), -1)
+        return cumtrapz(conc, **self.cumtrapz_kwargs)
+
+    def images(self, pos: ndarray, bound: float, spos: float, cutoff: float) -> List[ndarray]:
+        """The squared distances from the grid to each image of the source.
+
+        Parameters
+        ----------
+        pos : :class:`~numpy.ndarray`
+            The position.
+
+        bound : :obj:`float`
+            The upper spatial bound.
+
+        spos : :obj:`float`
+            The source position.
+
+        cutoff : :obj:`float`
+            The squared distance beyond which images are discarded.
+
+        Returns
+        -------
+        :obj:`List`[:class:`~numpy.ndarray`]
+            The squared distances, one grid per image within the cutoff.
+
+        """
+        image_setting = self.settings.models.eddy_diffusion.images
+
+        if image_setting.mode == "manual":
+            quantity = image_setting.quantity
+        else:
+            quantity = MAX_IMAGE
+
+        rv = []
+        for idx in range(-quantity, quantity + 1):
+            for sign in [-1, 1]:
+                distance = square(pos + 2 * idx * bound + sign * spos)
+                if distance.min() <= cutoff:
+                    rv.append(distance)
+        return rv
+
+    def integral(self, r: ndarray, t: ndarray) -> ndarray:
+        """The time integral of a single image term from zero to time t.
+
+        Parameters
+        ----------
+        r : :class:`~numpy.ndarray`
+            The distance from the image to each grid location.
+
+        t : :class:`~numpy.ndarray`
+            The times, shaped to broadcast against the grid.
+
+        Returns
+        -------
+        :class:`~numpy.ndarray`
+            The integrated value, with time as the leading axis.
+
+        """
+        fa_rate = self.settings.fresh_air_flow_rate
+        u = r / sqrt(4 * self.diff_coeff * t)
+        if not fa_rate:
+            return erfc(u) / (4 * pi * self.diff_coeff * r)
+        decay = fa_rate / self.volume
+        v = sqrt(decay * t)
+        num = exp(-r * sqrt(decay / self.diff_coeff)) * erfc(u - v) +\
+            erfcx(u + v) * exp(-square(u) - square(v))
+        return num / (8 * pi * self.diff_coeff * r)
+
     def log_start(self, name: str, id: str) -> None:
         """Print a log message the evaluation of a grid has started.
 
@@ -362,60 +1116,73 @@ class EddyDiffusion:
         """
         print(f"Evaluating {name} source (id: {id}) for each time...") 
 
-    def instantaneous(self): 
-        """Evaluate all instanteneous sources.
+    def instantaneous(self, id: str, source: InstantaneousSource) -> ndarray: 
+        """Evaluate an instanteneous source.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The source id string.
+
+        source : :class:`~.InstantaneousSource`
+            The source being evaluated.
 
         Returns
         -------
-        None
+        :class:`~numpy.ndarray`
+            The contribution of the source to the concentration.
 
         """
-        for id, source in self.sources.items():
-            conc = self.zero_arrays()
-            self.log_start("instanteneous", id)
-            for idt, time in self.time:
-                stime = time - source.time
-                if stime > 0:
-                    conc[idt] += source.mass * self.pointwise(source, stime)
-            self.rv += array(conc)
+        return source.mass * self.shifted(source, source.time)
  
-    def infinite_duration(self):
-        """Evaluate all infinite duration sources.
+    def infinite_duration(self, id: str, source: InfiniteDurationSource) -> ndarray:
+        """Evaluate an infinite duration source.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The source id string.
+
+        source : :class:`~.InfiniteDurationSource`
+            The source being evaluated.
 
         Returns
         -------
-        None
+        :class:`~numpy.ndarray`
+            The contribution of the source to the concentration.
 
         """
-        for id, source in self.sources.items():
-            conc = self.zero_arrays()
-            self.log_start("infinite duration", id)
-            for idt, time in self.time:
-                stime = time - source.time
-                if stime > 0:
-                    self.evaluate(stime, idt, conc, source)
-            self.rv += self.process(conc)
+        stime = self.t - source.time
+        return self.process(self.evaluate(stime, source, source.time))
     
-    def fixed_duration(self):
-        """Evaluate all fixed duration sources.
+    def fixed_duration(self, id: str, source: FixedDurationSource) -> ndarray:
+        """Evaluate a fixed duration source.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The source id string.
+
+        source : :class:`~.FixedDurationSource`
+            The source being evaluated.
 
         Returns
         -------
-        None
+        :class:`~numpy.ndarray`
+            The contribution of the source to the concentration.
 
         """
-        for id, source in self.sources.items():
-            conc = self.zero_arrays()
-            conc_decay = self.zero_arrays()
-            self.log_start("fixed duration", id)
-            for idt, time in self.time:
-                stime = time - source.start_time
-                etime = time - source.start_time - source.end_time
-                if stime > 0:
-                    self.evaluate(stime, idt, conc, source)
-                if etime > 0:
-                    self.evaluate(etime, idt, conc_decay, source)
-            self.rv += self.process(conc) - self.process(conc_decay)
+        stime = self.t - source.start_time
+        etime = self.t - source.start_time - source.end_time
+        end = source.start_time + source.end_time
+        conc = self.process(self.evaluate(stime, source, source.start_time))
+        steps = self.duration(source)
+        if steps is None:
+            conc -= self.process(self.evaluate(etime, source, end))
+        else:
+            # The source stopping is the same response delayed by its duration.
+            conc -= self.delay(conc, steps)
+        return conc
     
     def conc(self, source: Source, x: Value, y: Value, z: Value, t: float) -> Value:
         """Evaluate various the model at a given location, time and source.
@@ -434,20 +1201,41 @@ class EddyDiffusion:
         z : :class:`~.Value`
             The z value.
 
-        t : :obj:`float`
-            the time value
+        t : :class:`~.Value`
+            the time value, or a 1D array of time values.
 
         Returns
         -------
         :class:`~.Value`
-            The calculated concentration.
+            The calculated concentration. If an array of times is passed, time
+            is the leading axis.
         """
+        t = self.temporal(t)
         r_x = self.exp(x, t, self.dim.x, source.x)
         r_y = self.exp(y, t, self.dim.y, source.y)
         r_z = self.exp(z, t, self.dim.z, source.z)
         return self.coefficient(t) * r_x * r_y * r_z
 
-    def exp(self, pos: Value, time: float, bound: float, spos: float) -> Value:
+    def temporal(self, t: Value) -> Value:
+        """Reshapes an array of times so that it broadcasts against the grids.
+
+        Parameters
+        ----------
+        t : :class:`~.Value`
+            The time value, or a 1D array of time values.
+
+        Returns
+        -------
+        :class:`~.Value`
+            The time value unchanged, or the array of times with a trailing
+            unit axis for each spatial dimension.
+
+        """
+        if isinstance(t, ndarray) and t.ndim:
+            return t.reshape(t.shape + (1, 1, 1))
+        return t
+
+    def exp(self, pos: Value, time: Value, bound: float, spos: float) -> Value:
         """The sum of exponentials in the Eddy diffusion model.
 
         Parameters
@@ -455,8 +1243,9 @@ class EddyDiffusion:
         pos : :class:`~.Value`
             The position.
 
-        t : :obj:`float`
-            The time.
+        time : :class:`~.Value`
+            The time. If an array of times is passed, time must be the leading
+            axis and the number of images is chosen separately for each time.
 
         bound : :obj:`float`
             The upper spatial bound.
@@ -468,55 +1257,93 @@ class EddyDiffusion:
         -------
         :class:`~.Value`
             The calculated value.
+
+        Note
+        ----
+        Every image term is formed before the terms are summed. If there would
+        be more than :data:`CHUNK_SIZE` of them, the sum is evaluated for a
+        block of times at once instead.
         
         """
-
-        image_setting = self.settings.models.eddy_diffusion.images
+        count = self.image_count(time, bound)
+        shape = broadcast(pos, time).shape
+        size = (2 * numpy.max(count) + 1) * numpy.prod(shape, dtype=int)
+
+        if size > CHUNK_SIZE and shape and shape[0] > 1:
+            def block(value: Value, index: slice) -> Value:
+                value = asarray(value)
+                if value.ndim == len(shape) and value.shape[0] > 1:
+                    return value[index]
+                return value
+
+            step = max(1, CHUNK_SIZE * shape[0] // size)
+            rv = empty(shape)
+            for start in range(0, shape[0], step):
+                index = slice(start, start + step)
+                rv[index] = self.exp(block(pos, index), block(time, index),
+                                     bound, spos)
+            return rv
+
+        index = arange(-numpy.max(count), numpy.max(count) + 1)
+        index = index.reshape(index.shape + (1,) * len(shape))
 
         term = lambda x: exp(-power(x, 2) / (4 * self.diff_coeff * time))
-        exp_arg = lambda x: pos + 2 * x * bound
-        image = lambda x: term(exp_arg(x) - spos) + term(exp_arg(x) + spos)
+        exp_arg = pos + 2 * index * bound
+        images = term(exp_arg - spos) + term(exp_arg + spos)
 
-        image_index = 0
+        return where(abs(index) <= count, images, 0.0).sum(axis=0)
 
-        rv = 0.0 if type(pos) is float else zeros(pos.shape)
+    def image_count(self, time: Value, bound: float) -> Value:
+        """The number of image pairs needed along an axis at the given time.
 
-        rv += image(image_index)
+        In manual mode this is the configured quantity. Otherwise it is read
+        from the image table for the axis.
+
+        Parameters
+        ----------
+        time : :class:`~.Value`
+            The time, or array of times.
+
+        bound : :obj:`float`
+            The upper spatial bound.
+
+        Returns
+        -------
+        :class:`~.Value`
+            The number of image pairs, with the same shape as the time.
+
+        """
+        image_setting = self.settings.models.eddy_diffusion.images
 
         if image_setting.mode == "manual":
-            if image_setting.quantity:
-                image_index = image_setting.quantity
-                for idx in range(1, image_index + 1):
-                    rv += image(idx) + image(-idx)
+            return image_setting.quantity
         else:
-            while image_index < MAX_IMAGE:
-                image_index += 1
-                new_term = 0.0 if type(pos) is float else zeros(pos.shape)
-                new_term += image(image_index) + image(-image_index)
-                if self.geometric_variance(rv, rv + new_term) < 1 + 1e-10:
-                    rv += new_term
-                    break
-                rv += new_term
-        return rv
-    
-    def geometric_variance(self, old: Value, new: Value) -> float:
-        """Calculate the geometric variance between two grids (or numbers)
+            count = searchsorted(self.image_tables[bound], time) + 1
+            return minimum(count, MAX_IMAGE)
+
+    def image_table(self, bound: float) -> ndarray:
+        """Computes the times up to which each number of images is sufficient.
+
+        Every image left out after the first n pairs is at least 2nL from any
+        point in the domain, while the nearest image is at most L away. The
+        ratio of their terms is therefore below :data:`IMAGE_TOLERANCE` for
+        all times up to (4n^2 - 1)L^2 / (4K ln(1/tol)).
 
         Parameters
         ----------
-        old : :class:`~.Value`
-            The old values.
-
-        new : :class:`~.Value`
-            The new values.
+        bound : :obj:`float`
+            The upper spatial bound.
 
         Returns
         -------
-        :obj:`float` 
-            The geometric variance.
+        :class:`~numpy.ndarray`
+            The time limit for 1 to :data:`MAX_IMAGE` image pairs.
 
         """
-        return exp(nanmean(square(log(old)-log(new))))
+        n = arange(1, MAX_IMAGE + 1)
+        num = (4 * square(n) - 1) * square(bound)
+        den = 4 * self.diff_coeff * log(1 / IMAGE_TOLERANCE)
+        return num / den
 
     def coefficient(self, t: float) -> float:
         """Computes the temporal decay coefficient.
@@ -565,12 +1392,13 @@ class EddyDiffusion:
                 return max(0.822 * tkeb_term - 0.0565, 0.001)
 
     def zero_arrays(self):
-        """Creates new time series lists of grids filed with zeros.
+        """Creates a new time series of grids filled with zeros.
 
         Returns
         -------
-        :class:`List`[:class:`~numpy.ndarray`]
-            The list of grids to store the computed values in.
+        :class:`~numpy.ndarray`
+            The array to store the computed values in, with time as the
+            leading axis.
 
         """
-        return [zeros(self.shape) for i in range(self.settings.time_samples)]
+        return zeros((len(self.t),) + self.shape)
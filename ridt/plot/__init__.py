@@ -3,3 +3,5 @@ from .pointplot import PointPlot
 from .contourplot import ContourPlot
 
 from .lineplot import LinePlot
+
+from .framewriter import FrameWriter
@@ -15,6 +15,8 @@ from ridt.config import Units
 
 from ridt.container import Domain
 
+from .framewriter import FrameWriter
+
 from matplotlib import cm, ticker
 from matplotlib import colors
 
@@ -47,8 +49,20 @@ class ContourPlot:
     outdir: :obj:`str`
         The path to the output directory for the run.
 
+    reuse : :obj:`bool`
+        Whether the figure of a plane is kept between calls, and only the
+        contours are redrawn for each time.
+
+    figure : :obj:`Union`[:class:`~matplotlib.figure.Figure`, None]
+        The current figure, if any.
+
+    frames : :obj:`Union`[:class:`~.FrameWriter`, None]
+        The writer that collects the frames of each plane into a single file,
+        if any.
+
     """
-    def __init__(self, settings: RIDTConfig, output_dir: str, quantity: str):
+    def __init__(self, settings: RIDTConfig, output_dir: str, quantity: str,
+                 reuse: bool = False, frames: str = None):
         """The :class:`~.ContourPlot` constructor.
 
         Parameters
@@ -62,6 +76,16 @@ class ContourPlot:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        reuse : :obj:`bool`, optional
+            Whether the figure, axes, colour bar and levels of a plane are
+            created once and reused for each time, with a fixed layout. By
+            default a new figure is created for each call.
+
+        frames : :obj:`str`, optional
+            The format of a single file into which all the frames of each
+            plane are written, either ``"gif"`` or ``"pdf"``. By default each
+            frame is saved as a separate PNG.
+
         """
         self.settings = settings
         self.output_dir = output_dir
@@ -69,6 +93,10 @@ class ContourPlot:
         self.domain = Domain(self.settings)
         self.quantity = quantity
         self.config = self.settings.models.eddy_diffusion.planes_plots
+        self.reuse = reuse
+        self.figure = None
+        self.frame = None
+        self.frames = FrameWriter(output_dir, frames) if frames else None
 
     def __call__(self, id: str, data: ndarray, max_val: float, t_index: int) -> None:
         """The call method used to plot some data.
@@ -95,9 +123,14 @@ class ContourPlot:
         self.figsize = self.get_figsize()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            self.plot(data)
+            if self.reuse and self.frame == (id, max_val):
+                self.update(data)
+            else:
+                self.close_figure()
+                self.plot(data)
         self.save_fig()
-        plt.close()
+        if not self.reuse:
+            self.close_figure()
 
     def plot(self, data: ndarray):
         """Calls various plotting functions.
@@ -109,41 +142,91 @@ class ContourPlot:
 
         """
 
-        figure(num=None, figsize=self.figsize, dpi=120, facecolor='w', edgecolor='k')
+        self.figure = figure(num=None, figsize=self.figsize, dpi=120, facecolor='w', edgecolor='k')
+        self.frame = (self.id, self.max_val)
 
         plt.title(self.title())
         plt.xlabel(self.xlabel())
         plt.ylabel(self.ylabel())
 
         if self.config.scale == "logarithmic":
-            levels = self.get_log_scale()
-            kwargs = {"extend": "both", "norm": colors.LogNorm()}
+            self.levels = self.get_log_scale()
+            self.kwargs = {"extend": "both", "norm": colors.LogNorm()}
         else:
-            levels = self.get_linear_scale()
-            kwargs = {}
+            self.levels = self.get_linear_scale()
+            self.kwargs = {}
 
-        plt.contourf(
+        self.axes = plt.gca()
+        self.contours = self.axes.contourf(
             self.get_xdomain(),
             self.get_ydomain(),
             transpose(data), 
-            levels,
+            self.levels,
             cmap=cm.RdBu_r,
-            **kwargs)
+            **self.kwargs)
 
         if self.config.scale == "logarithmic":
             formatter = LogFormatter(10, labelOnlyBase=False, minor_thresholds=(1, 5))
-            cb = plt.colorbar(ticks=self.get_log_scale(), format=formatter, )
+            cb = plt.colorbar(self.contours, ticks=self.get_log_scale(), format=formatter, )
             cb.ax.yaxis.set_major_formatter((FormatStrFormatter('%.2e')))
         else:
-            plt.colorbar()
+            plt.colorbar(self.contours)
 
         plt.tight_layout()
 
+    def update(self, data: ndarray):
+        """Redraws the contours and title of the current figure.
+
+        The axes, colour bar, levels and layout are left as they are. The
+        contours are drawn with a copy of the first norm, so that the colour
+        bar, which listens to that norm, keeps its ticks and labels.
+
+        Parameters
+        ----------
+        data : :class:`~numpy.ndarray`
+            The array of values to be plot.
+
+        """
+        self.axes.set_title(self.title())
+        norm = self.contours.norm
+        self.contours.remove()
+        self.contours = self.axes.contourf(
+            self.get_xdomain(),
+            self.get_ydomain(),
+            transpose(data),
+            self.levels,
+            cmap=cm.RdBu_r,
+            extend=self.contours.extend,
+            norm=type(norm)(norm.vmin, norm.vmax))
+
+    def close_figure(self):
+        """Closes the current figure, if any.
+
+        """
+        if self.figure is not None:
+            plt.close(self.figure)
+        self.figure = None
+        self.frame = None
+
+    def close(self):
+        """Closes the current figure and writes any collected frames.
+
+        """
+        self.close_figure()
+        if self.frames is not None:
+            self.frames.close()
+
     def save_fig(self):
         """Creates the formatted string file name and saves plot to disk.
 
+        If frames are collected, the plot is instead added to the file of the
+        current monitor location.
+
         """
-        plt.savefig(join(self.output_dir, f"{self.id}-{self.domain.time[self.t_index]:.2f}s.png"))
+        if self.frames is not None:
+            self.frames.add(self.id, self.figure)
+            return
+        self.figure.savefig(join(self.output_dir, f"{self.id}-{self.domain.time[self.t_index]:.2f}s.png"))
 
     def title(self):
         """Creates formatted title string for the current plot.
@@ -0,0 +1,118 @@
+from os.path import join
+
+from PIL import Image
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
+
+
+FRAME_DURATION = 500
+"""The display time of each frame of an animation, in milliseconds."""
+
+
+class FrameWriter:
+    """The class that streams the frames of a monitor location into a single
+    file.
+
+    Every frame of a monitor location is added to the same file, either an
+    animated GIF or a multi-page PDF, which is written when the next monitor
+    location is started or the writer is closed. Both formats are written in
+    process, without an external encoder.
+
+    Attributes
+    ----------
+    output_dir : :obj:`str`
+        The path to the output directory.
+
+    format : :obj:`str`
+        The file format, either ``"gif"`` or ``"pdf"``.
+
+    id : :obj:`Union`[:obj:`str`, None]
+        The id string of the current monitor location, if any.
+
+    frames : :obj:`Union`[:obj:`List`[:class:`~PIL.Image.Image`], :class:`~matplotlib.backends.backend_pdf.PdfPages`, None]
+        The frames of the current GIF, or the open PDF, if any.
+
+    """
+
+    formats = ["gif", "pdf"]
+
+    def __init__(self, output_dir: str, format: str):
+        """The :class:`~.FrameWriter` constructor.
+
+        Parameters
+        ----------
+        output_dir : :obj:`str`
+            The path to the output directory.
+
+        format : :obj:`str`
+            The file format, either ``"gif"`` or ``"pdf"``.
+
+        """
+        self.output_dir = output_dir
+        self.format = format
+        self.id = None
+        self.frames = None
+
+    def add(self, id: str, figure: Figure) -> None:
+        """Adds the current state of a figure as the next frame of a monitor
+        location.
+
+        Parameters
+        ----------
+        id : :obj:`str`
+            The id string of the monitor location.
+
+        figure : :class:`~matplotlib.figure.Figure`
+            The figure to be added.
+
+        Returns
+        -------
+        None
+
+        """
+        if id != self.id:
+            self.close()
+            self.id = id
+            if self.format == "pdf":
+                self.frames = PdfPages(self.path())
+            else:
+                self.frames = list()
+
+        if self.format == "pdf":
+            self.frames.savefig(figure)
+        else:
+            buffer, size = figure.canvas.print_to_buffer()
+            image = Image.frombuffer("RGBA", size, buffer, "raw", "RGBA", 0, 1)
+            # Frames are held with a palette, which is all a GIF can store.
+            self.frames.append(image.convert("RGB").quantize())
+
+    def close(self) -> None:
+        """Writes and closes the file of the current monitor location, if any.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.format == "pdf" and self.frames is not None:
+            self.frames.close()
+        elif self.frames:
+            self.frames[0].save(self.path(),
+                                save_all=True,
+                                append_images=self.frames[1:],
+                                duration=FRAME_DURATION,
+                                loop=0)
+        self.id = None
+        self.frames = None
+
+    def path(self) -> str:
+        """Returns the path to the file of the current monitor location.
+
+        Returns
+        -------
+        :obj:`str`
+            The path to the file.
+
+        """
+        return join(self.output_dir, f"{self.id}.{self.format}")
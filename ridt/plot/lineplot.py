@@ -9,6 +9,8 @@ from ridt.config import Units
 
 from ridt.container import Domain
 
+from .framewriter import FrameWriter
+
 import matplotlib.pyplot as plt
 
 
@@ -35,9 +37,21 @@ class LinePlot:
     outdir: :obj:`str`
         The path to the output directory for the run.
 
+    reuse : :obj:`bool`
+        Whether the figure of a line is kept between calls, and only the data
+        is updated for each time.
+
+    figure : :obj:`Union`[:class:`~matplotlib.figure.Figure`, None]
+        The current figure, if any.
+
+    frames : :obj:`Union`[:class:`~.FrameWriter`, None]
+        The writer that collects the frames of each line into a single file,
+        if any.
+
     """
 
-    def __init__(self, settings: RIDTConfig, output_dir: str, quantity: str):
+    def __init__(self, settings: RIDTConfig, output_dir: str, quantity: str,
+                 reuse: bool = False, frames: str = None):
         """The :class:`~.LinePlot` constructor.
 
         Parameters
@@ -51,6 +65,16 @@ class LinePlot:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        reuse : :obj:`bool`, optional
+            Whether the figure and axes of a line are created once and reused
+            for each time, with a fixed layout. By default a new figure is
+            created for each call.
+
+        frames : :obj:`str`, optional
+            The format of a single file into which all the frames of each
+            line are written, either ``"gif"`` or ``"pdf"``. By default each
+            frame is saved as a separate PNG.
+
         """
         self.settings = settings
         self.output_dir = output_dir
@@ -58,6 +82,10 @@ class LinePlot:
         self.domain = Domain(self.settings)
         self.quantity = quantity
         self.config = self.settings.models.eddy_diffusion.lines_plots
+        self.reuse = reuse
+        self.figure = None
+        self.frame = None
+        self.frames = FrameWriter(output_dir, frames) if frames else None
 
     def __call__(self, id: str, data: ndarray, max_val: float, t_index: int) -> None:
         """The call method used to plot some data.
@@ -83,10 +111,15 @@ class LinePlot:
         self.axis = self.get_axis()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            self.plot(data)
-            plt.tight_layout()
+            if self.reuse and self.frame == id:
+                self.update(data)
+            else:
+                self.close_figure()
+                self.plot(data)
+                plt.tight_layout()
             self.save_fig()
-            plt.close()
+            if not self.reuse:
+                self.close_figure()
 
     def plot(self, data: ndarray):
         """Calls various plotting functions.
@@ -97,6 +130,8 @@ class LinePlot:
             The array of values to be plot.
 
         """
+        self.figure = plt.figure()
+        self.frame = self.id
         plt.title(self.title())
         plt.xlabel(self.xlabel())
         plt.ylabel(self.ylabel())
@@ -105,13 +140,54 @@ class LinePlot:
             plt.yscale("log")
 
         plot = plt.plot(self.get_domain(), data, marker='.')
+        self.axes = plt.gca()
+        self.line = plot[0]
         return plot
 
+    def update(self, data: ndarray):
+        """Updates the data and title of the current figure.
+
+        The axes are rescaled to the new data, and the layout is left as it is.
+
+        Parameters
+        ----------
+        data : :class:`~numpy.ndarray`
+            The array of values to be plot.
+
+        """
+        self.axes.set_title(self.title())
+        self.line.set_ydata(data)
+        self.axes.relim()
+        self.axes.autoscale_view()
+
+    def close_figure(self):
+        """Closes the current figure, if any.
+
+        """
+        if self.figure is not None:
+            plt.close(self.figure)
+        self.figure = None
+        self.frame = None
+
+    def close(self):
+        """Closes the current figure and writes any collected frames.
+
+        """
+        self.close_figure()
+        if self.frames is not None:
+            self.frames.close()
+
     def save_fig(self):
         """Creates the formatted string file name and saves plot to disk.
 
+        If frames are collected, the plot is instead added to the file of the
+        current monitor location.
+
         """
-        plt.savefig(join(self.output_dir, f"{self.id}-{self.domain.time[self.t_index]:.2f}s.png"))
+        if self.frames is not None:
+            self.frames.add(self.id, self.figure)
+            return
+        self.figure.savefig(join(self.output_dir, f"{self.id}-{self.domain.time[self.t_index]:.2f}s.png"))
 
     def title(self):
         """Creates formatted title string for the current plot.
@@ -44,8 +44,16 @@ class PointPlot:
     outdir: :obj:`str`
         The path to the output directory for the run.
 
+    reuse : :obj:`bool`
+        Whether the figure is kept between calls, and only the data is updated
+        for each point.
+
+    figure : :obj:`Union`[:class:`~matplotlib.figure.Figure`, None]
+        The current figure, if any.
+
     """
-    def __init__(self, settings: RIDTConfig, output_dir: str, quantity: str):
+    def __init__(self, settings: RIDTConfig, output_dir: str, quantity: str,
+                 reuse: bool = False):
         """The :class:`~.PointPlot` constructor.
 
         Parameters
@@ -59,6 +67,11 @@ class PointPlot:
         quantity : :obj:`str`
             The string id for the quantity stored in the data  store.
 
+        reuse : :obj:`bool`, optional
+            Whether the figure and axes are created once and reused for each
+            point, with a fixed layout. By default the figure is redrawn for
+            each call.
+
         """
         self.settings = settings
         self.output_dir = output_dir
@@ -66,6 +79,8 @@ class PointPlot:
         self.domain = Domain(self.settings)
         self.quantity = quantity
         self.config = self.settings.models.eddy_diffusion.points_plots
+        self.reuse = reuse
+        self.figure = None
 
     def __call__(self, id: str, data: ndarray):
         """The call method used to plot some data.
@@ -82,10 +97,14 @@ class PointPlot:
         self.id = id 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            self.plot(data)
-        plt.tight_layout()
+            if self.reuse and self.figure is not None:
+                self.update(data)
+            else:
+                self.plot(data)
+                plt.tight_layout()
         self.save_fig()
-        plt.clf()
+        if not self.reuse:
+            self.figure.clf()
 
     def plot(self, data: ndarray):
         """Calls various plotting functions.
@@ -96,6 +115,7 @@ class PointPlot:
             The array of values to be plot.
 
         """
+        self.figure = plt.gcf()
         plt.title(self.title())
         plt.xlabel(self.xlabel())
         plt.ylabel(self.ylabel())
@@ -103,14 +123,40 @@ class PointPlot:
             plt.yscale("log")
         plt.locator_params(nbins=10, axis='x')
         plot = plt.plot(self.convert_times(), data, marker='.')
+        self.axes = plt.gca()
+        self.line = plot[0]
 
         return plot
 
+    def update(self, data: ndarray):
+        """Updates the data and title of the current figure.
+
+        The axes are rescaled to the new data, and the layout is left as it is.
+
+        Parameters
+        ----------
+        data : :class:`~numpy.ndarray`
+            The array of values to be plot.
+
+        """
+        self.axes.set_title(self.title())
+        self.line.set_ydata(data)
+        self.axes.relim()
+        self.axes.autoscale_view()
+
+    def close(self):
+        """Closes the current figure, if any.
+
+        """
+        if self.figure is not None:
+            plt.close(self.figure)
+        self.figure = None
+
     def save_fig(self):
         """Creates the formatted string file name and saves plot to disk.
 
         """
-        plt.savefig(join(self.output_dir, f"{self.id}.png"))
+        self.figure.savefig(join(self.output_dir, f"{self.id}.png"))
 
     def title(self):
         """Creates formatted title string for the current plot.
@@ -1,16 +1,17 @@
 import unittest
-from os import listdir
+import os
+from os import walk
 from os.path import join
-from os import remove
-import shutil
+from os.path import relpath
+from tempfile import TemporaryDirectory
+
+from PIL import Image
+from PIL import ImageSequence
 
 from ridt.config import ConfigFileParser
 
-from ridt.container import Domain
 from ridt.container.eddydiffusionrun import EddyDiffusionRun
 
-from ridt.data import BatchDataStore
-
 
 class ST22(unittest.TestCase):
 
@@ -19,13 +20,47 @@ class ST22(unittest.TestCase):
        where requested."""
 
     def setUp(self) -> None:
-        pass
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with ConfigFileParser(join(this_dir, "../../default/config.json")) as cfp:
+            self.c = cfp
+
+        ed = self.c.models.eddy_diffusion
+        for geometry in ["points", "lines", "planes"]:
+            ed.monitor_locations.evaluate[geometry] = True
+            getattr(ed, f"{geometry}_plots").output = True
+        ed.lines_plots.number = 3
+        ed.lines_plots.animate = False
+        ed.planes_plots.number = 3
+        ed.planes_plots.animate = True
+        ed.analysis.perform_analysis = False
+
+        self.dir = TemporaryDirectory()
+        EddyDiffusionRun(self.c, self.dir.name, plot_workers=2,
+                         frame_format="gif")
 
     def tearDown(self) -> None:
-        pass
+        self.dir.cleanup()
+
+    def plots(self, extension: str):
+        return sorted(
+            relpath(join(path, f), self.dir.name)
+            for path, _, files in walk(self.dir.name)
+            for f in files if f.endswith(extension)
+        )
 
     def test_verify(self):
-        pass
+        gifs = self.plots(".gif")
+        self.assertEqual(gifs, [
+            join("planes", q, "plots", "plane_1.gif")
+            for q in ["concentration", "exposure"]
+        ])
+        for f in gifs:
+            with Image.open(join(self.dir.name, f)) as gif:
+                self.assertEqual(len(list(ImageSequence.Iterator(gif))), 3)
+        pngs = self.plots(".png")
+        self.assertEqual(len(pngs), 2 * (1 + 3))
+        self.assertFalse(any(f.startswith("planes") for f in pngs))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import unittest
+import os
+from os import listdir
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import ConfigFileParser
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+from ridt.data import DataStore
+
+
+class ST30(unittest.TestCase):
+
+    """System Test 30. Test the system can evaluate
+       the elements of a computational space over a
+       pool of worker processes, each of which evaluates
+       its monitor locations over a pool of threads."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with ConfigFileParser(join(this_dir, "st11/config.json")) as cfp:
+            self.c = cfp
+
+        self.tmp = TemporaryDirectory()
+        self.output_dir = self.tmp.name
+        self.edr = EddyDiffusionRun(self.c, self.output_dir, workers=2,
+                                    threads=2)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_verify(self):
+        self.assertEqual(len(self.edr.data_store.keys()), len(self.edr.space))
+        self.assertNotIn(".npy", "".join(listdir(self.output_dir)))
+        for setting in self.edr.space.space:
+            store = self.edr.data_store[setting]
+            expected = DataStore()
+            EddyDiffusionRun.solve(setting, expected, self.edr.geometries)
+            for geometry in self.edr.geometries:
+                for name, value in getattr(expected, geometry).items():
+                    np.testing.assert_array_equal(store.get(geometry, name), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import ConfigFileParser
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+from ridt.data import DataStore
+
+
+class ST31(unittest.TestCase):
+
+    """System Test 31. Test the system can store the
+       computed grids as memory mapped files in the
+       output directory, both serially and when using
+       a pool of worker processes."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with ConfigFileParser(join(this_dir, "st11/config.json")) as cfp:
+            self.c = cfp
+
+        self.tmp = TemporaryDirectory()
+        self.output_dir = self.tmp.name
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def verify(self, edr: EddyDiffusionRun):
+        for index, setting in enumerate(edr.space.space):
+            store = edr.data_store[setting]
+            expected = DataStore()
+            EddyDiffusionRun.solve(setting, expected, edr.geometries)
+            for geometry in edr.geometries:
+                ddir = join(edr.element_dir(index), geometry,
+                            "concentration", "data")
+                for name, value in getattr(expected, geometry).items():
+                    data = store.get(geometry, name)
+                    self.assertIsInstance(data, np.memmap)
+                    np.testing.assert_array_equal(data, value)
+                    saved = np.load(join(ddir, f"{name}.npy"))
+                    np.testing.assert_array_equal(saved, value)
+
+    def test_serial(self):
+        self.verify(EddyDiffusionRun(self.c, self.output_dir, memmap=True))
+
+    def test_workers(self):
+        self.verify(EddyDiffusionRun(
+            self.c, self.output_dir, workers=2, memmap=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+from os import walk
+from os.path import join
+from os.path import relpath
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import ConfigFileParser
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+
+class ST32(unittest.TestCase):
+
+    """System Test 32. Test the system can write, plot
+       and analyse each computational space element as
+       soon as it is evaluated, producing the same output
+       as a batch run."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with ConfigFileParser(join(this_dir, "st11/config.json")) as cfp:
+            self.c = cfp
+
+        self.batch = TemporaryDirectory()
+        self.stream = TemporaryDirectory()
+        EddyDiffusionRun(self.c, self.batch.name)
+        self.edr = EddyDiffusionRun(self.c, self.stream.name, stream=True)
+
+    def tearDown(self) -> None:
+        self.batch.cleanup()
+        self.stream.cleanup()
+
+    def files(self, root: str):
+        return sorted(
+            relpath(join(path, f), root)
+            for path, _, files in walk(root) for f in files
+        )
+
+    def test_verify(self):
+        self.assertFalse(list(self.edr.data_store.keys()))
+
+        files = self.files(self.batch.name)
+        self.assertEqual(files, self.files(self.stream.name))
+        for f in files:
+            batch = join(self.batch.name, f)
+            stream = join(self.stream.name, f)
+            if f.endswith(".npy"):
+                np.testing.assert_array_equal(np.load(batch), np.load(stream))
+            elif not f.endswith(".png"):
+                with open(batch) as b, open(stream) as s:
+                    self.assertEqual(b.read(), s.read(), f)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+from os import walk
+from os.path import join
+from os.path import relpath
+from tempfile import TemporaryDirectory
+
+from ridt.config import ConfigFileParser
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+
+class ST33(unittest.TestCase):
+
+    """System Test 33. Test the system can render the
+       plots of a run over a pool of worker processes,
+       producing the same plots as a serial run."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with ConfigFileParser(join(this_dir, "../../default/config.json")) as cfp:
+            self.c = cfp
+
+        ed = self.c.models.eddy_diffusion
+        for geometry in ["points", "lines", "planes"]:
+            ed.monitor_locations.evaluate[geometry] = True
+            getattr(ed, f"{geometry}_plots").output = True
+        ed.lines_plots.number = 3
+        ed.planes_plots.number = 3
+        ed.analysis.perform_analysis = False
+
+        self.serial = TemporaryDirectory()
+        self.parallel = TemporaryDirectory()
+        EddyDiffusionRun(self.c, self.serial.name)
+        EddyDiffusionRun(self.c, self.parallel.name, plot_workers=2)
+
+    def tearDown(self) -> None:
+        self.serial.cleanup()
+        self.parallel.cleanup()
+
+    def plots(self, root: str):
+        return sorted(
+            relpath(join(path, f), root)
+            for path, _, files in walk(root) for f in files if f.endswith(".png")
+        )
+
+    def test_verify(self):
+        plots = self.plots(self.serial.name)
+        self.assertEqual(len(plots), 2 * (1 + 3 + 3))
+        self.assertEqual(plots, self.plots(self.parallel.name))
+        for f in plots:
+            with open(join(self.serial.name, f), "rb") as s:
+                with open(join(self.parallel.name, f), "rb") as p:
+                    self.assertEqual(s.read(), p.read(), f)
+
+
+if __name__ == "__main__":
+    unittest.main()
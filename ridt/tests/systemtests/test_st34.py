@@ -0,0 +1,62 @@
+import unittest
+import os
+from os import walk
+from os.path import join
+from os.path import relpath
+from tempfile import TemporaryDirectory
+
+from ridt.config import ConfigFileParser
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+
+class ST34(unittest.TestCase):
+
+    """System Test 34. Test the system can reuse one
+       figure per monitor location when plotting,
+       producing the same set of plots, and the same
+       contour plots, as a run without reuse."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with ConfigFileParser(join(this_dir, "../../default/config.json")) as cfp:
+            self.c = cfp
+
+        ed = self.c.models.eddy_diffusion
+        for geometry in ["points", "lines", "planes"]:
+            ed.monitor_locations.evaluate[geometry] = True
+            getattr(ed, f"{geometry}_plots").output = True
+        ed.lines_plots.number = 3
+        ed.planes_plots.number = 3
+        ed.analysis.perform_analysis = False
+
+        self.fresh = TemporaryDirectory()
+        self.reused = TemporaryDirectory()
+        EddyDiffusionRun(self.c, self.fresh.name)
+        EddyDiffusionRun(self.c, self.reused.name, reuse_figures=True)
+
+    def tearDown(self) -> None:
+        self.fresh.cleanup()
+        self.reused.cleanup()
+
+    def plots(self, root: str):
+        return sorted(
+            relpath(join(path, f), root)
+            for path, _, files in walk(root) for f in files if f.endswith(".png")
+        )
+
+    def test_verify(self):
+        plots = self.plots(self.fresh.name)
+        self.assertEqual(len(plots), 2 * (1 + 3 + 3))
+        self.assertEqual(plots, self.plots(self.reused.name))
+        for f in plots:
+            if f.startswith("lines"):
+                continue
+            with open(join(self.fresh.name, f), "rb") as s:
+                with open(join(self.reused.name, f), "rb") as r:
+                    self.assertEqual(s.read(), r.read(), f)
+
+
+if __name__ == "__main__":
+    unittest.main()
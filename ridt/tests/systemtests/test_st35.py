@@ -0,0 +1,84 @@
+import unittest
+import json
+import os
+from os import walk
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import RIDTConfig
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+from ridt.data import DataStoreArchive
+from ridt.data import DataStoreReader
+
+
+class ST35(unittest.TestCase):
+
+    """System Test 35. Test the system can write
+       the data stores of a batch run to a single
+       archive, holding the same grids as the
+       numpy binary file output."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        source = loaded_json["modes"]["instantaneous"]["sources"]["source_1"]
+        source["mass"] = {"min": 1.0, "max": 2.0, "num": 2}
+        loaded_json["write_data_to_csv"] = False
+        analysis = loaded_json["models"]["eddy_diffusion"]["analysis"]
+        analysis["perform_analysis"] = False
+        self.c = RIDTConfig(loaded_json)
+
+        self.files = TemporaryDirectory()
+        self.archive = TemporaryDirectory()
+        EddyDiffusionRun(self.c, self.files.name)
+        EddyDiffusionRun(self.c, self.archive.name, archive=True)
+
+    def tearDown(self) -> None:
+        self.files.cleanup()
+        self.archive.cleanup()
+
+    def test_verify(self):
+        self.assertTrue(os.path.isfile(
+            join(self.archive.name, DataStoreArchive.name)))
+        self.assertFalse(any(
+            f.endswith(".npy") for _, _, files in walk(self.archive.name)
+            for f in files))
+
+        for quantity in ["concentration", "exposure"]:
+            expected = DataStoreReader(self.c, self.files.name, quantity)
+            store = DataStoreReader(self.c, self.archive.name, quantity, lazy=True)
+            self.assertEqual(len(list(store.keys())), 2)
+            for setting, data_store in expected.items():
+                for geometry in ["points", "lines", "planes", "domain"]:
+                    grids = getattr(data_store, geometry)
+                    self.assertEqual(list(getattr(store[setting], geometry)),
+                                     list(grids))
+                    for id, data in grids.items():
+                        self.assertTrue(np.array_equal(
+                            store[setting].get(geometry, id), data))
+
+    def test_memmap(self):
+        for stream in [False, True]:
+            with TemporaryDirectory() as outdir:
+                EddyDiffusionRun(self.c, outdir, memmap=True, archive=True,
+                                 stream=stream)
+                for root, dirs, files in walk(outdir):
+                    self.assertNotIn("data", dirs)
+                    self.assertFalse(any(f.endswith(".npy") for f in files))
+                expected = DataStoreReader(self.c, self.files.name, "exposure")
+                store = DataStoreReader(self.c, outdir, "exposure")
+                for setting, data_store in expected.items():
+                    for id, data in data_store.domain.items():
+                        np.testing.assert_array_equal(
+                            store[setting].get("domain", id), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import json
+import os
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import RIDTConfig
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+from ridt.data import DataStore
+
+
+class ST36(unittest.TestCase):
+
+    """System Test 36. Test the system can evaluate
+       the elements of a computational space that
+       differ only in source strengths together, by
+       superposing unit strength evaluations, both
+       serially and over a pool of worker processes."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        modes = loaded_json["modes"]
+        instantaneous = modes["instantaneous"]["sources"]["source_1"]
+        instantaneous["mass"] = {"min": 1.0, "max": 2.0, "num": 2}
+        instantaneous["x"] = {"min": 5.0, "max": 10.0, "num": 2}
+        infinite = modes["infinite_duration"]["sources"]["source_1"]
+        infinite["rate"] = {"min": 0.1, "max": 0.3, "num": 2}
+        loaded_json["write_data_to_csv"] = False
+        eddy_diffusion = loaded_json["models"]["eddy_diffusion"]
+        eddy_diffusion["analysis"]["perform_analysis"] = False
+        eddy_diffusion["monitor_locations"]["evaluate"]["lines"] = True
+        eddy_diffusion["monitor_locations"]["evaluate"]["planes"] = True
+        self.c = RIDTConfig(loaded_json)
+
+        self.serial = TemporaryDirectory()
+        self.parallel = TemporaryDirectory()
+        self.edrs = [
+            EddyDiffusionRun(self.c, self.serial.name, superpose=True),
+            EddyDiffusionRun(self.c, self.parallel.name, workers=2,
+                             superpose=True)
+        ]
+
+    def tearDown(self) -> None:
+        self.serial.cleanup()
+        self.parallel.cleanup()
+
+    def test_verify(self):
+        for edr in self.edrs:
+            self.assertEqual(len(edr.space), 8)
+            self.assertEqual([len(g) for g in edr.groups()], [4, 4])
+            self.assertEqual(len(edr.data_store.keys()), len(edr.space))
+            for setting in edr.space.space:
+                store = edr.data_store[setting]
+                expected = DataStore()
+                EddyDiffusionRun.solve(setting, expected, edr.geometries)
+                for geometry in edr.geometries:
+                    for name, value in getattr(expected, geometry).items():
+                        atol = 1e-12 * np.nanmax(np.abs(value))
+                        self.assertTrue(np.allclose(
+                            store.get(geometry, name), value,
+                            rtol=1e-12, atol=atol, equal_nan=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import json
+import os
+from os import listdir
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import RIDTConfig
+
+from ridt.container.eddydiffusionrun import EddyDiffusionRun
+
+
+class ST37(unittest.TestCase):
+
+    """System Test 37. Test the system can load the
+       grids of a run from a result cache, when only
+       the output settings have changed, and that it
+       evaluates and caches any new physics."""
+
+    def setUp(self) -> None:
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(join(this_dir, "../../default/config.json")) as f:
+            self.source = json.load(f)
+
+        source = self.source["modes"]["instantaneous"]["sources"]["source_1"]
+        source["mass"] = {"min": 1.0, "max": 2.0, "num": 2}
+        self.source["write_data_to_csv"] = False
+        eddy_diffusion = self.source["models"]["eddy_diffusion"]
+        eddy_diffusion["analysis"]["perform_analysis"] = False
+        eddy_diffusion["monitor_locations"]["evaluate"]["lines"] = True
+
+        self.cache = TemporaryDirectory()
+        self.dirs = [TemporaryDirectory() for _ in range(3)]
+
+    def tearDown(self) -> None:
+        self.cache.cleanup()
+        for directory in self.dirs:
+            directory.cleanup()
+
+    def run_model(self, index: int) -> EddyDiffusionRun:
+        return EddyDiffusionRun(RIDTConfig(self.source), self.dirs[index].name,
+                                cache=self.cache.name)
+
+    def grids(self, edr: EddyDiffusionRun) -> list:
+        return [
+            (geometry, name, value)
+            for setting in edr.space.space
+            for geometry in edr.geometries
+            for name, value in getattr(edr.data_store[setting], geometry).items()
+        ]
+
+    def test_verify(self):
+        expected = self.grids(self.run_model(0))
+        self.assertEqual(len(listdir(self.cache.name)), 4)
+
+        self.source["thresholds"]["concentration"] = [0.5]
+        self.source["compute_exposure"] = False
+        cached = self.grids(self.run_model(1))
+        self.assertEqual(len(listdir(self.cache.name)), 4)
+        self.assertEqual(len(cached), len(expected))
+        for (g0, n0, v0), (g1, n1, v1) in zip(expected, cached):
+            self.assertEqual((g0, n0), (g1, n1))
+            np.testing.assert_array_equal(v0, v1)
+
+        self.source["fresh_air_flow_rate"] = 1.0
+        changed = self.grids(self.run_model(2))
+        self.assertEqual(len(listdir(self.cache.name)), 8)
+        self.assertFalse(np.array_equal(changed[0][2], expected[0][2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
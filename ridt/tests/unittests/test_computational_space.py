@@ -0,0 +1,90 @@
+import unittest
+import json
+import os
+import pickle
+
+from ridt.base import ComputationalSpace
+from ridt.config import RIDTConfig
+
+
+class TestComputationalSpace(unittest.TestCase):
+
+    """Unit tests for the :class:`~.ComputationalSpace` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which builds a two dimensional space."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "test_resources/test_config.json")) as f:
+            self.source = json.load(f)
+
+        modes = self.source["modes"]
+        modes["instantaneous"]["sources"]["source_1"]["mass"] =\
+            {"min": 1.0, "max": 3.0, "num": 3}
+        modes["infinite_duration"]["sources"]["source_1"]["rate"] =\
+            {"min": 0.1, "max": 0.2, "num": 2}
+        self.space = ComputationalSpace(
+            RIDTConfig(self.source), {"models": "eddy_diffusion"})
+
+    def test_index(self):
+
+        """Ensures each element is found at its position in the space."""
+
+        self.assertEqual(self.space.shape, (3, 2))
+        for linear, setting in enumerate(self.space.space):
+            self.assertEqual(self.space.linear_index(setting), linear)
+            index = self.space.index(setting)
+            self.assertIs(self.space[tuple(int(i) for i in index)], setting)
+
+    def test_lazy(self):
+
+        """Ensures elements are only built when accessed."""
+
+        self.assertEqual(len(self.space.space.elements), 0)
+        self.assertEqual(len(self.space), 6)
+
+        last = self.space.space[-1]
+        self.assertEqual(len(self.space.space.elements), 1)
+        self.assertIs(self.space.space[5], last)
+        self.assertEqual(self.space.space[4:], [self.space.space[4], last])
+        with self.assertRaises(IndexError):
+            self.space.space[6]
+
+        source = last.__source__
+        self.assertEqual(
+            source["modes"]["instantaneous"]["sources"]["source_1"]["mass"], 3.0)
+        self.assertEqual(
+            source["modes"]["infinite_duration"]["sources"]["source_1"]["rate"], 0.2)
+        self.assertIs(source["dimensions"], self.space.setting.__source__["dimensions"])
+        self.assertEqual(self.space.setting.__source__["modes"]["instantaneous"]
+                         ["sources"]["source_1"]["mass"]["num"], 3)
+
+    def test_build_once(self):
+
+        """Ensures repeated passes over the space build each element once."""
+
+        builds = list()
+        build = self.space.build
+        self.space.build = lambda index: builds.append(index) or build(index)
+        for _ in range(3):
+            for setting in self.space.space:
+                self.space.index(setting)
+        self.assertEqual(builds, list(range(6)))
+
+    def test_equal_settings(self):
+
+        """Ensures equal settings built separately are found."""
+
+        for linear, setting in enumerate(self.space.space):
+            copy = RIDTConfig(setting.__source__)
+            self.assertEqual(self.space.linear_index(copy), linear)
+            copy = pickle.loads(pickle.dumps(setting))
+            self.assertEqual(self.space.linear_index(copy), linear)
+
+        with self.assertRaises(ValueError):
+            self.space.linear_index(RIDTConfig(self.source))
+
+
+if __name__ == "__main__":
+    unittest.main()
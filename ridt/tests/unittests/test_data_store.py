@@ -33,3 +33,77 @@ class TestDataStore(unittest.TestCase):
             [[[self.space, self.space], [self.space, self.space]],
              [[self.space, self.space], [self.space, self.space]]]
         )
+
+    def test_threshold_analytics(self):
+
+        """Tests that the batched threshold analytics match a time step by
+        time step evaluation of each threshold."""
+
+        rng = np.random.RandomState(0)
+        data = rng.random_sample((6, 4, 3, 2))
+        data[rng.random_sample(data.shape) < 0.2] = np.nan
+        data[0] = np.nan
+        data[1] *= 0.1
+        self.ds.add("domain", "domain", data)
+        self.ds.add("points", "point", data[:, 0, 0, 0])
+        values = [0.05, 0.5, 0.9, 2.0]
+        percent = 30.0
+
+        for geometry, id in [("domain", "domain"), ("points", "point")]:
+            grid = self.ds.get(geometry, id)
+            exceeds, percentage, maximum = self.ds.threshold_analytics(
+                geometry, id, values, percent)
+            for i, value in enumerate(values):
+                where = list(zip(*np.where(grid >= value)))
+                self.assertEqual(exceeds[i], where[0] if where else None)
+                self.assertEqual(exceeds[i], self.ds.exceeds(geometry, id, value))
+
+                fracs = [(t, 100 * np.sum(g >= value) / np.sum(~np.isnan(g)))
+                         for t, g in enumerate(grid) if np.sum(~np.isnan(g))]
+                reached = [t for t, f in fracs if f >= percent]
+                self.assertEqual(percentage[i], reached[0] if reached else None)
+
+                best = (None, 0.0)
+                for t, f in fracs:
+                    if f > best[1]:
+                        best = (t, f)
+                self.assertEqual(maximum[i], best)
+
+    def test_exclude(self):
+
+        """Tests that excluded elements are treated as NaN by the analytics
+        without modifying or copying the grids."""
+
+        rng = np.random.RandomState(1)
+        data = rng.random_sample((5, 4, 3, 2))
+        mask = np.zeros((4, 3, 2), dtype=bool)
+        mask[1:3, 0] = True
+        mask[0, 0, 0] = True
+        original = data.copy()
+        self.ds.add("domain", "domain", data)
+        self.ds.add("points", "point", data[:, 0, 0, 0])
+
+        view = self.ds.view()
+        view.exclude("domain", "domain", mask)
+        view.exclude("points", "point", np.array(True))
+        self.assertIs(view.get("domain", "domain"), data)
+        self.assertFalse(self.ds.masks)
+
+        masked = DataStore()
+        expected = data.copy()
+        expected[:, mask] = np.nan
+        masked.add("domain", "domain", expected)
+        masked.add("points", "point", np.full(data.shape[0], np.nan))
+
+        values = [0.2, 0.7, 0.99]
+        for geometry, id in [("domain", "domain"), ("points", "point")]:
+            for time in range(data.shape[0]):
+                np.testing.assert_array_equal(
+                    view.at(geometry, id, time),
+                    masked.get(geometry, id)[time])
+            self.assertEqual(view.threshold_analytics(geometry, id, values, 20.0),
+                             masked.threshold_analytics(geometry, id, values, 20.0))
+        self.assertEqual(view.maximum("domain", "domain"),
+                         masked.maximum("domain", "domain"))
+        self.assertIsNone(view.maximum("points", "point")[0])
+        self.assertTrue(np.array_equal(data, original))
@@ -0,0 +1,74 @@
+import unittest
+import json
+import os
+
+from unittest.mock import patch
+
+import numpy as np
+
+from ridt.analysis import DataStoreAnalyser
+
+from ridt.config import RIDTConfig
+
+from ridt.container import Domain
+
+from ridt.data import DataStore
+from ridt.data import UncertaintyMask
+
+
+class TestDataStoreAnalyser(unittest.TestCase):
+
+    """Unit tests for the :class:`~.DataStoreAnalyser` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which creates a data store with a domain grid that
+        becomes well mixed over time."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        self.config = RIDTConfig(loaded_json)
+        self.config.spatial_samples.x = 6
+        self.config.spatial_samples.y = 5
+        self.config.spatial_samples.z = 4
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        for geometry in locations.evaluate:
+            locations.evaluate[geometry] = geometry == "domain"
+        self.domain = Domain(self.config)
+
+        rng = np.random.RandomState(0)
+        t = self.domain.time.size
+        spread = np.linspace(1.0, 0.0, t).reshape(t, 1, 1, 1)
+        self.data = 1.0 + spread * rng.random_sample((t, 6, 5, 4))
+        self.data[0] = 0.0
+        self.ds = DataStore()
+        self.ds.add("domain", "domain", self.data)
+
+    def test_well_mixed_curve(self):
+
+        """Tests that the chunked curve matches a time by time evaluation
+        of the grid with uncertain values excluded."""
+
+        analysis = self.config.models.eddy_diffusion.analysis
+        self.assertTrue(analysis.exclude_uncertain_values)
+        masked = UncertaintyMask(self.config).mask(
+            "domain", "domain", self.data.copy())
+        self.assertTrue(np.isnan(masked).any())
+        with np.errstate(invalid="ignore"):
+            expected = np.array([np.nanstd(d) / np.nanmean(d) for d in masked])
+        first = np.nonzero(expected <= 0.1)[0][0]
+
+        for chunk_size in [1, 50, 1 << 22]:
+            with patch("ridt.analysis.datastoreanalyser.CHUNK_SIZE", chunk_size):
+                analyser = DataStoreAnalyser(self.config, self.ds, "concentration")
+                curve = analyser.well_mixed_curve
+            self.assertTrue(np.allclose(curve, expected, rtol=1e-12, equal_nan=True))
+            self.assertTrue(np.isnan(curve[0]))
+            self.assertIs(analyser.well_mixed_curve, curve)
+            self.assertEqual(analyser.time_to_well_mixed, self.domain.time[first])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.data import DataStoreArchive
+
+
+class TestDataStoreArchive(unittest.TestCase):
+
+    """Unit tests for the :class:`~.DataStoreArchive` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which creates an output directory and some grids."""
+
+        self.dir = TemporaryDirectory()
+        self.grids = {
+            DataStoreArchive.member("", "points", "concentration", "point_1.npy"):
+                np.linspace(0, 1, 5),
+            DataStoreArchive.member("[0, 1]", "planes", "exposure", "plane_1.npy"):
+                np.arange(24, dtype=float).reshape(2, 3, 4),
+        }
+
+    def tearDown(self) -> None:
+
+        """tearDown method which removes the output directory."""
+
+        self.dir.cleanup()
+
+    def test_member(self):
+
+        """Ensures member names follow the output directory layout."""
+
+        self.assertEqual(DataStoreArchive.member("", "lines", "c", "l.npy"),
+                         "lines/c/l.npy")
+        self.assertEqual(DataStoreArchive.member("[1]", "config.json"),
+                         "[1]/config.json")
+
+    def test_round_trip(self):
+
+        """Ensures grids and settings are read back, also by numpy."""
+
+        with DataStoreArchive(self.dir.name, "w") as archive:
+            for name, data in self.grids.items():
+                archive.save(name, data)
+            archive.save_config("[0, 1]", {"a": 1})
+            archive.save_config("[0, 1]", {"a": 2})
+
+        with DataStoreArchive(self.dir.name) as archive:
+            for name, data in self.grids.items():
+                self.assertTrue(np.array_equal(archive.load(name), data))
+            self.assertEqual(archive.load_config("[0, 1]"), {"a": 1})
+            self.assertEqual(len(archive.names()), 3)
+            with self.assertRaises(KeyError):
+                archive.load("missing.npy")
+
+        path = os.path.join(self.dir.name, DataStoreArchive.name)
+        with np.load(path) as npz:
+            for name, data in self.grids.items():
+                self.assertTrue(np.array_equal(npz[name[:-4]], data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import json
+import csv
+import os
+
+from itertools import product
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+
+from ridt.data import DataStore
+from ridt.data.datastorecsvwriter import DataStoreCSVWriter
+from ridt.data import DirectoryAgent
+
+from ridt.config import RIDTConfig
+from ridt.config import Units
+
+from ridt.container import Domain
+
+
+class TestDataStoreCSVWriter(unittest.TestCase):
+
+    """Unit tests for the :class:`~.DataStoreCSVWriter` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which creates a small data store with a grid
+        for every monitor location type."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        self.config = RIDTConfig(loaded_json)
+        self.config.spatial_samples.x = 5
+        self.config.spatial_samples.y = 4
+        self.config.spatial_samples.z = 3
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        for geometry in locations.evaluate:
+            locations.evaluate[geometry] = True
+        locations.lines["line_1"].parallel_axis = "y"
+        locations.planes["plane_1"].axis = "xz"
+
+        self.tmp = TemporaryDirectory()
+        self.out_dir = self.tmp.name
+        self.domain = Domain(self.config)
+
+        t = self.domain.time.size
+        x, y, z = self.domain.x.size, self.domain.y.size, self.domain.z.size
+        rng = np.random.RandomState(0)
+        self.ds = DataStore()
+        self.ds.add("points", "point_1", rng.random_sample(t))
+        self.ds.add("lines", "line_1", rng.random_sample((t, y)))
+        self.ds.add("planes", "plane_1", rng.random_sample((t, x, z)))
+        self.ds.add("domain", "domain", rng.random_sample((t, x, y, z)))
+        special = [np.nan, np.inf, -0.0, 1e-300, 1.5e16, 123456.789, 1e-5]
+        self.ds.get("lines", "line_1")[0, :] = special[:y]
+        self.ds.get("planes", "plane_1")[0, :, 0] = special[:x]
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def expected(self, id: str, data: np.ndarray) -> str:
+
+        """Writes the rows one at a time with the :mod:`csv` module."""
+
+        units = Units(self.config)
+        path = join(self.out_dir, f"{id}_expected.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f, delimiter=",")
+            writer.writerow([
+                f"time ({units.time})",
+                f"x ({units.space})",
+                f"y ({units.space})",
+                f"z ({units.space})",
+                f"value ({units.concentration})"
+            ])
+            for index in product(*[range(i) for i in data.shape]):
+                values = self.domain.values(id, index)
+                writer.writerow(
+                    list(values) + [data[index] / units.concentration_factor])
+        with open(path, newline="") as f:
+            return f.read()
+
+    def test_write(self):
+
+        """Tests that the chunked output matches row by row csv output."""
+
+        for chunk_size in [7, 1 << 16]:
+            with patch("ridt.data.datastorecsvwriter.CHUNK_SIZE", chunk_size):
+                agent = DirectoryAgent(self.out_dir, ())
+                DataStoreCSVWriter(self.config, self.ds, agent, "concentration")
+            for geometry in ["points", "lines", "planes", "domain"]:
+                for id in getattr(self.ds, geometry):
+                    path = join(self.out_dir, geometry, "concentration",
+                                "data", f"{id}.csv")
+                    with open(path, newline="") as f:
+                        output = f.read()
+                    data = self.ds.get(geometry, id)
+                    self.assertEqual(output, self.expected(id, data))
+
+
+if __name__ == "__main__":
+    unittest.main()
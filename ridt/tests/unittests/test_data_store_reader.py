@@ -2,11 +2,20 @@ import unittest
 import json
 import os
 
+from tempfile import TemporaryDirectory
+
 import numpy as np
 
+from ridt.base import ComputationalSpace
+
 from ridt.data import DataStoreReader
 from ridt.data import DataStoreWriter
 from ridt.data import DataStore
+from ridt.data import BatchDataStore
+from ridt.data import BatchDataStoreWriter
+from ridt.data import DirectoryAgent
+from ridt.data import DataStoreArchive
+from ridt.data.datastorereader import DataStoreParsingError
 
 from ridt.config import RIDTConfig
 
@@ -47,3 +56,160 @@ class TestDataStoreReader(unittest.TestCase):
             [[[self.space, self.space], [self.space, self.space]],
              [[self.space, self.space], [self.space, self.space]]]
         )
+
+        self.loaded_json = loaded_json
+        self.config.write_data_to_csv = False
+        self.dir = TemporaryDirectory()
+
+    def tearDown(self) -> None:
+
+        """tearDown method which removes the output directory."""
+
+        self.dir.cleanup()
+
+    def store(self, offset: float = 0.0):
+        rv = DataStore()
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        grids = {
+            "points": self.point_data,
+            "lines": self.line_data,
+            "planes": self.plane_data,
+            "domain": self.domain_data
+        }
+        for geometry, data in grids.items():
+            for id in getattr(locations, geometry):
+                rv.add(geometry, id, data + offset)
+        return rv
+
+    def assertStoresEqual(self, expected: DataStore, store: DataStore):
+        for geometry in ["points", "lines", "planes", "domain"]:
+            grids = getattr(expected, geometry)
+            self.assertEqual(list(getattr(store, geometry)), list(grids))
+            for id, data in grids.items():
+                self.assertTrue(np.array_equal(store.get(geometry, id), data))
+
+    def test_read(self):
+
+        """Ensures a written data store is read back, eagerly and lazily."""
+
+        expected = self.store()
+        DataStoreWriter(self.config, expected,
+                        DirectoryAgent(self.dir.name, (1,)), "concentration")
+
+        store = DataStoreReader(self.config, self.dir.name, "concentration")
+        self.assertStoresEqual(expected, store)
+        self.assertTrue(store.get("planes", self.plane_name).flags.writeable)
+
+        lazy = DataStoreReader(self.config, self.dir.name, "concentration",
+                               lazy=True)
+        self.assertIsNone(lazy.planes.arrays[self.plane_name])
+        self.assertStoresEqual(expected, lazy)
+        data = lazy.get("planes", self.plane_name)
+        self.assertIsInstance(data, np.memmap)
+        self.assertFalse(data.flags.writeable)
+        self.assertIs(lazy.get("planes", self.plane_name), data)
+
+    def test_lazy_errors(self):
+
+        """Ensures a missing file is only reported when it is accessed."""
+
+        DataStoreWriter(self.config, self.store(),
+                        DirectoryAgent(self.dir.name, (1,)), "concentration")
+        os.remove(os.path.join(self.dir.name, "lines", "concentration",
+                               "data", f"{self.line_name}.npy"))
+
+        with self.assertRaises(DataStoreParsingError):
+            DataStoreReader(self.config, self.dir.name, "concentration")
+        lazy = DataStoreReader(self.config, self.dir.name, "concentration",
+                               lazy=True)
+        lazy.get("points", self.point_name)
+        with self.assertRaises(DataStoreParsingError):
+            lazy.get("lines", self.line_name)
+
+    def test_read_batch(self):
+
+        """Ensures every element of a computational space is read back."""
+
+        source = self.loaded_json["modes"]["instantaneous"]["sources"]["source_1"]
+        source["mass"] = {"min": 1.0, "max": 2.0, "num": 2}
+        self.loaded_json["write_data_to_csv"] = False
+        config = RIDTConfig(self.loaded_json)
+        space = ComputationalSpace(config, {"models": "eddy_diffusion"})
+
+        expected = BatchDataStore()
+        for idx, setting in enumerate(space.space):
+            expected.add_run(setting)
+            expected[setting] = self.store(idx)
+        BatchDataStoreWriter(config, expected, space, self.dir.name,
+                             "concentration")
+
+        for lazy in [False, True]:
+            store = DataStoreReader(config, self.dir.name, "concentration",
+                                    lazy=lazy)
+            self.assertEqual(len(list(store.keys())), 2)
+            for setting in space.space:
+                self.assertStoresEqual(expected[setting], store[setting])
+
+    def test_read_archive(self):
+
+        """Ensures a data store written to an archive is read back, eagerly and
+        lazily, without creating any directories."""
+
+        expected = self.store()
+        with DataStoreArchive(self.dir.name, "w") as archive:
+            for quantity in ["concentration", "exposure"]:
+                DataStoreWriter(self.config, expected,
+                                DirectoryAgent(self.dir.name, (1,)), quantity,
+                                archive)
+        self.assertEqual(os.listdir(self.dir.name), [DataStoreArchive.name])
+
+        with DataStoreArchive(self.dir.name) as archive:
+            self.assertEqual(archive.load_config(""), self.config.__source__)
+
+        for lazy in [False, True]:
+            store = DataStoreReader(self.config, self.dir.name, "exposure",
+                                    lazy=lazy)
+            self.assertStoresEqual(expected, store)
+        self.assertEqual(os.listdir(self.dir.name), [DataStoreArchive.name])
+
+        store = DataStoreReader(self.config, self.dir.name, "concentration",
+                                lazy=True)
+        os.remove(os.path.join(self.dir.name, DataStoreArchive.name))
+        with self.assertRaises(DataStoreParsingError):
+            store.get("points", self.point_name)
+
+    def test_read_batch_archive(self):
+
+        """Ensures every element of a computational space is read back from
+        an archive."""
+
+        source = self.loaded_json["modes"]["instantaneous"]["sources"]["source_1"]
+        source["mass"] = {"min": 1.0, "max": 2.0, "num": 2}
+        self.loaded_json["write_data_to_csv"] = False
+        config = RIDTConfig(self.loaded_json)
+        space = ComputationalSpace(config, {"models": "eddy_diffusion"})
+
+        expected = BatchDataStore()
+        for idx, setting in enumerate(space.space):
+            expected.add_run(setting)
+            expected[setting] = self.store(idx)
+        with DataStoreArchive(self.dir.name, "w") as archive:
+            BatchDataStoreWriter(config, expected, space, self.dir.name,
+                                 "concentration", archive)
+            dir_agent = DirectoryAgent(self.dir.name, space.shape)
+            dir_agent.select_root_dir(1)
+            self.assertIn(f"{dir_agent.run}/config.json", archive.names())
+            self.assertEqual(len(archive.names()), len(set(archive.names())))
+            self.assertIn("config.json", archive.names())
+        self.assertEqual(sorted(os.listdir(self.dir.name)),
+                         ["batch_config.json", DataStoreArchive.name])
+
+        for lazy in [False, True]:
+            store = DataStoreReader(config, self.dir.name, "concentration",
+                                    lazy=lazy)
+            for setting in space.space:
+                self.assertStoresEqual(expected[setting], store[setting])
+
+
+if __name__ == "__main__":
+    unittest.main()
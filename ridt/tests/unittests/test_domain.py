@@ -50,3 +50,34 @@ class TestDomain(unittest.TestCase):
         for plane in planes.values():
             for array in self.domain.planes(plane):
                 self.assertEqual(type(array), np.ndarray)
+
+    def test_value_grids(self):
+
+        """Tests to make sure that the broadcast values match the
+        values at every index."""
+
+        self.config.spatial_samples.x = 5
+        self.config.spatial_samples.y = 4
+        self.config.spatial_samples.z = 3
+        self.domain = Domain(self.config)
+
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        line = locations.lines["line_1"]
+        plane = locations.planes["plane_1"]
+        t, x, y, z = [len(a) for a in (self.domain.time, self.domain.x,
+                                       self.domain.y, self.domain.z)]
+        for line.parallel_axis, plane.axis in zip("xyz", ["xy", "yz", "xz"]):
+            size = {"x": x, "y": y, "z": z}
+            shapes = {
+                "well_mixed": (t, ),
+                "point_1": (t, ),
+                "line_1": (t, size[line.parallel_axis]),
+                "plane_1": (t, *[size[a] for a in plane.axis]),
+                "domain": (t, x, y, z)
+            }
+            for id, shape in shapes.items():
+                grids = self.domain.value_grids(id, len(shape))
+                for index in np.ndindex(*shape):
+                    expected = self.domain.values(id, index)
+                    values = [np.broadcast_to(g, shape)[index] for g in grids]
+                    self.assertEqual(values, list(expected))
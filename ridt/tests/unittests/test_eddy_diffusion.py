@@ -1,9 +1,16 @@
 import unittest
 import json
 import os
+import warnings
+
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
 
 import numpy as np
 
+from scipy.integrate import quad
+
 from ridt.config import RIDTConfig
 from ridt.equation import EddyDiffusion
 
@@ -36,6 +43,211 @@ class TestEddyDiffusion(unittest.TestCase):
         concentration = self.ed(X, Y, Z, self.time_array)
         self.assertEqual(type(concentration), np.ndarray)
 
+    def test_sparse_grids(self):
+
+        """Ensures sparse and full meshgrids give the same concentration"""
+        grids = (self.x_space, self.y_space, self.z_space)
+        full = np.meshgrid(*grids, indexing="ij")
+        sparse = np.meshgrid(*grids, indexing="ij", sparse=True)
+
+        expected = self.ed(*full, self.time_array)
+        concentration = self.ed(*sparse, self.time_array)
+        self.assertEqual(concentration.shape, expected.shape)
+        np.testing.assert_array_equal(concentration, expected)
+
+    def test_series(self):
+
+        """Ensures the batched time series matches evaluation at each time"""
+        grids = np.meshgrid(self.x_space, self.y_space, self.z_space,
+                            indexing="ij", sparse=True)
+        self.ed(*grids, self.time_array)
+        source = self.config.modes.instantaneous.sources["source_1"]
+
+        series = self.ed.series(source, self.time_array - 1.0)
+        for idt, time in enumerate(self.time_array - 1.0):
+            if time > 0:
+                expected = self.ed.pointwise(source, time)
+                self.assertTrue(np.allclose(series[idt], expected, rtol=1e-12))
+            else:
+                self.assertFalse(series[idt].any())
+
+    def test_analytic(self):
+
+        """Ensures the analytic time integral agrees with adaptive quadrature"""
+        self.config.integration_method = "analytic"
+        self.config.modes.instantaneous.sources = {}
+        self.config.modes.fixed_duration.sources = {}
+        ed = EddyDiffusion(self.config)
+
+        x = np.array([1.0, 7.5]).reshape(2, 1, 1)
+        y = np.array([2.0, 5.0]).reshape(1, 2, 1)
+        z = np.array([0.5, 2.0]).reshape(1, 1, 2)
+        concentration = ed(x, y, z, self.time_array)
+
+        source = self.config.modes.infinite_duration.sources["source_1"]
+        self.assertFalse(concentration[0].any())
+        for idt, time in enumerate(self.time_array[1:], 1):
+            for idx, idy, idz in np.ndindex(2, 2, 2):
+                integrand = lambda t: source.rate *\
+                    ed.conc(source, x[idx, 0, 0], y[0, idy, 0], z[0, 0, idz], t)
+                expected = quad(integrand, 0, time - source.time,
+                                epsabs=0, epsrel=1e-12, limit=200)[0]
+                self.assertAlmostEqual(
+                    concentration[idt, idx, idy, idz], expected,
+                    delta=1e-8 * expected + 1e-30)
+
+    def test_analytic_source(self):
+
+        """Ensures the analytic integral is finite on top of a source"""
+        self.config.modes.instantaneous.sources = {}
+        self.config.modes.fixed_duration.sources = {}
+        source = self.config.modes.infinite_duration.sources["source_1"]
+        x = np.array([source.x, 7.5]).reshape(2, 1, 1)
+        y = np.array([source.y]).reshape(1, 1, 1)
+        z = np.array([source.z]).reshape(1, 1, 1)
+
+        expected = EddyDiffusion(self.config)(x, y, z, self.time_array)
+        self.config.integration_method = "analytic"
+        concentration = EddyDiffusion(self.config)(x, y, z, self.time_array)
+        self.assertTrue(np.isfinite(concentration).all())
+        np.testing.assert_allclose(concentration[:, 0], expected[:, 0], rtol=1e-12)
+
+    def test_image_count(self):
+
+        """Ensures the tabulated image counts match a full sum of images"""
+        bound = self.config.dimensions.x
+        times = np.logspace(-2, 5, 50).reshape(50, 1, 1, 1)
+        pos = np.linspace(0, bound, 20).reshape(20, 1, 1)
+
+        counts = self.ed.image_count(times, bound)
+        self.assertEqual(counts.min(), 1)
+        self.assertTrue(np.all(np.diff(counts.ravel()) >= 0))
+
+        self.config.models.eddy_diffusion.images.mode = "manual"
+        self.config.models.eddy_diffusion.images.quantity = 20
+        full = EddyDiffusion(self.config)
+        for source in [0.0, 0.3 * bound, bound]:
+            expected = full.exp(pos, times, bound, source)
+            values = self.ed.exp(pos, times, bound, source)
+            self.assertTrue(np.allclose(values, expected, rtol=1e-9, atol=0))
+
+    def test_exp_chunks(self):
+
+        """Ensures the image sum is unchanged when split over time"""
+        bound = self.config.dimensions.x
+        pos = np.linspace(0, bound, 7).reshape(1, -1)
+        times = np.linspace(0.1, 1000, 50).reshape(-1, 1)
+        expected = self.ed.exp(pos, times, bound, 0.3 * bound)
+        with patch("ridt.equation.eddy_diffusion.CHUNK_SIZE", 100):
+            values = self.ed.exp(pos, times, bound, 0.3 * bound)
+        np.testing.assert_array_equal(values, expected)
+
+    def test_threads(self):
+
+        """Ensures threaded source evaluation gives the same concentration"""
+        grids = np.meshgrid(self.x_space, self.y_space, self.z_space,
+                            indexing="ij", sparse=True)
+        expected = self.ed(*grids, self.time_array)
+        threaded = EddyDiffusion(self.config, threads=4)
+        concentration = threaded(*grids, self.time_array)
+        np.testing.assert_array_equal(concentration, expected)
+
+    def test_thread_logging(self):
+
+        """Ensures sources are logged in order, and serial calls ignore
+        warnings"""
+        grids = np.meshgrid(self.x_space, self.y_space, self.z_space,
+                            indexing="ij", sparse=True)
+        output = StringIO()
+        with redirect_stdout(output):
+            EddyDiffusion(self.config, threads=4)(*grids, self.time_array)
+        self.assertEqual(output.getvalue().splitlines(), [
+            f"Evaluating {name} source (id: source_1) for each time..."
+            for name in ["instanteneous", "infinite duration", "fixed duration"]
+        ])
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with redirect_stdout(StringIO()):
+                self.ed(*grids, self.time_array)
+        self.assertEqual(caught, [])
+
+    def test_tiles(self):
+
+        """Ensures tiled evaluation into a preallocated output is unchanged"""
+        grids = np.meshgrid(self.x_space, self.y_space, self.z_space,
+                            indexing="ij", sparse=True)
+        expected = self.ed(*grids, self.time_array)
+
+        tiled = EddyDiffusion(self.config, tile_size=3)
+        out = np.full(expected.shape, np.nan)
+        concentration = tiled(*grids, self.time_array, out=out)
+        self.assertIs(concentration, out)
+        np.testing.assert_array_equal(concentration, expected)
+
+        other = tiled(*grids, self.time_array[:5])
+        self.assertIsNot(other, concentration)
+        np.testing.assert_array_equal(concentration, expected)
+
+        for axes in [(self.x_space[2:3], self.y_space, self.z_space[:4]),
+                     (self.x_space[:4], self.y_space[:7], self.z_space[2:3]),
+                     (self.x_space[2:3], self.y_space[2:3], self.z_space)]:
+            grids = np.meshgrid(*axes, indexing="ij", sparse=True)
+            expected = self.ed(*grids, self.time_array)
+            concentration = tiled(*grids, self.time_array)
+            np.testing.assert_array_equal(concentration, expected)
+
+    def test_kernels(self):
+
+        """Ensures shifted kernels match direct evaluation of each release"""
+        grids = np.meshgrid(self.x_space, self.y_space, self.z_space,
+                            indexing="ij", sparse=True)
+        step = float(self.time_array[1])
+        modes = self.config.modes
+        first = modes.instantaneous.sources["source_1"]
+        modes.instantaneous.sources["source_2"] = type(first)(
+            {**first.__source__, "time": 3 * step})
+        modes.infinite_duration.sources["source_1"].time = step
+        modes.fixed_duration.sources["source_1"].start_time = 2 * step
+        modes.fixed_duration.sources["source_1"].end_time = 4 * step
+
+        concentration = self.ed(*grids, self.time_array).copy()
+        self.assertEqual(self.ed.kernels, {})
+
+        self.ed.step = None
+        expected = sum(
+            getattr(self.ed, mode)(id, source)
+            for mode in self.ed.modes
+            for id, source in getattr(modes, mode).sources.items()
+        )
+        atol = 1e-12 * np.nanmax(np.abs(expected))
+        self.assertTrue(np.allclose(concentration, expected, rtol=1e-12,
+                                    atol=atol, equal_nan=True))
+
+    def test_superpose(self):
+
+        """Ensures superposed unit sources match each set of strengths"""
+        grids = np.meshgrid(self.x_space, self.y_space, self.z_space,
+                            indexing="ij", sparse=True)
+        strengths = self.ed.get_strengths(self.config)
+        sets = [strengths, [2.0 * s for s in strengths], [0.5, 0.0, 3.0]]
+        superposed = EddyDiffusion(self.config, tile_size=3).superpose(
+            *grids, self.time_array, sets)
+
+        sources = [
+            self.config.modes.instantaneous.sources["source_1"],
+            self.config.modes.infinite_duration.sources["source_1"],
+            self.config.modes.fixed_duration.sources["source_1"]
+        ]
+        for values, concentration in zip(sets, superposed):
+            sources[0].mass = values[0]
+            sources[1].rate = values[1]
+            sources[2].rate = values[2]
+            expected = EddyDiffusion(self.config)(*grids, self.time_array)
+            atol = 1e-12 * np.nanmax(np.abs(expected))
+            self.assertTrue(np.allclose(concentration, expected, rtol=1e-12,
+                                        atol=atol, equal_nan=True))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import json
+import os
+
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from scipy.integrate import cumtrapz
+
+from ridt.analysis import Exposure
+
+from ridt.config import RIDTConfig
+
+from ridt.data import DataStore
+from ridt.data import MemmapDataStore
+
+
+class TestExposure(unittest.TestCase):
+
+    """Unit tests for the :class:`~.Exposure` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which creates a data store with a grid for every
+        monitor location type."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        self.config = RIDTConfig(loaded_json)
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        for geometry in locations.evaluate:
+            locations.evaluate[geometry] = True
+        self.delta_t = self.config.total_time / self.config.time_samples
+
+        rng = np.random.RandomState(0)
+        self.grids = {
+            ("points", "point_1"): rng.random_sample(7),
+            ("lines", "line_1"): rng.random_sample((7, 5)),
+            ("planes", "plane_1"): rng.random_sample((7, 5, 4)),
+            ("domain", "domain"): rng.random_sample((7, 5, 4, 3)),
+        }
+
+    def test_exposure(self):
+
+        """Tests that the exposures match the cumulative trapezoidal rule."""
+
+        ds = DataStore()
+        for (geometry, id), data in self.grids.items():
+            ds.add(geometry, id, data)
+        exposure = Exposure(self.config, ds)
+
+        for (geometry, id), data in self.grids.items():
+            expected = cumtrapz(data, dx=self.delta_t, axis=0, initial=0)
+            self.assertTrue(np.array_equal(exposure.get(geometry, id), expected))
+
+    def test_memmap_exposure(self):
+
+        """Tests that exposures of a memory mapped store are written straight
+        to memory mapped files."""
+
+        with TemporaryDirectory() as outdir:
+            ds = MemmapDataStore(outdir, "concentration")
+            for (geometry, id), data in self.grids.items():
+                ds.allocate(geometry, id, data.shape)[:] = data
+            exposure = Exposure(self.config, ds)
+            self.assertIsInstance(exposure, MemmapDataStore)
+
+            for (geometry, id), data in self.grids.items():
+                values = exposure.get(geometry, id)
+                path = exposure.path(geometry, id)
+                self.assertTrue(MemmapDataStore.backed_by(values, path))
+                expected = cumtrapz(data, dx=self.delta_t, axis=0, initial=0)
+                self.assertTrue(np.array_equal(values, expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+
+from tempfile import TemporaryDirectory
+
+import matplotlib.pyplot as plt
+
+from PIL import Image
+from PIL import ImageSequence
+
+from ridt.plot import FrameWriter
+
+
+class TestFrameWriter(unittest.TestCase):
+
+    """Unit tests for the :class:`~.FrameWriter` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which creates a figure and an output directory."""
+
+        self.dir = TemporaryDirectory()
+        self.figure = plt.figure(figsize=(2, 1), dpi=50)
+        self.line, = plt.plot([0, 1], [0, 1])
+
+    def tearDown(self) -> None:
+
+        """tearDown method which closes the figure and removes the output
+        directory."""
+
+        plt.close(self.figure)
+        self.dir.cleanup()
+
+    def write(self, format: str):
+        writer = FrameWriter(self.dir.name, format)
+        for id, count in [("line_1", 3), ("line_2", 2)]:
+            for i in range(count):
+                self.line.set_ydata([i, 0])
+                writer.add(id, self.figure)
+        writer.close()
+        self.assertIsNone(writer.frames)
+        return sorted(os.listdir(self.dir.name))
+
+    def test_gif(self):
+
+        """Ensures one animated GIF is written per id, with a frame per
+        call."""
+
+        self.assertEqual(self.write("gif"), ["line_1.gif", "line_2.gif"])
+        for id, count in [("line_1", 3), ("line_2", 2)]:
+            with Image.open(os.path.join(self.dir.name, f"{id}.gif")) as gif:
+                frames = list(ImageSequence.Iterator(gif))
+                self.assertEqual(len(frames), count)
+                self.assertEqual(gif.size, (100, 50))
+
+    def test_pdf(self):
+
+        """Ensures one multi-page PDF is written per id, with a page per
+        call."""
+
+        self.assertEqual(self.write("pdf"), ["line_1.pdf", "line_2.pdf"])
+        with open(os.path.join(self.dir.name, "line_1.pdf"), "rb") as f:
+            self.assertIn(b"/Count 3", f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
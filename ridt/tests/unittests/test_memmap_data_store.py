@@ -0,0 +1,96 @@
+import unittest
+import json
+import os
+
+from copy import deepcopy
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.data import DataStore
+from ridt.data import DataStoreWriter
+from ridt.data import DirectoryAgent
+from ridt.data import MemmapDataStore
+
+from ridt.data.datastore import DataStoreGeometryError
+
+from ridt.config import RIDTConfig
+
+
+class TestMemmapDataStore(unittest.TestCase):
+
+    """Unit tests for the :class:`~.MemmapDataStore` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which instantiates the :class:`~.MemmapDataStore`
+        class in a temporary directory."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        self.config = RIDTConfig(loaded_json)
+        self.tmp = TemporaryDirectory()
+        self.out_dir = self.tmp.name
+        self.ds = MemmapDataStore(self.out_dir, "concentration")
+        self.line_data = np.array([np.linspace(0, 10, 10)] * 2)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_allocate(self):
+
+        """Checks that grids are allocated as maps in the data directory"""
+        data = self.ds.allocate("lines", "line", (2, 10))
+        data[:] = self.line_data
+        data.flush()
+
+        path = join(self.out_dir, "lines", "concentration", "data", "line.npy")
+        self.assertIsInstance(data, np.memmap)
+        self.assertEqual(data.filename, path)
+        self.assertTrue(np.array_equal(np.load(path), self.line_data))
+
+    def test_add(self):
+
+        """Checks that in memory grids are copied into a map"""
+        self.ds.add("lines", "line", self.line_data)
+        data = self.ds.get("lines", "line")
+        self.assertIsInstance(data, np.memmap)
+        self.assertTrue(np.array_equal(data, self.line_data))
+        with self.assertRaises(DataStoreGeometryError):
+            self.ds.add("bananas", "line", self.line_data)
+
+    def test_like(self):
+
+        """Checks that derived stores share the output directory"""
+        store = self.ds.like("exposure")
+        store.add("lines", "line", self.line_data)
+        path = join(self.out_dir, "lines", "exposure", "data", "line.npy")
+        self.assertEqual(store.get("lines", "line").filename, path)
+
+    def test_deepcopy(self):
+
+        """Checks that copies are held in memory"""
+        self.ds.add("lines", "line", self.line_data)
+        store = deepcopy(self.ds)
+        self.assertIs(type(store), DataStore)
+        store.get("lines", "line").fill(np.nan)
+        self.assertTrue(np.array_equal(self.ds.get("lines", "line"), self.line_data))
+
+    def test_write(self):
+
+        """Checks the writer does not overwrite a map with itself"""
+        self.ds.allocate("lines", "line", (2, 10))[:] = self.line_data
+        self.ds.allocate("points", "point", (10,))[:] = self.line_data[0]
+
+        DataStoreWriter(
+            self.config, self.ds, DirectoryAgent(self.out_dir, ()), "concentration")
+
+        path = join(self.out_dir, "lines", "concentration", "data", "line.npy")
+        self.assertTrue(np.array_equal(np.load(path), self.line_data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import json
+import os
+
+from copy import deepcopy
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from ridt.config import RIDTConfig
+from ridt.data import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+
+    """Unit tests for the :class:`~.ResultCache` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which loads the settings and creates a cache."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "test_resources/test_config.json")) as f:
+            self.source = json.load(f)
+
+        self.dir = TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.dir.name, "cache"))
+
+    def tearDown(self) -> None:
+
+        """tearDown method which removes the cache directory."""
+
+        self.dir.cleanup()
+
+    def key(self, change=None) -> str:
+        source = deepcopy(self.source)
+        if change:
+            change(source)
+        return self.cache.key(RIDTConfig(source), "points", "point_1")
+
+    def test_key(self):
+
+        """Ensures only the settings that affect the solver change the key."""
+
+        key = self.key()
+        model = lambda s: s["models"]["eddy_diffusion"]
+
+        def output(s):
+            s["thresholds"]["concentration"] = [0.5]
+            s["write_data_to_csv"] = not s["write_data_to_csv"]
+            model(s)["points_plots"]["output"] = not model(s)["points_plots"]["output"]
+            model(s)["analysis"]["perform_analysis"] = False
+
+        self.assertEqual(self.key(output), key)
+
+        physics = [
+            lambda s: s.update(time_samples=s["time_samples"] + 1),
+            lambda s: s["modes"]["instantaneous"]["sources"]["source_1"].update(mass=2.0),
+            lambda s: model(s)["images"].update(quantity=model(s)["images"]["quantity"] + 1),
+            lambda s: model(s)["monitor_locations"]["points"]["point_1"].update(x=1.0),
+        ]
+        keys = {self.key(change) for change in physics}
+        self.assertEqual(len(keys), len(physics))
+        self.assertNotIn(key, keys)
+        self.assertNotEqual(
+            self.cache.key(RIDTConfig(self.source), "lines", "line_1"), key)
+
+    def test_round_trip(self):
+
+        """Ensures grids are only loaded if present with the right shape."""
+
+        data = np.arange(24, dtype=float).reshape(2, 3, 4)
+        out = np.zeros(data.shape)
+        self.assertFalse(self.cache.load("a", out))
+
+        self.cache.save("a", data)
+        self.assertEqual(os.listdir(self.cache.directory), ["a.npy"])
+        self.assertTrue(self.cache.load("a", out))
+        self.assertTrue(np.array_equal(out, data))
+        self.assertFalse(self.cache.load("a", np.zeros((2, 12))))
+
+
+if __name__ == "__main__":
+    unittest.main()
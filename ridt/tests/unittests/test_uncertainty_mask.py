@@ -0,0 +1,103 @@
+import unittest
+import json
+import os
+
+import numpy as np
+
+from ridt.config import RIDTConfig
+
+from ridt.container import Domain
+
+from ridt.data import UncertaintyMask
+
+
+class TestUncertaintyMask(unittest.TestCase):
+
+    """Unit tests for the :class:`~.UncertaintyMask` class."""
+
+    def setUp(self) -> None:
+
+        """setUp method which instantiates the :class:`~.UncertaintyMask`
+        class with a source on a grid point."""
+
+        this_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(this_dir, "../../default/config.json")) as f:
+            loaded_json = json.load(f)
+
+        self.config = RIDTConfig(loaded_json)
+        self.config.spatial_samples.x = 11
+        self.config.spatial_samples.y = 6
+        self.config.spatial_samples.z = 5
+        self.config.models.eddy_diffusion.analysis.exclude_radius_meters = 2.0
+        domain = Domain(self.config)
+        source = self.config.modes.instantaneous.sources["source_1"]
+        source.x, source.y, source.z = domain.x[3], domain.y[2], domain.z[1]
+
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        locations.points["point_1"].x = domain.x[3]
+        locations.points["point_1"].y = domain.y[2]
+        locations.points["point_1"].z = domain.z[2]
+        locations.lines["line_1"].point.y = domain.y[2]
+        locations.lines["line_1"].point.z = domain.z[1]
+        locations.planes["plane_1"].distance = domain.z[1]
+
+        self.domain = domain
+        self.um = UncertaintyMask(self.config)
+
+    def expected(self, geometry: str, data: np.ndarray, locations: list):
+
+        """Masks each location near a source one element at a time."""
+
+        rv = data.copy()
+        for idx, location in locations:
+            for s in self.um.sources:
+                if np.linalg.norm(s - np.array(location)) <= self.um.radius:
+                    for idt in range(rv.shape[0]):
+                        rv[(idt, *idx)] = np.nan
+        return rv
+
+    def test_mask(self):
+
+        """Tests that the masked grids match an element by element mask."""
+
+        locations = self.config.models.eddy_diffusion.monitor_locations
+        t = self.domain.time.size
+        shape = (self.domain.x.size, self.domain.y.size, self.domain.z.size)
+        grids = {
+            ("points", "point_1"): (
+                np.ones(t),
+                [((), self.domain.point_cartesian(locations.points["point_1"]))]),
+            ("lines", "line_1"): (
+                np.ones((t, shape[0])),
+                self.domain.line_cartesian(locations.lines["line_1"])),
+            ("planes", "plane_1"): (
+                np.ones((t, *shape[:2])),
+                self.domain.plane_cartesian(locations.planes["plane_1"])),
+            ("domain", "domain"): (
+                np.ones((t, *shape)),
+                self.domain.domain_cartesian()),
+        }
+        for (geometry, id), (data, cartesian) in grids.items():
+            expected = self.expected(geometry, data, cartesian)
+            masked = self.um.mask(geometry, id, data)
+            self.assertIs(masked, data)
+            self.assertTrue(np.isnan(masked).any())
+            np.testing.assert_array_equal(masked, expected)
+
+    def test_region_cache(self):
+
+        """Tests that the region is reused by grids of the same location."""
+
+        shape = (self.domain.time.size, self.domain.x.size,
+                 self.domain.y.size, self.domain.z.size)
+        self.um.mask("domain", "domain", np.ones(shape))
+        region = self.um.regions[("domain", "domain")]
+        self.assertFalse(region.flags.writeable)
+        self.assertIs(self.um.exclusion("domain", "domain"), region)
+
+        other = UncertaintyMask(self.config)
+        self.assertEqual(other.regions, dict())
+        self.assertTrue(np.array_equal(other.exclusion("domain", "domain"), region))
+
+if __name__ == "__main__":
+    unittest.main()
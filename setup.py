@@ -24,6 +24,7 @@ setup(
         "numpy==1.19.3 ; python_version>='3.8'",
         'scipy',
         'matplotlib',
+        'pillow',
         'tqdm'
     ],
     entry_points='''